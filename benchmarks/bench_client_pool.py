@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the per-request latency of fresh connections and of the pooled client sessions.
+
+Run with `python -m benchmarks.bench_client_pool`.
+"""
+
+import time
+
+import requests
+
+from benchmarks.stand_in_server import StandInServer
+from braincube_connector import client
+
+N_REQUESTS = 500
+
+
+def _mean_latency(func) -> float:
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        func()
+    return (time.perf_counter() - start) / N_REQUESTS * 1000
+
+
+def main():
+    """Print the mean latency of both request strategies."""
+    server = StandInServer()
+    cli = client.get_instance(config_dict=server.get_config())
+    url = "{0}/braincube/demo/braincube/mb/all/summary".format(server.get_url())
+    fresh = _mean_latency(lambda: requests.get(url, headers=cli._headers))
+    pooled = _mean_latency(lambda: cli.request_ws("braincube/demo/braincube/mb/all/summary"))
+    print("fresh connection: {0:.3f} ms/request".format(fresh))
+    print("pooled session:   {0:.3f} ms/request".format(pooled))
+    cli.close()
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
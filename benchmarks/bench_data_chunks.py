@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""Compare a single braindata request with column-chunked requests on a wide dataset.
+
+Run with `python -m benchmarks.bench_data_chunks`.
+"""
+
+import json
+import time
+
+from benchmarks.stand_in_server import StandInServer, default_route
+from braincube_connector import client, parameters
+from braincube_connector.memory_base import memory_base
+
+N_VARIABLES = 400
+N_ROWS = 2000
+COLUMN_LATENCY = 0.002
+
+
+def route(path, body):
+    """Serve braindata with a production time proportional to the number of columns.
+
+    Args:
+        path: Requested path.
+        body: Body of the request.
+
+    Returns:
+        The status and the json of the response.
+    """
+    if path.endswith("/simple"):
+        return 200, {"order": "mb1/d0"}
+    if not path.endswith("/LF"):
+        return default_route(path, body)
+    definitions = json.loads(body)["definitions"]
+    time.sleep(COLUMN_LATENCY * len(definitions))
+    column = [str(row) for row in range(N_ROWS)]
+    return 200, {
+        "datadefs": [{"id": var_id, "type": "NUMERIC", "data": column} for var_id in definitions]
+    }
+
+
+def main():
+    """Print the time taken by get_data for several chunk sizes."""
+    server = StandInServer(route)
+    client.get_instance(config_dict=server.get_config())
+    mb = memory_base.MemoryBase("1", "mb1", {}, "braincube/demo/{webservice}/mb/1")
+    for chunk_size in (0, 200, 100, 50):
+        parameters.set_parameter({"data_chunk_size": chunk_size, "data_workers": 8})
+        start = time.perf_counter()
+        n_columns = len(mb.get_data(list(range(1, N_VARIABLES + 1))))
+        print(
+            "data_chunk_size={0:3d}: {1} columns in {2:.3f} s".format(
+                chunk_size, n_columns, time.perf_counter() - start
+            )
+        )
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the DataFrames built from dictionaries of lists and from typed column arrays.
+
+Run with `python -m benchmarks.bench_dataframe_builder`.
+"""
+
+import timeit
+import tracemalloc
+
+import pandas as pd
+
+from braincube_connector import parameters
+from braincube_connector.data import data, datasets
+
+N_ROWS = 1000000
+N_NUMERIC = 8
+N_REPEATS = 3
+
+
+def build_response():
+    """Build a braindata response with NUMERIC, DATETIME and DISCRETE columns.
+
+    Returns:
+        The json response of a LF request.
+    """
+    datadefs = [
+        {
+            "id": "mb1/d{0}".format(col_index),
+            "type": "NUMERIC",
+            "data": [str(row + col_index / 2) for row in range(N_ROWS)],
+        }
+        for col_index in range(N_NUMERIC)
+    ]
+    datadefs.append(
+        {
+            "id": "mb1/d{0}".format(N_NUMERIC),
+            "type": "DATETIME",
+            "data": ["20200101_{0:06d}".format(row % 235959) for row in range(N_ROWS)],
+        }
+    )
+    return {"datadefs": datadefs}
+
+
+def build_from_lists(raw_dataset):
+    """Build a DataFrame as the connector did before the builder.
+
+    Args:
+        raw_dataset: The json response of a LF request.
+
+    Returns:
+        The DataFrame.
+    """
+    return pd.DataFrame(data._extract_format_data(raw_dataset))  # noqa: WPS437
+
+
+def build_from_arrays(raw_dataset):
+    """Build a DataFrame from typed column arrays, without copying them.
+
+    Args:
+        raw_dataset: The json response of a LF request.
+
+    Returns:
+        The DataFrame.
+    """
+    formatted_dataset = data._extract_format_data(raw_dataset, arrays=True)  # noqa: WPS437
+    return datasets.to_dataframe(formatted_dataset)
+
+
+def measure(builder, raw_dataset):
+    """Measure the best time and the peak memory of a DataFrame builder.
+
+    Args:
+        builder: Function building the DataFrame.
+        raw_dataset: The json response of a LF request.
+
+    Returns:
+        The best time in seconds and the peak memory in MB.
+    """
+    duration = min(timeit.repeat(lambda: builder(raw_dataset), number=1, repeat=N_REPEATS))
+    tracemalloc.start()
+    builder(raw_dataset)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak / 1e6
+
+
+def main():
+    """Print the time and the memory used to build a DataFrame from a braindata response."""
+    parameters.set_parameter({"parse_date": "fast"})
+    raw_dataset = build_response()
+    builders = {"dict of lists": build_from_lists, "typed arrays": build_from_arrays}
+    for builder_name, builder in builders.items():
+        duration, peak = measure(builder, raw_dataset)
+        print("{0:>13}: {1:.3f} s, peak {2:.0f} MB".format(builder_name, duration, peak))
+
+
+if __name__ == "__main__":
+    main()
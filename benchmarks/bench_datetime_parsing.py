@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the parsing of DATETIME columns to datetime objects and to datetime64 arrays.
+
+Run with `python -m benchmarks.bench_datetime_parsing`.
+"""
+
+import timeit
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from braincube_connector.data import data, parsing
+
+N_ROWS = 1000000
+N_REPEATS = 3
+
+
+def parse_with_pandas(col_data):
+    """Parse a column with the format of the DATETIME columns and no conversion.
+
+    Args:
+        col_data: The column data to parse.
+
+    Returns:
+        A datetime64[ns, UTC] array.
+    """
+    return pd.to_datetime(
+        col_data, errors="coerce", format="%Y%m%d_%H%M%S", utc=True  # noqa: WPS323
+    ).array
+
+
+def measure(parser, col_data):
+    """Measure the best time and the peak memory of a parser building a DataFrame column.
+
+    Args:
+        parser: Function parsing the column.
+        col_data: The column data to parse.
+
+    Returns:
+        The best time in seconds and the peak memory in MB.
+    """
+    duration = min(
+        timeit.repeat(lambda: pd.DataFrame({1: parser(col_data)}), number=1, repeat=N_REPEATS)
+    )
+    tracemalloc.start()
+    pd.DataFrame({1: parser(col_data)})
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak / 1e6
+
+
+def main():
+    """Print the time and the memory used to parse a column of dates."""
+    timestamps = pd.Timestamp("2020-01-01") + pd.to_timedelta(np.arange(N_ROWS) * 97, unit="s")
+    col_data = timestamps.strftime("%Y%m%d_%H%M%S").tolist()  # noqa: WPS323
+    parsers = {
+        "datetime objects": data._to_datetime,  # noqa: WPS437
+        "pandas format": parse_with_pandas,
+        "digit matrix": parsing.parse_datetime_array,
+    }
+    for parser_name, parser in parsers.items():
+        duration, peak = measure(parser, col_data)
+        print("{0:>16}: {1:.3f} s, peak {2:.0f} MB".format(parser_name, duration, peak))
+
+
+if __name__ == "__main__":
+    main()
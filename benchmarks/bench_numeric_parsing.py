@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the parsing of NUMERIC columns with Python builtins and with numpy.
+
+Run with `python -m benchmarks.bench_numeric_parsing`.
+"""
+
+import timeit
+import tracemalloc
+
+import pandas as pd
+
+from braincube_connector.data import data, parsing
+
+N_ROWS = 1000000
+N_REPEATS = 5
+
+
+def parse_with_builtins(col_data):
+    """Parse a column as the connector did before the numpy parser.
+
+    Args:
+        col_data: The column data to parse.
+
+    Returns:
+        A list of int, or of float if a value is not an integer.
+    """
+    try:
+        return list(map(int, col_data))
+    except ValueError:
+        return list(map(float, col_data))
+
+
+def measure(parser, col_data):
+    """Measure the best time and the peak memory of a parser building a DataFrame column.
+
+    Args:
+        parser: Function parsing the column.
+        col_data: The column data to parse.
+
+    Returns:
+        The best time in seconds and the peak memory in MB.
+    """
+    duration = min(
+        timeit.repeat(lambda: pd.DataFrame({1: parser(col_data)}), number=1, repeat=N_REPEATS)
+    )
+    tracemalloc.start()
+    pd.DataFrame({1: parser(col_data)})
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak / 1e6
+
+
+def main():
+    """Print the time and the memory used to parse integer and float columns."""
+    columns = {
+        "int": [str(row) for row in range(N_ROWS)],
+        "float": [str(row + 0.5) for row in range(N_ROWS)],
+        "int with a late NaN": [str(row) for row in range(N_ROWS - 1)] + ["NaN"],
+    }
+    parsers = {
+        "builtins": parse_with_builtins,
+        "numpy to list": data._parse_numeric_column,  # noqa: WPS437
+        "numpy array": parsing.parse_numeric_array,
+    }
+    for col_name, col_data in columns.items():
+        for parser_name, parser in parsers.items():
+            duration, peak = measure(parser, col_data)
+            print(
+                "{0:>20} | {1:>13}: {2:.3f} s, peak {3:.0f} MB".format(
+                    col_name, parser_name, duration, peak
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
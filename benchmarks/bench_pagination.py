@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""Compare the serial and the concurrent crawl of a 5,000-variable memory base.
+
+Run with `python -m benchmarks.bench_pagination`.
+"""
+
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.stand_in_server import StandInServer, default_route
+from braincube_connector import client, parameters
+from braincube_connector.memory_base import memory_base
+
+N_VARIABLES = 5000
+LATENCY = 0.02
+
+
+def route(path, body):
+    """Serve the variable pages of memory base 1 with a fixed latency.
+
+    Args:
+        path: Requested path.
+        body: Body of the request.
+
+    Returns:
+        The status and the json of the response.
+    """
+    if "/variables/summary" not in path:
+        return default_route(path, body)
+    time.sleep(LATENCY)
+    query = parse_qs(urlsplit(path).query)
+    offset, size = int(query["offset"][0]), int(query["size"][0])
+    items = [
+        {"bcId": bcid, "standard": "var{0}".format(bcid)}
+        for bcid in range(offset, min(offset + size, N_VARIABLES))
+    ]
+    return 200, {"items": items}
+
+
+def main():
+    """Print the crawl time for several numbers of page workers."""
+    server = StandInServer(route)
+    client.get_instance(config_dict=dict(server.get_config(), pool_size=16))
+    mb = memory_base.MemoryBase("1", "mb1", {}, "braincube/demo/{webservice}/mb/1")
+    for page_workers in (1, 2, 4, 8, 16):
+        parameters.set_parameter({"page_workers": page_workers})
+        start = time.perf_counter()
+        n_variables = len(mb.get_variable_list())
+        print(
+            "page_workers={0:2d}: {1} variables in {2:.3f} s".format(
+                page_workers, n_variables, time.perf_counter() - start
+            )
+        )
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""A local stand-in for the braincube SSO and API servers used by the benchmarks."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Route = Callable[[str, bytes], Tuple[int, Any]]
+
+ACCESS_LIST = {"accessList": [{"product": {"name": "demo", "productId": "123"}}]}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answer the requests with the routes of the server, keeping the connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        """Answer a GET request."""
+        self._answer()
+
+    def do_POST(self):  # noqa: N802
+        """Answer a POST request."""
+        self._answer()
+
+    def log_message(self, *args):  # noqa: WPS110
+        """Silence the request logs."""
+
+    def _answer(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        status, payload = self.server.route(self.path, body)  # type: ignore
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """A threaded HTTP server serving json from a route function."""
+
+    daemon_threads = True
+
+    def __init__(self, route: Optional[Route] = None):
+        """Start the server on a free local port.
+
+        Args:
+            route: Function returning the status and the json of a (path, body) request.
+        """
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.route = route or default_route
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def get_url(self) -> str:
+        """Get the base url of the server.
+
+        Returns:
+            The server url.
+        """
+        return "http://127.0.0.1:{port}".format(port=self.server_address[1])
+
+    def get_config(self) -> Dict[str, Any]:
+        """Get a client configuration pointing to the server.
+
+        Returns:
+            A configuration dictionary.
+        """
+        return {
+            "api_key": "abcd",
+            "sso_base_url": self.get_url(),
+            "braincube_base_url": self.get_url(),
+        }
+
+    def stop(self):
+        """Stop the server."""
+        self.shutdown()
+        self.server_close()
+
+
+def default_route(path: str, body: bytes) -> Tuple[int, Any]:
+    """Answer the SSO user request and echo any other request.
+
+    Args:
+        path: Requested path.
+        body: Body of the request.
+
+    Returns:
+        The status and the json of the response.
+    """
+    if path.startswith("/sso-server/ws/user/me"):
+        return 200, ACCESS_LIST
+    return 200, {"path": path}
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+"""This module gives an asyncio interface to the requests of the client."""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from braincube_connector import client, custom_types, parameters, sessions, timeouts
+from braincube_connector.bases import base
+
+
+class AsyncClient(base.Base):
+    """An AsyncClient runs the requests of a Client concurrently from an event loop.
+
+    The requests go through the url building and the authentication of the synchronous client.
+    They are sent from a pool of threads so that the event loop is never blocked, and at most
+    `max_concurrency` of them are in flight at the same time. The threads share connection pools
+    of `max_concurrency` connections to each server, separate from the pools of the synchronous
+    client, so that the `pool_size` of the client does not cap the concurrency. The pools are
+    kept by the client, and closed by `Client.close`.
+    """
+
+    def __init__(
+        self, sync_client: Optional[client.Client] = None, max_concurrency: Optional[int] = None
+    ) -> None:
+        """Initialize AsyncClient.
+
+        Args:
+            sync_client: Client sending the requests. Default: the client instance.
+            max_concurrency: Maximum number of concurrent requests, and size of the connection
+                             pools of the AsyncClient. Default: the `async_max_concurrency`
+                             parameter.
+        """
+        self._client = client.get_instance() if sync_client is None else sync_client
+        self._max_concurrency = max_concurrency or parameters.get_parameter("async_max_concurrency")
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency,
+            thread_name_prefix="braincube_connector",
+            initializer=sessions.use_pool_size,
+            initargs=(self._max_concurrency,),
+        )
+        super().__init__(str(self._client))
+
+    def __str__(self) -> str:
+        """Produce informal representation of the AsyncClient object.
+
+        Returns:
+            An informal representation of the AsyncClient object.
+        """
+        return self._get_str({"client": self._name, "max_concurrency": str(self._max_concurrency)})
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enter the context of the AsyncClient.
+
+        Returns:
+            The AsyncClient.
+        """
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Close the AsyncClient when leaving its context.
+
+        Args:
+            *exc_info: Exception raised within the context, if any.
+        """
+        self.close()
+
+    def close(self):
+        """Stop the threads of the AsyncClient."""
+        self._executor.shutdown(wait=False)
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking function of the connector without blocking the event loop.
+
+        The function sees the deadline of the calling coroutine.
+
+        Args:
+            func: Function to run.
+            *args: Positional arguments of the function.
+            **kwargs: Keyword arguments of the function.
+
+        Returns:
+            The output of the function.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    async def request_ws(self, path: str, **kwargs) -> Dict[str, Any]:
+        """Make a request at a given path on the client's domain.
+
+        Args:
+            path: Path on the domain.
+            **kwargs: Optional arguments of `Client.request_ws`.
+
+        Returns:
+            The request's json output or the full response.
+        """
+        return await self.run(self._client.request_ws, path, **kwargs)
+
+    async def get_memory_base_list(
+        self, braincube: "Braincube", **kwargs  # type: ignore  # noqa
+    ) -> "List[MemoryBase]":  # type: ignore  # noqa
+        """Get a list of the memory bases available in a braincube.
+
+        Args:
+            braincube: Braincube containing the memory bases.
+            **kwargs: Optional page, page_size and deadline.
+
+        Returns:
+            A list of the MemoryBase objects.
+        """
+        return await _get_collection(
+            self.run, braincube.get_memory_base_list, self._max_concurrency, **kwargs
+        )
+
+    async def get_variable_list(
+        self, memory_base: "MemoryBase", **kwargs  # type: ignore  # noqa
+    ) -> "List[VariableDescription]":  # type: ignore  # noqa
+        """Get a list of the variable descriptions of a memory base.
+
+        Args:
+            memory_base: Memory base containing the variables.
+            **kwargs: Optional page, page_size and deadline.
+
+        Returns:
+            A list of Variable descriptions.
+        """
+        return await _get_collection(
+            self.run, memory_base.get_variable_list, self._max_concurrency, **kwargs
+        )
+
+    async def get_data(  # noqa: WPS211
+        self,
+        memory_base: "MemoryBase",  # type: ignore  # noqa
+        var_ids: "List[Union[int,str]]",
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        label_type: "str" = "bcid",
+        dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """Get data from a memory base.
+
+        Args:
+            memory_base: Memory base on which to collect the data.
+            var_ids: bcIds of variables for which the data are collected.
+            filters: List of filters to apply to the request.
+            label_type: "bcid" / "name"
+            dataframe: True, return Dataframe; False, return Dict
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+
+        Returns:
+            A dictionary of data list or a pandas DataFrame.
+        """
+        return await self.run(
+            memory_base.get_data, var_ids, filters, label_type, dataframe, deadline
+        )
+
+    async def get_job_data(
+        self,
+        job: "JobDescription",  # type: ignore  # noqa
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+    ) -> Dict[str, Any]:
+        """Get the filtered data used in a job.
+
+        Args:
+            job: Job description.
+            filters: List of filters to apply to the request.
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+
+        Returns:
+            A dictionary of filtered data list.
+        """
+        return await self.run(job.get_data, filters, deadline)
+
+
+async def _get_collection(
+    run: Callable[..., Awaitable[Any]],
+    getter: Callable[..., List[Any]],
+    max_concurrency: int,
+    page: int = -1,
+    page_size: int = -1,
+    deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+) -> List[Any]:
+    """Get a collection, or one of its pages.
+
+    Args:
+        run: Coroutine function running a blocking function, see `AsyncClient.run`.
+        getter: Synchronous getter of a collection page.
+        max_concurrency: Maximum number of pages requested at the same time.
+        page: Index of page to return, all pages are return if page=-1
+        page_size: Number of entities per page.
+        deadline: Time budget in seconds (or Deadline) shared by all the requests.
+
+    Returns:
+        The list of entities.
+    """
+    if page_size == -1:
+        page_size = parameters.get_parameter("page_size")
+    with timeouts.deadline_scope(deadline):
+        if page > -1:
+            return await run(getter, page=page, page_size=page_size)
+        return await _crawl(run, getter, page_size, max_concurrency)
+
+
+async def _crawl(
+    run: Callable[..., Awaitable[Any]],
+    getter: Callable[..., List[Any]],
+    page_size: int,
+    max_concurrency: int,
+) -> List[Any]:
+    """Get all the pages of a collection, requesting them concurrently.
+
+    The number of pages requested at once doubles after each round, up to `max_concurrency`,
+    until an empty page is met.
+
+    Args:
+        run: Coroutine function running a blocking function, see `AsyncClient.run`.
+        getter: Synchronous getter of a collection page.
+        page_size: Number of entities per page.
+        max_concurrency: Maximum number of pages requested at the same time.
+
+    Returns:
+        The list of entities.
+    """
+    entity_list: List[Any] = []
+    first_page, n_pages = 0, 1
+    while True:
+        pages = await asyncio.gather(
+            *[
+                run(getter, page=page_index, page_size=page_size)
+                for page_index in range(first_page, first_page + n_pages)
+            ]
+        )
+        for page_entities in pages:
+            if not page_entities:
+                return entity_list
+            entity_list += page_entities
+        first_page += n_pages
+        n_pages = min(n_pages * 2, max_concurrency)
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from braincube_connector import client, constants, parameters
+from braincube_connector import client, constants, parallel, parameters, snapshot, timeouts
 from braincube_connector.bases import base
 
 NAME = "name"
@@ -90,8 +92,11 @@ class BaseEntity(base.Base):
         Returns:
             The created entity.
         """
-        json_data = client.request_ws(
-            request_path.format(webservice="braincube"), braincube_name=braincube_name
+        request_path = request_path.format(webservice="braincube")
+        json_data = snapshot.get_or_request(
+            braincube_name,
+            request_path,
+            lambda: client.request_ws(request_path, braincube_name=braincube_name),
         )
         return cls.create_from_json(json_data, entity_path, caller, **kwargs)
 
@@ -104,10 +109,14 @@ class BaseEntity(base.Base):
         page: int = -1,
         page_size: int = -1,
         braincube_name: str = constants.EMPTY_STRING,
+        deadline: Optional[Union[float, timeouts.Deadline]] = None,
         **kwargs,
     ) -> List[Any]:
         """Create many memory_base from a request path.
 
+        When all the pages are requested and the `page_workers` parameter is greater than 1,
+        the pages are requested concurrently.
+
         Args:
             request_path: Webservice path to request.
             entity_path: Path of the entity on the webservice.
@@ -116,6 +125,7 @@ class BaseEntity(base.Base):
             page_size: Number of memory_base per page.
             braincube_name: name of the braincube linked to this entity,
                             useful if you use a placeholder in your config.
+            deadline: Time budget in seconds (or Deadline) shared by all the page requests.
             **kwargs: Additional keyword argument to pass to an object initialization.
 
         Returns:
@@ -124,27 +134,29 @@ class BaseEntity(base.Base):
         if page_size == -1:
             page_size = parameters.get_parameter("page_size")
         offset = 0 if page < 0 else page * page_size
-        entity_list: List[Any] = []
+        page_workers = parameters.get_parameter("page_workers")
 
-        while True:
+        def request_items(page_offset: int) -> List[Dict[str, Any]]:  # noqa: WPS430
             json_data = client.request_ws(
                 "{path}?offset={offset}&size={size}".format(
                     path=request_path.format(webservice="braincube"),
-                    offset=offset,
+                    offset=page_offset,
                     size=page_size,
                 ),
                 braincube_name=braincube_name,
             )
-            new_entities = [
-                cls.create_from_json(elmt, entity_path, caller, **kwargs)
-                for elmt in json_data["items"]
-            ]
-            entity_list += new_entities
-            if not new_entities or page > -1:
-                break
+            return json_data["items"]
+
+        with timeouts.deadline_scope(deadline):
+            if page > -1:
+                json_items = request_items(offset)
             else:
-                offset += page_size
-        return entity_list
+                json_items = snapshot.get_or_request(
+                    braincube_name,
+                    request_path.format(webservice="braincube"),
+                    lambda: _request_all_pages(request_items, page_size, page_workers),
+                )
+        return [cls.create_from_json(elmt, entity_path, caller, **kwargs) for elmt in json_items]
 
     def get_metadata(self) -> Dict[str, Any]:
         """Gets the metadata of the Object.
@@ -222,3 +234,66 @@ class BaseEntity(base.Base):
             The uuid of the variable.
         """
         return self._metadata["uuid"].split("_")[1]
+
+
+def _request_all_pages(
+    request_page: Callable[[int], List[Any]], page_size: int, page_workers: int
+) -> List[Any]:
+    """Request all the pages of a collection.
+
+    The pages are requested concurrently when `page_workers` is greater than 1.
+
+    Args:
+        request_page: Function requesting the items of the page starting at an offset.
+        page_size: Number of items per page.
+        page_workers: Number of pages requested concurrently.
+
+    Returns:
+        The items of all the pages.
+    """
+    if page_workers > 1:
+        return _request_pages_concurrently(request_page, page_size, page_workers)
+    item_list: List[Any] = []
+    offset = 0
+    while True:
+        new_items = request_page(offset)
+        item_list += new_items
+        if not new_items:
+            return item_list
+        offset += page_size
+
+
+def _request_pages_concurrently(
+    request_page: Callable[[int], List[Any]], page_size: int, page_workers: int
+) -> List[Any]:
+    """Request the pages of a collection with a speculative look-ahead.
+
+    `page_workers` pages are kept in flight. The pages are consumed in the server order and a
+    new page is requested each time one is consumed, until an empty page is met. The pages
+    requested beyond the empty one are dropped.
+
+    Args:
+        request_page: Function requesting the entities of the page starting at an offset.
+        page_size: Number of entities per page.
+        page_workers: Number of pages requested concurrently.
+
+    Returns:
+        The entities of all the pages.
+    """
+    entity_list: List[Any] = []
+    executor = ThreadPoolExecutor(max_workers=page_workers)
+    try:  # noqa: WPS229, WPS501
+        futures = deque(
+            parallel.submit(executor, request_page, page_index * page_size)
+            for page_index in range(page_workers)
+        )
+        next_offset = page_workers * page_size
+        new_entities = futures.popleft().result()
+        while new_entities:
+            entity_list += new_entities
+            futures.append(parallel.submit(executor, request_page, next_offset))
+            next_offset += page_size
+            new_entities = futures.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return entity_list
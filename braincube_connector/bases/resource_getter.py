@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import functools
 from typing import Any, Tuple, Union
 
-from braincube_connector import constants, tools
+from braincube_connector import cache, constants, parameters, snapshot, tools
 
 
 class ResourceGetter(object):
@@ -45,6 +46,10 @@ class ResourceGetter(object):
     ):
         """Get a resource from its bcId.
 
+        When the `entity_cache` parameter is True, the resources are kept in an identity map
+        keyed by braincube name, entity path and requested path, see `cache.get_entity_cache`.
+        The identity map is bypassed while a snapshot is exported.
+
         Args:
             resource_class: Class of the resource to get.
             bcid: Event bcid.
@@ -54,16 +59,27 @@ class ResourceGetter(object):
         Returns:
             A resource description.
         """
-        return resource_class.create_singleton_from_path(
-            *generate_path(
-                self._path,
-                resource_class.entity_path.replace("{bcid}", str(bcid)),
-                singleton_path if singleton_path else resource_class.request_one_path,
-            ),
+        request_path, entity_path = generate_path(
+            self._path,
+            resource_class.entity_path.replace("{bcid}", str(bcid)),
+            singleton_path if singleton_path else resource_class.request_one_path,
+        )
+        create_resource = functools.partial(
+            resource_class.create_singleton_from_path,
+            request_path,
+            entity_path,
             self,
             braincube_name=self.get_braincube_name(),
             **kwargs,
         )
+        if not parameters.get_parameter("entity_cache") or snapshot.is_recording():
+            return create_resource()
+        return cache.get_entity_cache().get(
+            (self.get_braincube_name(), entity_path, request_path),
+            create_resource,
+            parameters.get_parameter("entity_cache_ttl"),
+            parameters.get_parameter("entity_cache_size"),
+        )
 
     def _get_resource_list(
         self,
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+"""Caches of the metadata requested by the connector."""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent import futures
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from braincube_connector import instances, timeouts
+
+ENTITY_CACHE_KEY = "entity_cache"
+REQUEST_COALESCER_KEY = "request_coalescer"
+
+
+class CacheStats(object):
+    """Thread-safe counters of the lookups made in a cache."""
+
+    def __init__(self):
+        """Initialize CacheStats."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Set all the counters to zero."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+    def record_hit(self):
+        """Count a lookup served by the cache."""
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self):
+        """Count a lookup that had to load the value."""
+        with self._lock:
+            self._misses += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters.
+
+        Returns:
+            The number of hits, i.e. the requests saved by the cache, and of misses.
+        """
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses}
+
+
+class TimedValue(object):
+    """A value loaded on demand and kept until its time to live has passed."""
+
+    def __init__(self, loader: Callable[[], Any]):
+        """Initialize TimedValue.
+
+        Args:
+            loader: Function loading the value, e.g. by sending a request.
+        """
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._cached: Any = None
+        self._loaded_at: Optional[float] = None
+        self._stats = CacheStats()
+
+    def get(self, ttl: float) -> Any:
+        """Get the value, loading it if it is missing or too old.
+
+        Concurrent calls wait for a single load of the value.
+
+        Args:
+            ttl: Time to live of the value in seconds, the value is loaded on every call when it
+                 is 0.
+
+        Returns:
+            The value.
+        """
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < ttl:
+                self._stats.record_hit()
+                return self._cached
+            self._stats.record_miss()
+            self._cached = self._loader()
+            self._loaded_at = time.monotonic()
+            return self._cached
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters of the lookups made in the cache.
+
+        Returns:
+            The number of hits, i.e. the loads saved by the cache, and of misses.
+        """
+        return self._stats.get_stats()
+
+    def invalidate(self):
+        """Drop the value so that the next call to `get` loads it again."""
+        with self._lock:
+            self._cached = None
+            self._loaded_at = None
+
+
+class LRUCache(object):
+    """Thread-safe map of values kept for a time to live, without the least recently used ones.
+
+    The time to live and the maximum size are given on each lookup, so that a change of the
+    parameters applies at once.
+    """
+
+    def __init__(self):
+        """Initialize LRUCache."""
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Count the values in the cache.
+
+        Returns:
+            The number of cached values, including the expired ones not evicted yet.
+        """
+        return len(self._entries)
+
+    def get(self, key: Hashable, loader: Callable[[], Any], ttl: float, max_size: int) -> Any:
+        """Get the value of a key, loading it if it is missing or too old.
+
+        Args:
+            key: Key of the value.
+            loader: Function loading the value, e.g. by sending a request.
+            ttl: Time to live of the values in seconds.
+            max_size: Maximum number of values, the least recently used are evicted beyond.
+
+        Returns:
+            The value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                self._entries.move_to_end(key)
+                self._stats.record_hit()
+                return entry[1]
+        self._stats.record_miss()
+        loaded_value = loader()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), loaded_value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(max_size, 0):
+                self._entries.popitem(last=False)
+        return loaded_value
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters of the lookups made in the cache.
+
+        Returns:
+            The number of hits, i.e. the loads saved by the cache, of misses and of cached
+            values.
+        """
+        stats = self._stats.get_stats()
+        stats["size"] = len(self)
+        return stats
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop a value, or all the values.
+
+        Args:
+            key: Key of the value to drop. Default: drop all the values.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+class SingleFlight(object):
+    """Share a single call between the concurrent calls with the same key.
+
+    A call made while an identical call is in progress waits for its result instead of
+    running again, and gets its error if it fails. Only a call that failed on the deadline of
+    its own caller is run again by the waiting calls, whose deadlines may be later. The calls
+    are not cached: a call made after the first one has returned runs again.
+    """
+
+    def __init__(self):
+        """Initialize SingleFlight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, futures.Future] = {}
+        self._stats = CacheStats()
+
+    def run(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run a function, or wait for the result of the identical call in progress.
+
+        A waiting call gives up when the deadline of its own scope has passed.
+
+        Args:
+            key: Key of the call.
+            function: Function to run, e.g. sending a request.
+
+        Returns:
+            The result of the function, shared by the concurrent calls.
+
+        Raises:
+            call_error: The error of the identical call in progress, unless it exceeded the
+                deadline of its caller.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    self._calls[key] = futures.Future()
+            if call is None:
+                self._stats.record_miss()
+                return self._lead(key, function)
+            self._stats.record_hit()
+            self._wait(call)
+            call_error = call.exception()
+            if call_error is None:
+                return call.result()
+            if not isinstance(call_error, timeouts.DeadlineExceededError):
+                raise call_error
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters of the calls.
+
+        Returns:
+            The number of hits, i.e. the calls that waited for an identical call in progress,
+            and of misses.
+        """
+        return self._stats.get_stats()
+
+    def _lead(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run a function and share its result with the calls waiting for it.
+
+        The waiting calls are resumed whatever the outcome, even on a KeyboardInterrupt.
+
+        Args:
+            key: Key of the call.
+            function: Function to run.
+
+        Returns:
+            The result of the function.
+        """
+        call_result, call_error = None, None
+        try:
+            call_result = function()
+        except BaseException as error:  # noqa: WPS424
+            call_error = error
+            raise
+        finally:
+            self._finish(key, call_result, call_error)
+        return call_result
+
+    def _finish(self, key: Hashable, call_result: Any, call_error: Optional[BaseException]):
+        """Stop sharing a call with the new calls, and resume the calls waiting for it.
+
+        Args:
+            key: Key of the call.
+            call_result: Result of the call.
+            call_error: Error raised by the call, None if it succeeded.
+        """
+        with self._lock:
+            call = self._calls.pop(key)
+        if call_error is None:
+            call.set_result(call_result)
+        else:
+            call.set_exception(call_error)
+
+    def _wait(self, call: futures.Future):
+        """Wait for a call in progress, until the deadline of the current scope.
+
+        Args:
+            call: Future of the call in progress.
+
+        Raises:
+            DeadlineExceededError: The deadline passed while waiting for the call in progress.
+        """
+        deadline = timeouts.get_current_deadline()
+        futures.wait([call], None if deadline is None else deadline.remaining())
+        if not call.done():
+            raise timeouts.DeadlineExceededError(
+                "The deadline has been exceeded while waiting for an identical request."
+            )
+
+
+def get_entity_cache() -> LRUCache:
+    """Get the identity map shared by all the entities requested from their bcId.
+
+    Returns:
+        The entity cache.
+    """
+    if instances.get_instance(ENTITY_CACHE_KEY) is None:
+        instances.add_instance(ENTITY_CACHE_KEY, LRUCache())
+    return instances.get_instance(ENTITY_CACHE_KEY)
+
+
+def get_request_coalescer() -> SingleFlight:
+    """Get the single flight shared by the concurrent identical data requests.
+
+    Returns:
+        The request coalescer.
+    """
+    if instances.get_instance(REQUEST_COALESCER_KEY) is None:
+        instances.add_instance(REQUEST_COALESCER_KEY, SingleFlight())
+    return instances.get_instance(REQUEST_COALESCER_KEY)
@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional, Tuple
 
 import requests
 
-from braincube_connector import constants, instances, tools
+from braincube_connector import constants, instances, retry, sessions, timeouts, tools
 from braincube_connector.bases import base
 
 INSTANCE_KEY = "client"
@@ -36,10 +36,13 @@ class Client(base.Base):
     ) -> None:
         """Initialize Client.
 
+        The connect and read timeouts can be set separately with the `connect_timeout` and
+        `read_timeout` keys of the configuration.
+
         Args:
             config_file: A path to a configuration file.
             config_dict: A configuration dictionary.
-            timeout: Combined connect and read timeout for HTTP requests, in seconds.
+            timeout: Default connect and read timeout for HTTP requests, in seconds.
         """
         if instances.get_instance(INSTANCE_KEY) is not None:
             raise AlreadyExistsError("A client has already been inialized.")
@@ -48,10 +51,16 @@ class Client(base.Base):
             self._sso_url = tools.get_sso_base_url(self._config_dict)
             self._braincube_base_url = tools.get_braincube_base_url(self._config_dict)
             self._verify = self._config_dict.get(constants.VERIFY_CERT, True)  # noqa: WPS425
+            self._timeout = timeout
+            self._timeouts = (
+                float(self._config_dict.get(constants.CONNECT_TIMEOUT_KEY, timeout)),
+                float(self._config_dict.get(constants.READ_TIMEOUT_KEY, timeout)),
+            )
+            self._session_pool = sessions.from_config(self._config_dict)
+            self._retry_stats = retry.RetryStats()
             self._authentication = self._build_authentication(self._config_dict)
             available_braincube_infos = self._request_braincubes()
             self._braincube_infos = available_braincube_infos
-            self._timeout = timeout
             self._headers = tools.generate_header(authentication=self._authentication)
 
     def __str__(self) -> str:
@@ -71,9 +80,14 @@ class Client(base.Base):
         api: bool = True,
         response_as_json: bool = True,
         braincube_name: str = "",
+        idempotent: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """Make a request at a given path on the client's domain.
 
+        The request timeouts are shortened to fit in the deadline of the current
+        `timeouts.deadline_scope`, if any. Idempotent requests are attempted again on
+        connection errors and transient statuses, see the `retry_*` parameters.
+
         Args:
             path: Path on the domain.
             headers: Headers of the request.
@@ -83,9 +97,13 @@ class Client(base.Base):
             response_as_json: parse a json output to a python dictionary.
             braincube_name: name of the Braincube you want to use to do this request.
                             Usefull when you have {braincube-name} in your base URL
+            idempotent: Whether the request can be repeated safely. Default: True for GET.
 
         Returns:
             The request's json output or the full response.
+
+        Raises:
+            DeadlineExceededError: The deadline of the current scope has passed.
         """
         base_url = self._sso_url
         if api:
@@ -95,8 +113,10 @@ class Client(base.Base):
 
         if not headers:
             headers = self._headers
-        request_result = getattr(requests, rtype.lower())(
-            url, headers=headers, data=body_data, verify=self._verify
+        request_result = retry.call_with_retry(
+            lambda: self._send(rtype, url, headers, body_data, api),  # type: ignore
+            self._retry_stats,
+            retry.get_max_attempts(rtype, idempotent),
         )
         request_result.raise_for_status()
         if response_as_json:
@@ -109,7 +129,19 @@ class Client(base.Base):
                 raise requests.exceptions.JSONDecodeError(
                     error_msg, request_result.text, 0
                 ) from json_error
-        return request_result
+        return request_result  # type: ignore
+
+    def close(self):
+        """Close the pooled connections of the client."""
+        self._session_pool.close()
+
+    def get_retry_stats(self) -> Dict[str, float]:
+        """Get the counters of the retries made by the client.
+
+        Returns:
+            The number of retries, of requests that ran out of attempts and the time waited.
+        """
+        return self._retry_stats.get_stats()
 
     def get_braincube_infos(self) -> Dict[str, Any]:
         """Get the information about the braincubes available to the client.
@@ -129,6 +161,45 @@ class Client(base.Base):
         """
         return constants.BRAINCUBE_NAME_PLACEHOLDER in self._braincube_base_url
 
+    def _send(
+        self,
+        rtype: str,
+        url: str,
+        headers: Dict[str, Any],
+        body_data: Any,
+        api: bool,
+    ) -> requests.Response:
+        """Send a request with the timeouts allowed by the current deadline.
+
+        Args:
+            rtype: Request type (GET, POST).
+            url: Url to request.
+            headers: Headers of the request.
+            body_data: Data to associate to the request.
+            api: Requests the API server on the domain.
+
+        Returns:
+            The response of the server.
+
+        Raises:
+            DeadlineExceededError: The deadline of the current scope has passed.
+        """
+        request_timeouts = timeouts.get_request_timeouts(self._timeouts)
+        try:
+            return self._session_pool.get_session(api).request(
+                rtype.upper(),
+                url,
+                headers=headers,
+                data=body_data,
+                verify=self._verify,
+                timeout=request_timeouts,
+            )
+        except requests.exceptions.Timeout as timeout_error:
+            deadline = timeouts.get_current_deadline()
+            if deadline is not None and deadline.remaining() <= 0:
+                raise timeouts.DeadlineExceededError(str(timeout_error)) from timeout_error
+            raise
+
     def _request_braincubes(self) -> Dict[str, Any]:
         """Request the accessible braincube to the sso server.
 
@@ -208,6 +279,7 @@ def request_ws(
     api: bool = True,
     response_as_json: bool = True,
     braincube_name: str = "",
+    idempotent: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Make a request at a given path on the client's domain.
 
@@ -220,9 +292,12 @@ def request_ws(
         response_as_json: parse a json output to a python dictionary.
         braincube_name: name of the braincube on which is made the request,
                         useful if you use a placeholder in your config
+        idempotent: Whether the request can be repeated safely. Default: True for GET.
 
     Returns:
         The request's json output or the full response.
     """
     cli = get_instance()
-    return cli.request_ws(path, headers, body_data, rtype, api, response_as_json, braincube_name)
+    return cli.request_ws(
+        path, headers, body_data, rtype, api, response_as_json, braincube_name, idempotent
+    )
@@ -14,7 +14,30 @@ DEFAULT_PROTOCOL = "https"
 DEFAULT_API_SUBDOMAIN = "api"
 NO_CONFIG_MSG = "The client needs a configuration file."
 DEFAULT_PAGE_SIZE = 150
+DEFAULT_PAGE_WORKERS = 1
+DEFAULT_DATA_CHUNK_SIZE = 100
+DEFAULT_DATA_WORKERS = 4
+DEFAULT_PARTITION_MAX_ROWS = 100000
+DEFAULT_ITER_CHUNK_SIZE = 10000
+DEFAULT_BRAINDATA_INFO_TTL = 300
+DEFAULT_VARIABLE_INDEX_TTL = 300
+DEFAULT_METADATA_WORKERS = 4
+DEFAULT_FANOUT_MAX_REQUESTS = 8
+DEFAULT_ASYNC_MAX_CONCURRENCY = 32
+DEFAULT_ENTITY_CACHE = False
+DEFAULT_ENTITY_CACHE_TTL = 300
+DEFAULT_ENTITY_CACHE_SIZE = 10000
+DEFAULT_COALESCE_REQUESTS = True
+DEFAULT_SNAPSHOT_MAX_AGE = 86400
+DEFAULT_RESULT_CACHE_DIR = None
+DEFAULT_RESULT_CACHE_MAX_SIZE = 1073741824  # 1 GiB
+DEFAULT_CATEGORICAL_DISCRETE = True
 DEFAULT_PARSE_DATE = False
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_BASE = 0.5
+DEFAULT_RETRY_BACKOFF_MAX = 30
+DEFAULT_RETRY_JITTER_CAP = 0.5
+DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
 API_KEY = "api_key"
 PAT_KEY = "X-api-key"
 DOMAIN_KEY = "domain"
@@ -23,5 +46,12 @@ BRAINCUBE_BASE_URL_KEY = "braincube_base_url"
 OAUTH2_KEY = "oauth2_token"
 SSO_TOKEN_KEY = "IPLSSOTOKEN"  # noqa: S105
 VERIFY_CERT = "verify"
+POOL_SIZE_KEY = "pool_size"
+POOL_CONNECTIONS_KEY = "pool_connections"
+KEEP_ALIVE_KEY = "keep_alive"
+CONNECT_TIMEOUT_KEY = "connect_timeout"
+READ_TIMEOUT_KEY = "read_timeout"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_CONNECTIONS = 4
 BRAINCUBE_NAME_PLACEHOLDER = "{braincube-name}"
 EMPTY_STRING = ""
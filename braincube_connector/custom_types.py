@@ -1,5 +1,8 @@
 """Custom types for Braincube Connector."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Union
+
+import pandas as pd
 
 FILTER_TYPE = Dict[str, Any]
+DATA_TYPE = Union[pd.DataFrame, Dict[str, Any]]
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""Split the braindata requests by columns and merge their results."""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from braincube_connector import parameters
+
+
+def get_order_bcid(order_long_id: str) -> int:
+    """Get the bcId of the order variable from its long id.
+
+    Args:
+        order_long_id: Long id 'mb{mb_id}/d{var_id}' of the order variable.
+
+    Returns:
+        The bcId of the order variable.
+    """
+    return int(order_long_id.split("/d")[1])
+
+
+def split_columns(variable_ids: List[int], order_long_id: str) -> List[List[int]]:
+    """Split the requested variables in chunks of `data_chunk_size` columns.
+
+    When the variables do not fit in a single chunk, the order variable is added to the
+    chunks lacking it so that the chunks can be stitched back together.
+
+    Args:
+        variable_ids: bcIds of the requested variables.
+        order_long_id: Long id of the memory base order variable.
+
+    Returns:
+        The chunks of variable bcIds.
+    """
+    chunk_size = parameters.get_parameter("data_chunk_size")
+    if not chunk_size or len(variable_ids) <= chunk_size:
+        return [list(variable_ids)]
+    order_bcid = get_order_bcid(order_long_id)
+    column_chunks = [
+        list(variable_ids[chunk_start : chunk_start + chunk_size])  # noqa: E203
+        for chunk_start in range(0, len(variable_ids), chunk_size)
+    ]
+    return [
+        chunk if order_bcid in {int(var_id) for var_id in chunk} else [order_bcid, *chunk]
+        for chunk in column_chunks
+    ]
+
+
+def stitch_chunks(
+    datasets: List[Dict[int, Any]], variable_ids: List[int], order_long_id: str
+) -> Dict[int, Any]:
+    """Merge the datasets of several column chunks into a single dataset.
+
+    The rows of the first chunk are kept. The rows of the other chunks are matched to them on
+    the value of the order variable when the chunks do not have the same rows, e.g. when new
+    data were stored between two requests.
+
+    Args:
+        datasets: Formatted datasets of the chunks.
+        variable_ids: bcIds of the requested variables.
+        order_long_id: Long id of the memory base order variable.
+
+    Returns:
+        The merged dataset, restricted to the requested variables.
+    """
+    if len(datasets) == 1:
+        return datasets[0]
+    order_bcid = get_order_bcid(order_long_id)
+    stitched_dataset = dict(datasets[0])
+    reference_order = stitched_dataset.get(order_bcid)
+    for chunk_dataset in datasets[1:]:
+        stitched_dataset.update(_align_rows(chunk_dataset, order_bcid, reference_order))
+    return {
+        int(var_id): stitched_dataset[int(var_id)]
+        for var_id in variable_ids
+        if int(var_id) in stitched_dataset
+    }
+
+
+def _align_rows(
+    dataset: Dict[int, Any], order_bcid: int, reference_order: Optional[List[Any]]
+) -> Dict[int, Any]:
+    """Reorder the rows of a dataset to match a reference order column.
+
+    Args:
+        dataset: Formatted dataset.
+        order_bcid: bcId of the memory base order variable.
+        reference_order: Order column to match.
+
+    Returns:
+        The dataset with one row per value of the reference order, None where it has no
+        matching row, without its order column. The dataset is returned as is when it already
+        matches or when one of the order columns is missing.
+    """
+    order = dataset.get(order_bcid)
+    if reference_order is None or order is None or np.array_equal(order, reference_order):
+        return dataset
+    rows = _match_rows(order, reference_order)  # type: ignore
+    return {
+        col_id: [None if row is None else col_data[row] for row in rows]
+        for col_id, col_data in dataset.items()
+        if col_id != order_bcid
+    }
+
+
+def _match_rows(order: List[Any], reference_order: List[Any]) -> List[Optional[int]]:
+    """Find the row matching each value of a reference order column.
+
+    Args:
+        order: Order column of a dataset.
+        reference_order: Order column to match.
+
+    Returns:
+        The position of the matching row in the dataset, None if there is none.
+    """
+    positions = {row_key: position for position, row_key in enumerate(_get_row_keys(order))}
+    return [positions.get(row_key) for row_key in _get_row_keys(reference_order)]
+
+
+def _get_row_keys(order: List[Any]) -> List[Tuple[Hashable, int]]:
+    """Identify the rows by their order value and the rank of this value among duplicates.
+
+    Args:
+        order: Order column.
+
+    Returns:
+        A key per row.
+    """
+    occurrences: Dict[Hashable, int] = {}
+    row_keys = []
+    for order_value in order:
+        occurrence = occurrences.get(order_value, 0)
+        occurrences[order_value] = occurrence + 1
+        row_keys.append((order_value, occurrence))
+    return row_keys
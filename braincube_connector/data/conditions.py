@@ -2,34 +2,58 @@
 
 """A set of tools to extract conditions from an entity."""
 
-from typing import Any, Dict, List, Optional
+import itertools
+import json
+import types
+from typing import Any, Dict, Hashable, List, Optional
 
 from braincube_connector import tools
 
 BCID = "bcId"
 VAR_KEY = "variable"
+EQUALS = "EQUALS"
+RANGE_FOLDS = types.MappingProxyType(
+    {
+        "BETWEEN": (max, min),
+        "GREAT": (max,),
+        "LESS": (min,),
+    },
+)
+
+FilterType = Any
 
 
 def combine_filters(
     filters: "Optional[List[Any]]", operator: str = "AND"
 ) -> "List[Dict[str, Any]]":
-    """Nest multiple filters in a series of AND gates.
+    """Combine multiple filters in a balanced tree of AND gates.
+
+    The nested gates of the same operator are flattened and the duplicate filters dropped. In an
+    AND gate, the BETWEEN, GREAT and LESS filters on a variable are intersected into one filter.
+    In an OR gate, the EQUALS filters on a variable are merged into one filter on the set of
+    their values. As a gate hosts two filters, the remaining filters are nested in a balanced
+    tree, whose depth is the logarithm of their number.
 
     Args:
         filters: Filters to combine together.
-        operator: operator to Returns
+        operator: Operator of the gates, "AND" or "OR".
 
     Returns:
         A list containing a unique filter combining the passed filters.
     """
     if not filters:
         return []
-    if len(filters) == 1:
-        return filters
-    elif len(filters) == 2:
-        return [{operator: [filters[0], filters[1]]}]
-    first_and = {operator: [filters[0], filters[1]]}
-    return combine_filters([first_and] + filters[2:], operator=operator)
+    groups: Dict[Hashable, List[FilterType]] = {}
+    for operand in flatten_filters(filters, operator):
+        groups.setdefault(_get_merge_key(operand, operator), []).append(operand)
+    operands = [_merge_group(group) for group in groups.values()]
+    while len(operands) > 1:
+        gates = [
+            {operator: operands[index : index + 2]}  # noqa: E203
+            for index in range(0, len(operands) - 1, 2)
+        ]
+        operands = gates + operands[len(gates) * 2 :]  # noqa: E203
+    return operands
 
 
 def build_condition_filter(
@@ -55,6 +79,43 @@ def build_condition_filter(
     return new_filter
 
 
+def build_range_filter(
+    var_obj: "Variable", minimum: Any = None, maximum: Any = None  # type: ignore  # noqa
+) -> Optional[Dict[str, Any]]:
+    """Build a filter keeping the values of a variable within a range.
+
+    Args:
+        var_obj: Entity to which the filter is associated.
+        minimum: Lower bound, a timestamp in ms for a DATETIME variable. None for no bound.
+        maximum: Upper bound, a timestamp in ms for a DATETIME variable. None for no bound.
+
+    Returns:
+        A BETWEEN, GREAT or LESS filter, None if the range has no bound.
+    """
+    return _mini_maxi_filter(var_obj, {"minimum": minimum, "maximum": maximum})
+
+
+def flatten_filters(filters: List[FilterType], operator: str) -> List[FilterType]:
+    """List the operands of the nested gates of an operator, without recursion.
+
+    Args:
+        filters: Filters to flatten.
+        operator: Operator of the gates to flatten.
+
+    Returns:
+        The filters that are not gates of the operator, in their original order.
+    """
+    operands = []
+    pending = list(reversed(filters))
+    while pending:
+        operand = pending.pop()
+        if isinstance(operand, dict) and list(operand) == [operator]:
+            pending.extend(reversed(operand[operator]))
+        else:
+            operands.append(operand)
+    return operands
+
+
 def _discrete_filter(var_obj: "Variable", var_cond: "Dict[str, Any]") -> "Optional[Dict[str, Any]]":  # type: ignore  # noqa
     """Build a filter for a discrete variable.
 
@@ -66,8 +127,7 @@ def _discrete_filter(var_obj: "Variable", var_cond: "Dict[str, Any]") -> "Option
         A discrete variable filter.
     """
     filter_list = [
-        {"EQUALS": [var_obj.get_long_id(), [modality]]}
-        for modality in var_cond.get("modalities", [])
+        {EQUALS: [var_obj.get_long_id(), [modality]]} for modality in var_cond.get("modalities", [])
     ]
     if not filter_list:
         return None
@@ -94,3 +154,74 @@ def _mini_maxi_filter(var_obj: "Variable", var_cond: "Dict[str, Any]") -> "Optio
     elif maxi is not None:
         return {"LESS": [var_obj.get_long_id(), maxi]}
     return None
+
+
+def _get_merge_key(operand: FilterType, operator: str) -> Hashable:
+    """Compute the key of the operands of a gate that can be merged together.
+
+    Args:
+        operand: Operand of the gate.
+        operator: Operator of the gate.
+
+    Returns:
+        The filter type, the variable and the types of the bounds, dates or numbers, of a
+        mergeable filter. The json of the other operands, so that only their duplicates are merged.
+    """
+    if isinstance(operand, dict) and len(operand) == 1:
+        filter_type, arguments = next(iter(operand.items()))
+        if operator == "AND" and filter_type in RANGE_FOLDS:
+            bound_types = tuple(isinstance(bound, str) for bound in arguments[1:])
+            return (filter_type, arguments[0], bound_types)
+        if operator == "OR" and filter_type == EQUALS and isinstance(arguments[1], list):
+            return (filter_type, arguments[0])
+    return json.dumps(operand, sort_keys=True, default=str)
+
+
+def _merge_group(group: List[FilterType]) -> FilterType:
+    """Merge filters of the same type on a same variable.
+
+    Args:
+        group: Filters sharing a merge key.
+
+    Returns:
+        The merged filter.
+    """
+    if len(group) == 1 or not isinstance(group[0], dict):
+        return group[0]
+    filter_type = next(iter(group[0]))
+    if filter_type == EQUALS:
+        return _merge_modalities(group)
+    return _merge_ranges(filter_type, group)
+
+
+def _merge_ranges(filter_type: str, group: List[FilterType]) -> FilterType:
+    """Intersect range filters of the same type on a same variable.
+
+    A contradictory intersection, a BETWEEN whose minimum is above its maximum, is kept so that
+    the webservice returns no row.
+
+    Args:
+        filter_type: BETWEEN, GREAT or LESS.
+        group: Range filters on a variable.
+
+    Returns:
+        The intersection of the filters.
+    """
+    folds = RANGE_FOLDS[filter_type]
+    positions = zip(*[operand[filter_type][1:] for operand in group])
+    bounds = [fold(position) for fold, position in zip(folds, positions)]
+    return {filter_type: [group[0][filter_type][0], *bounds]}
+
+
+def _merge_modalities(group: List[FilterType]) -> FilterType:
+    """Merge EQUALS filters on a same variable into one filter on the union of their values.
+
+    Args:
+        group: EQUALS filters on a variable.
+
+    Returns:
+        The merged filter.
+    """
+    var_id = group[0][EQUALS][0]
+    modalities = itertools.chain.from_iterable(operand[EQUALS][1] for operand in group)
+    return {EQUALS: [var_id, list(dict.fromkeys(modalities))]}
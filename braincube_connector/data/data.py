@@ -2,16 +2,18 @@
 
 """Module used to collect data from braindata."""
 
+import functools
 import warnings
 import json
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
-from braincube_connector import client, custom_types, parameters, tools
-from braincube_connector.data import conditions
+from braincube_connector import cache, client, custom_types, parallel, parameters, tools
+from braincube_connector.data import chunks, conditions, parsing, result_cache
 
 DATA_PATH = "braindata/{mb_id}/LF"
+DISCRETE_TYPES = frozenset(("DISCRETE", "DISCRET"))
 DATACOL = "data"
 
 
@@ -57,7 +59,7 @@ def pandas_timestamp_to_datetime(timestamp):
     return pd.Timestamp.to_pydatetime(timestamp)
 
 
-def _extract_format_data(raw_dataset: Dict[str, Any]) -> Dict[int, Any]:
+def _extract_format_data(raw_dataset: Dict[str, Any], arrays: bool = False) -> Dict[int, Any]:
     """Extract the requested data from the json.
 
     The function extracts the data keys and types and convert the columns
@@ -65,12 +67,12 @@ def _extract_format_data(raw_dataset: Dict[str, Any]) -> Dict[int, Any]:
 
     Args:
         raw_dataset: An unformated dataset received from braindata.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
 
     Returns:
         A formated dictionary {column_key: formated column data}
     """
     formatted_dataset = {}
-    parse_date = parameters.get_parameter("parse_date")
 
     for col in raw_dataset["datadefs"]:
         col_id = int(col["id"].split("/d")[1])
@@ -79,18 +81,50 @@ def _extract_format_data(raw_dataset: Dict[str, Any]) -> Dict[int, Any]:
             warnings.warn("No data found for: {0}".format(col["id"]), stacklevel=2)
             continue
 
-        col_data = col[DATACOL]
-
-        if col["type"] == "DATETIME" and parse_date:
-            formatted_dataset[col_id] = _to_datetime(col_data)
-        elif col["type"] == "NUMERIC":
-            formatted_dataset[col_id] = _parse_numeric_column(col_data)
-        else:
-            formatted_dataset[col_id] = col_data
+        formatted_dataset[col_id] = _format_column(col["type"], col[DATACOL], arrays)
 
     return formatted_dataset
 
 
+def _format_column(col_type: str, col_data: List[Any], arrays: bool = False) -> Any:
+    """Convert a column using its type.
+
+    Args:
+        col_type: Braincube type of the column.
+        col_data: The column data to convert.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists, and encode the
+                DISCRETE columns as categorical arrays if `categorical_discrete` is True.
+
+    Returns:
+        The converted column.
+    """
+    if col_type == "DATETIME":
+        return _parse_datetime_column(col_data)
+    elif col_type == "NUMERIC":
+        return parsing.parse_numeric_array(col_data) if arrays else _parse_numeric_column(col_data)
+    elif arrays and col_type in DISCRETE_TYPES and parameters.get_parameter("categorical_discrete"):
+        return parsing.parse_discrete_array(col_data)
+    return parsing.to_list(col_data)
+
+
+def _parse_datetime_column(col_data: List[Any]) -> Any:
+    """Parse a DATETIME column as requested by the `parse_date` parameter.
+
+    Args:
+        col_data: The column data to parse.
+
+    Returns:
+        A list of naive datetime objects if `parse_date` is True, a datetime64[ns, UTC] array
+        if it is "fast", the unparsed column otherwise.
+    """
+    parse_date = parameters.get_parameter("parse_date")
+    if parse_date == "fast":
+        return parsing.parse_datetime_array(col_data)
+    elif parse_date:
+        return _to_datetime(col_data)
+    return parsing.to_list(col_data)
+
+
 def _parse_numeric_column(col_data: List[Any]) -> List[Union[int, float]]:
     """Parse numeric columns and handle ValueError by falling back to float.
 
@@ -100,10 +134,7 @@ def _parse_numeric_column(col_data: List[Any]) -> List[Union[int, float]]:
     Returns:
         List[Union[int, float]]: A list of parsed values, either int or float.
     """
-    try:
-        return list(map(int, col_data))
-    except ValueError:
-        return list(map(float, col_data))
+    return parsing.parse_numeric_array(col_data).tolist()
 
 
 def get_braindata_memory_base_info(
@@ -129,35 +160,90 @@ def collect_data(
     variable_ids: List[int],
     memory_base: "MemoryBase",  # type: ignore  # noqa
     filters: Optional[List[custom_types.FILTER_TYPE]] = None,
+    arrays: bool = False,
+    use_cache: bool = True,
 ) -> Dict[int, Any]:
     """Get data from the memory bases.
 
+    The variables are requested by chunks of `data_chunk_size` columns, up to `data_workers`
+    chunks at the same time, and the chunks are stitched back together on the order variable.
+
     Args:
         variable_ids: bcIds of variables for which the data are collected.
         memory_base: A memory base on which to collect the data.
         filters: List of filter to apply to the request.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+        use_cache: Answer the requests from the result cache when it is enabled, see the
+                   `result_cache_dir` parameter.
 
     Returns:
         A dictionary of data list.
     """
     long_mb_id = "mb{bcid}".format(bcid=memory_base.get_bcid())
-    long_variable_ids = [_expand_var_id(long_mb_id, vv) for vv in variable_ids]
-    data_path = tools.join_path(
-        [memory_base.get_braincube_path(), DATA_PATH.format(mb_id=long_mb_id)]
-    )
     body_data = {
         "order": memory_base.get_order_variable_long_id(),
-        "definitions": long_variable_ids,
+        "definitions": [],
         "context": {"dataSource": long_mb_id},
     }
     filters = conditions.combine_filters(filters)  # Merge filters in one filter
     if len(filters) == 1:
         body_data["context"]["filter"] = filters[0]  # type: ignore
-    return _extract_format_data(
-        client.request_ws(
-            data_path,
-            body_data=json.dumps(body_data),
-            rtype="POST",
-            braincube_name=memory_base.get_braincube_name(),
-        )
+    datasets = parallel.map_in_order(
+        functools.partial(
+            _request_columns, memory_base, body_data, arrays=arrays, use_cache=use_cache
+        ),
+        chunks.split_columns(variable_ids, body_data["order"]),  # type: ignore
+        parameters.get_parameter("data_workers"),
+    )
+    return chunks.stitch_chunks(datasets, variable_ids, body_data["order"])  # type: ignore
+
+
+def _request_columns(
+    memory_base: "MemoryBase",  # type: ignore  # noqa
+    body_data: Dict[str, Any],
+    variable_ids: List[int],
+    arrays: bool = False,
+    use_cache: bool = True,
+) -> Dict[int, Any]:
+    """Request the data of some variables to braindata.
+
+    Args:
+        memory_base: A memory base on which to collect the data.
+        body_data: Body of the request, without the definitions.
+        variable_ids: bcIds of the requested variables.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+        use_cache: Answer the request from the result cache when it is enabled.
+
+    Returns:
+        A dictionary of data list. With the `coalesce_requests` parameter, the concurrent
+        identical requests share a single request, and each of them parses the response into
+        its own columns.
+    """
+    long_mb_id = body_data["context"]["dataSource"]
+    data_path = tools.join_path(
+        [memory_base.get_braincube_path(), DATA_PATH.format(mb_id=long_mb_id)]
+    )
+    body_data = dict(
+        body_data, definitions=[_expand_var_id(long_mb_id, var_id) for var_id in variable_ids]
+    )
+    braincube_name = memory_base.get_braincube_name()
+    request_columns = functools.partial(
+        parallel.call_in_slot,
+        client.request_ws,
+        data_path,
+        body_data=json.dumps(body_data),
+        rtype="POST",
+        braincube_name=braincube_name,
+        idempotent=True,
     )
+    if use_cache:
+        request_columns = functools.partial(
+            result_cache.get_or_request, braincube_name, data_path, body_data, request_columns
+        )
+    if parameters.get_parameter("coalesce_requests"):
+        request_columns = functools.partial(
+            cache.get_request_coalescer().run,
+            (braincube_name, data_path, json.dumps(body_data, sort_keys=True)),
+            request_columns,
+        )
+    return _extract_format_data(request_columns(), arrays)
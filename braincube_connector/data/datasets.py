@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+"""Operations on the formatted datasets, dictionaries of columns keyed by variable bcId."""
+
+import itertools
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+import numpy as np
+import pandas as pd
+
+Dataset = Dict[int, Any]
+
+
+class BoundaryDeduplicator(object):
+    """Drop the rows shared by consecutive windows of a partition variable.
+
+    Consecutive windows share their bounds, so the rows whose partition value equals the last
+    value of the previous windows are dropped from the next window.
+    """
+
+    def __init__(self, partition_id: int):
+        """Initialize BoundaryDeduplicator.
+
+        Args:
+            partition_id: bcId of the variable on which the windows are defined.
+        """
+        self._partition_id = partition_id
+        self._last_value: Any = None
+
+    def deduplicate(self, window_dataset: Dataset) -> Dataset:
+        """Remove the rows of a window already received with the previous windows.
+
+        Args:
+            window_dataset: Formatted dataset of the next window.
+
+        Returns:
+            The dataset without the duplicated rows.
+        """
+        partition_values = window_dataset.get(self._partition_id, [])
+        if self._last_value is not None and self._last_value in partition_values:
+            window_dataset = select_rows(
+                window_dataset,
+                [
+                    row
+                    for row, row_value in enumerate(partition_values)
+                    if row_value != self._last_value
+                ],
+            )
+        self._update_last_value(partition_values)
+        return window_dataset
+
+    def _update_last_value(self, partition_values: List[Any]):
+        """Keep the largest partition value received so far.
+
+        Args:
+            partition_values: Partition values of the last window.
+        """
+        partition_values = [row_value for row_value in partition_values if pd.notna(row_value)]
+        if partition_values:
+            self._last_value = max(partition_values)
+
+
+def count_rows(dataset: Dataset) -> int:
+    """Count the rows of a dataset.
+
+    Args:
+        dataset: Formatted dataset.
+
+    Returns:
+        The number of rows.
+    """
+    return len(next(iter(dataset.values()), []))
+
+
+def select_rows(dataset: Dataset, rows: List[int]) -> Dataset:
+    """Keep some rows of a dataset.
+
+    The array columns are indexed as arrays, so that they keep their dtype.
+
+    Args:
+        dataset: Formatted dataset.
+        rows: Positions of the rows to keep.
+
+    Returns:
+        The dataset restricted to the rows.
+    """
+    row_positions = np.asarray(rows, dtype=np.intp)
+    selected_dataset = {}
+    for col_id, col_data in dataset.items():
+        if isinstance(col_data, list):
+            selected_dataset[col_id] = [col_data[row] for row in rows]
+        else:
+            selected_dataset[col_id] = col_data[row_positions]
+    return selected_dataset
+
+
+def select_columns(dataset: Dataset, variable_ids: Iterable[Union[int, str]]) -> Dataset:
+    """Keep the columns of some variables, in the order of the variables.
+
+    Args:
+        dataset: Formatted dataset.
+        variable_ids: bcIds of the variables.
+
+    Returns:
+        The dataset restricted to the variables.
+    """
+    requested_ids = [int(var_id) for var_id in variable_ids]
+    return {var_id: dataset[var_id] for var_id in requested_ids if var_id in dataset}
+
+
+def concatenate(datasets: Iterable[Dataset]) -> Dataset:
+    """Concatenate the rows of several datasets.
+
+    A column missing from a dataset is filled with None, or NaN in a numpy array, for the rows
+    of this dataset. The columns that are numpy arrays, or pandas arrays, in every dataset stay
+    arrays of the same kind.
+
+    Args:
+        datasets: Formatted datasets.
+
+    Returns:
+        The concatenated dataset.
+    """
+    dataset_list = list(datasets)
+    col_ids = dict.fromkeys(itertools.chain.from_iterable(dataset_list))
+    non_empty = [dataset for dataset in dataset_list if count_rows(dataset)]
+    return {col_id: _concatenate_column(col_id, non_empty or dataset_list) for col_id in col_ids}
+
+
+def to_dataframe(dataset: Dataset) -> pd.DataFrame:
+    """Assemble a dataset into a DataFrame.
+
+    The array columns, such as the parsed NUMERIC and DATETIME columns, become the columns of
+    the DataFrame as they are: they are neither copied nor consolidated with the columns of the
+    same dtype. Only the list columns are converted.
+
+    Args:
+        dataset: Formatted dataset.
+
+    Returns:
+        The DataFrame of the dataset.
+    """
+    return pd.DataFrame(dataset, copy=False)
+
+
+def iter_row_batches(dataset: Dataset, batch_size: int) -> Iterator[Dataset]:
+    """Split a dataset into batches of rows.
+
+    Args:
+        dataset: Formatted dataset.
+        batch_size: Maximum number of rows of a batch.
+
+    Yields:
+        The consecutive batches of the dataset.
+    """
+    for batch_start in range(0, count_rows(dataset), batch_size):
+        yield {
+            col_id: col_data[batch_start : batch_start + batch_size]  # noqa: E203
+            for col_id, col_data in dataset.items()
+        }
+
+
+def _concatenate_column(col_id: int, datasets: List[Dataset]) -> Any:
+    """Concatenate the column of a variable, keeping the type of its arrays.
+
+    Args:
+        col_id: bcId of the variable.
+        datasets: Formatted datasets.
+
+    Returns:
+        A numpy array if the column is a numpy array in the datasets, a pandas array if it is a
+        pandas array of the same type in all of them, a list otherwise.
+    """
+    parts = [dataset.get(col_id) for dataset in datasets]
+    present_parts = [part for part in parts if part is not None]
+    if all(isinstance(part, np.ndarray) for part in present_parts):
+        return np.concatenate(_get_parts(col_id, datasets, np.nan))
+    if all(isinstance(part, pd.Categorical) for part in parts):
+        return pd.api.types.union_categoricals(parts)
+    if all(isinstance(part, pd.api.extensions.ExtensionArray) for part in parts):
+        series = [pd.Series(part, copy=False) for part in parts]
+        return pd.concat(series, ignore_index=True).array
+    return list(itertools.chain.from_iterable(_get_parts(col_id, datasets, None)))
+
+
+def _get_parts(col_id: int, datasets: List[Dataset], missing_value: Any) -> List[Any]:
+    """Get the parts of the column of a variable in several datasets.
+
+    Args:
+        col_id: bcId of the variable.
+        datasets: Formatted datasets.
+        missing_value: Value of the rows of the datasets without the column.
+
+    Returns:
+        The column in each dataset, filled with the missing value where it is missing.
+    """
+    return [
+        dataset.get(col_id, list(itertools.repeat(missing_value, count_rows(dataset))))
+        for dataset in datasets
+    ]
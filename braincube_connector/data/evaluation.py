@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""Evaluate the braindata filters on a DataFrame already collected, without new requests."""
+
+import operator
+import types
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from braincube_connector import custom_types
+from braincube_connector.data import conditions, parsing
+
+GATES = types.MappingProxyType({"AND": np.logical_and, "OR": np.logical_or})
+COMPARISONS = types.MappingProxyType(
+    {
+        "EQUALS": operator.eq,
+        "GREAT": operator.gt,
+        "GREAT_EQUALS": operator.ge,
+        "LESS": operator.lt,
+        "LESS_EQUALS": operator.le,
+    },
+)
+
+
+def filter_dataframe(
+    dataframe: pd.DataFrame,
+    filters: "Optional[List[custom_types.FILTER_TYPE]]",
+    labels: Optional[Dict[int, Any]] = None,
+) -> pd.DataFrame:
+    """Keep the rows of a DataFrame matching a list of filters.
+
+    The filters are those of the `get_data` methods, e.g. the conditions of a job, and are
+    evaluated as vectorized masks over the columns. A row whose value is missing does not match
+    the EQUALS, BETWEEN, GREAT and LESS filters.
+
+    Args:
+        dataframe: Data returned by a `get_data` method, with the variables of the filters.
+        filters: List of filters, combined with an AND gate.
+        labels: Column labels by variable bcId, e.g. from `get_variable_index().get_names` for
+                a DataFrame labelled with the variable names. Default: the columns are the bcIds.
+
+    Returns:
+        The matching rows of the DataFrame.
+    """
+    if not filters:
+        return dataframe
+    return dataframe[get_mask(dataframe, {"AND": filters}, labels)]
+
+
+def get_mask(
+    dataframe: pd.DataFrame,
+    data_filter: "custom_types.FILTER_TYPE",
+    labels: Optional[Dict[int, Any]] = None,
+) -> np.ndarray:
+    """Evaluate a filter on the rows of a DataFrame.
+
+    Args:
+        dataframe: Data returned by a `get_data` method, with the variables of the filter.
+        data_filter: An EQUALS, BETWEEN, GREAT, GREAT_EQUALS, LESS, LESS_EQUALS, NOT, AND or OR
+                     filter.
+        labels: Column labels by variable bcId. Default: the columns are the bcIds.
+
+    Returns:
+        A boolean array, True for the rows matching the filter.
+    """
+    filter_type, arguments = next(iter(data_filter.items()))
+    filter_type = filter_type.upper()
+    gate = GATES.get(filter_type)
+    if gate is not None:
+        operands = conditions.flatten_filters(arguments, filter_type)
+        return gate.reduce([get_mask(dataframe, operand, labels) for operand in operands])
+    elif filter_type == "NOT":
+        return ~get_mask(dataframe, arguments[0], labels)
+    return _get_variable_mask(filter_type, _get_column(dataframe, arguments[0], labels), arguments)
+
+
+def _get_variable_mask(filter_type: str, column: pd.Series, arguments: List[Any]) -> np.ndarray:
+    """Evaluate a filter on the values of a variable.
+
+    Args:
+        filter_type: Type of the filter.
+        column: Column of the filter variable.
+        arguments: Arguments of the filter, the long id of the variable then its values.
+
+    Returns:
+        A boolean array, True for the rows matching the filter.
+
+    Raises:
+        ValueError: The filter type is not supported.
+    """
+    comparison = COMPARISONS.get(filter_type)
+    if filter_type == "EQUALS" and isinstance(arguments[1], list):
+        matches = column.isin(arguments[1])
+    elif filter_type == "BETWEEN":
+        lower, upper = arguments[1:3]
+        matches = column.between(_to_bound(column, lower), _to_bound(column, upper))
+    elif comparison is None:
+        raise ValueError("Unsupported filter type: {0}".format(filter_type))
+    else:
+        matches = comparison(column, _to_bound(column, arguments[1]))
+    return matches.to_numpy(dtype=bool)
+
+
+def _get_column(dataframe: pd.DataFrame, long_id: str, labels: Optional[Dict[int, Any]]):
+    """Find the column of a filter variable.
+
+    Args:
+        dataframe: Filtered DataFrame.
+        long_id: Long id 'mb{mb_id}/d{var_id}' of the variable.
+        labels: Column labels by variable bcId, None if the columns are the bcIds.
+
+    Returns:
+        The column of the variable, as a Series.
+
+    Raises:
+        KeyError: The variable is not a column of the DataFrame.
+    """
+    bcid = int(str(long_id).split("/d")[-1])
+    label = bcid if labels is None else labels.get(bcid)
+    if label not in dataframe.columns:
+        raise KeyError("The variable {0} is not a column of the DataFrame.".format(long_id))
+    return dataframe[label]
+
+
+def _to_bound(column: pd.Series, bound: Any) -> Any:
+    """Convert a filter value to the type of a column.
+
+    Args:
+        column: Column of the filter variable.
+        bound: Value of the filter, a '%Y%m%d_%H%M%S' string for a DATETIME variable.
+
+    Returns:
+        A Timestamp for a parsed DATETIME column, the value otherwise.
+    """
+    if isinstance(bound, str) and pd.api.types.is_datetime64_any_dtype(column):
+        bound = parsing.parse_datetime_array([bound])[0]
+        if getattr(column.dtype, "tz", None) is None:
+            bound = bound.tz_localize(None)
+    return bound
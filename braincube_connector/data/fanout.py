@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""Collect the data of several memory bases, possibly on several braincubes, concurrently."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from braincube_connector import custom_types, parallel, parameters, timeouts
+
+MemoryBaseQuery = Tuple[
+    "MemoryBase",  # type: ignore  # noqa
+    Sequence[Union[int, str]],
+    Optional[List[custom_types.FILTER_TYPE]],
+]
+
+
+def get_data_across(
+    queries: Sequence[MemoryBaseQuery],
+    label_type: str = "bcid",
+    dataframe: bool = False,
+    deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+    max_requests: Optional[int] = None,
+) -> Dict[Any, custom_types.DATA_TYPE]:
+    """Get the data of several memory bases at the same time.
+
+    The memory bases are processed concurrently, and all their data requests, including the
+    column chunks of each memory base, share a bound on the number of requests in progress.
+
+    Args:
+        queries: Memory base, variable bcIds and filters of each query, e.g. the same variables
+                 on the memory bases of several braincubes.
+        label_type: "bcid" / "name"
+        dataframe: True, return Dataframes; False, return Dicts
+        deadline: Time budget in seconds (or Deadline) shared by all the requests.
+        max_requests: Maximum number of data requests in progress. Default: the
+                      `fanout_max_requests` parameter.
+
+    Returns:
+        The data of each query, a dictionary of data list or a pandas DataFrame, keyed by
+        memory base.
+
+    Raises:
+        ValueError: A memory base is queried twice, see `MemoryBase.get_data_many`.
+    """
+    memory_bases = [query[0] for query in queries]
+    if len({id(memory_base) for memory_base in memory_bases}) < len(memory_bases):
+        raise ValueError("A memory base can only be queried once, use get_data_many.")
+    max_requests = max_requests or parameters.get_parameter("fanout_max_requests")
+    deadline = timeouts.to_deadline(deadline)
+    with parallel.concurrency_scope(max_requests):
+        query_data = parallel.map_in_order(
+            lambda query: query[0].get_data(
+                query[1], query[2], label_type=label_type, dataframe=dataframe, deadline=deadline
+            ),
+            queries,
+            max_requests,
+        )
+    return dict(zip(memory_bases, query_data))
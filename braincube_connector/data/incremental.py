@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""Poll the data of a memory base for the rows recorded since the previous request."""
+
+from typing import Any, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from braincube_connector import custom_types, timeouts
+from braincube_connector.data import chunks, conditions, data, datasets, parsing
+
+MS_UNIT = "ms"
+
+
+class IncrementalQuery(object):
+    """A query of memory base data returning only the rows it has not returned yet.
+
+    The query remembers the highest value of the order variable it has received. The next
+    requests add a GREAT filter on this value, so that only the new rows are transferred. The
+    requests are never answered from the result cache, whose responses would miss the rows
+    recorded since they were cached.
+    """
+
+    def __init__(
+        self,
+        memory_base: "MemoryBase",  # type: ignore  # noqa
+        variable_ids: "List[Union[int, str]]",
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        last_value: Optional[float] = None,
+        keep_rows: bool = False,
+    ):
+        """Initialize IncrementalQuery.
+
+        Args:
+            memory_base: A memory base on which to collect the data.
+            variable_ids: bcIds of variables for which the data are collected.
+            filters: List of filters to apply to the request.
+            last_value: Order value of the last row already received, a timestamp in ms for a
+                        DATETIME order variable. Default: all the rows are new.
+            keep_rows: Append the new rows of each request to a local store, see `get_rows`.
+        """
+        self._memory_base = memory_base
+        self._variable_ids = [int(var_id) for var_id in variable_ids]
+        self._filters = list(filters or [])
+        self._last_value = last_value
+        self._rows: Optional[datasets.Dataset] = {} if keep_rows else None
+
+    def fetch(
+        self, deadline: "Optional[Union[float, timeouts.Deadline]]" = None
+    ) -> datasets.Dataset:
+        """Request the rows recorded since the previous request.
+
+        Args:
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+
+        Returns:
+            The new rows, as a dictionary of data lists keyed by variable bcId.
+        """
+        with timeouts.deadline_scope(deadline):
+            order_var = self._memory_base.get_variable_types().get_variable(
+                chunks.get_order_bcid(self._memory_base.get_order_variable_long_id())
+            )
+            new_rows = self._keep_new_rows(
+                data.collect_data(
+                    self._get_requested_ids(int(order_var.get_bcid())),
+                    self._memory_base,
+                    self._get_filters(order_var),
+                    use_cache=False,
+                ),
+                order_var,
+            )
+        new_rows = datasets.select_columns(new_rows, self._variable_ids)
+        if self._rows is not None:
+            self._rows = datasets.concatenate([self._rows, new_rows])
+        return new_rows
+
+    def get_last_value(self) -> Optional[float]:
+        """Get the order value of the last row received.
+
+        Returns:
+            The highest order value received, a timestamp in ms for a DATETIME order variable.
+            Saving it lets a new query resume from there.
+        """
+        return self._last_value
+
+    def get_rows(self) -> datasets.Dataset:
+        """Get all the rows received by the query.
+
+        Returns:
+            The rows appended to the local store, as a dictionary of data lists.
+
+        Raises:
+            ValueError: The query does not keep its rows.
+        """
+        if self._rows is None:
+            raise ValueError("The query was created without keep_rows.")
+        return self._rows
+
+    def _get_requested_ids(self, order_id: int) -> List[int]:
+        """Add the order variable to the requested variables if it is missing.
+
+        Args:
+            order_id: bcId of the order variable.
+
+        Returns:
+            The bcIds of the variables to request.
+        """
+        if order_id in self._variable_ids:
+            return self._variable_ids
+        return [*self._variable_ids, order_id]
+
+    def _get_filters(
+        self, order_var: "VariableDescription"  # type: ignore  # noqa
+    ) -> "List[custom_types.FILTER_TYPE]":
+        """Add a filter on the order variable to the filters of the query.
+
+        Args:
+            order_var: Order variable of the memory base.
+
+        Returns:
+            The filters of the request.
+        """
+        if self._last_value is None:
+            return self._filters
+        order_filter = conditions.build_range_filter(order_var, minimum=self._last_value)
+        return [*self._filters, order_filter] if order_filter else self._filters
+
+    def _keep_new_rows(
+        self, dataset: datasets.Dataset, order_var: "VariableDescription"  # type: ignore  # noqa
+    ) -> datasets.Dataset:
+        """Drop the rows already received, and remember the highest order value.
+
+        Args:
+            dataset: Rows returned by the request, with the order variable.
+            order_var: Order variable of the memory base.
+
+        Returns:
+            The rows whose order value is above the previous highest value.
+        """
+        order_values = to_order_values(
+            dataset.get(int(order_var.get_bcid()), []), order_var.get_type()
+        )
+        if self._last_value is not None:
+            are_new = order_values > self._last_value
+            dataset = datasets.select_rows(dataset, np.flatnonzero(are_new).tolist())
+            order_values = order_values[are_new]
+        if np.any(~np.isnan(order_values)):
+            self._last_value = np.nanmax(order_values).item()
+        return dataset
+
+
+def to_order_values(col_data: Any, var_type: str) -> np.ndarray:
+    """Convert an order column to numbers comparable with the range filters.
+
+    Args:
+        col_data: Order column, as formatted with any `parse_date` parameter.
+        var_type: Type of the order variable.
+
+    Returns:
+        A float64 array of the values, timestamps in ms for a DATETIME variable. The missing
+        values are NaN.
+    """
+    if var_type != "DATETIME":
+        return np.array(col_data, dtype=np.float64)
+    if any(isinstance(row_value, str) for row_value in col_data):
+        col_data = parsing.parse_datetime_array(col_data)
+    datetimes = pd.DatetimeIndex(col_data)
+    if datetimes.tz is None:
+        datetimes = datetimes.tz_localize("UTC")
+    timestamps = datetimes.as_unit(MS_UNIT).asi8.astype(np.float64)
+    timestamps[datetimes.isna()] = np.nan
+    return timestamps
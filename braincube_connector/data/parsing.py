@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""Vectorized parsers of the braindata columns."""
+
+from typing import Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATE_TEMPLATE = "YYYYmmdd_HHMMSS"
+EPOCH_YEAR = 1970
+ONE_DAY = np.timedelta64(1, "D")
+MIN_DAY = np.datetime64(pd.Timestamp.min.date()) + ONE_DAY
+MAX_DAY = np.datetime64(pd.Timestamp.max.date()) - ONE_DAY
+_ZERO = np.uint8(ord("0"))
+# One character per column of the digit matrices, the last one is beyond the date.
+_TEMPLATE_COLUMNS = np.array(list("{0} ".format(DATE_TEMPLATE)))
+# Digit values expected in the other columns: the separator, then no character beyond the date.
+_SEPARATOR_DIGITS = np.frombuffer(b"_\x00", dtype=np.uint8) - _ZERO
+
+
+def parse_numeric_array(col_data: List[Any]) -> np.ndarray:
+    """Parse a NUMERIC column to an int64 array, or to a float64 array when needed.
+
+    The column falls back to floats when a value is not written as an integer, e.g. "2.0" or
+    "NaN", as with `int` on each value. The type of a column thus depends on the format of its
+    variable and not on the values of its rows.
+
+    Args:
+        col_data: The column data to parse.
+
+    Returns:
+        An int64 array if all the values are written as integers, a float64 array otherwise.
+    """
+    try:
+        return np.array(col_data, dtype=np.int64)
+    except (ValueError, OverflowError):
+        return np.array(col_data, dtype=np.float64)
+
+
+def parse_datetime_array(col_data: List[Any]) -> pd.arrays.DatetimeArray:
+    """Parse a DATETIME column of '%Y%m%d_%H%M%S' strings to a datetime64[ns, UTC] array.
+
+    The strings are read as a matrix of digits, so that the whole column is converted with a
+    few numpy operations.
+
+    Args:
+        col_data: The column data to parse.
+
+    Returns:
+        A datetime64[ns, UTC] array, with NaT for the values that are not valid dates.
+    """
+    digits = _to_digit_matrix(col_data)
+    datetimes, valid = _read_datetimes(digits)
+    valid &= _is_well_formed(digits)
+    return pd.DatetimeIndex(datetimes, tz="UTC").where(valid).array
+
+
+def parse_discrete_array(col_data: List[Any]) -> pd.Categorical:
+    """Encode a DISCRETE column as a categorical array.
+
+    Each modality is stored once, the rows only hold the integer code of their modality.
+
+    Args:
+        col_data: The column data to encode.
+
+    Returns:
+        A categorical array, with NaN for the missing values.
+    """
+    return pd.Categorical(col_data)
+
+
+def to_list(col_data: Any) -> List[Any]:
+    """Convert a column read as an array, e.g. from the result cache, to a list.
+
+    Args:
+        col_data: The column data, a list or an array.
+
+    Returns:
+        The column as a new list, so that a response shared by several requests is never
+        modified in place.
+    """
+    if isinstance(col_data, np.ndarray):
+        return col_data.tolist()
+    return list(col_data)
+
+
+def _to_digit_matrix(col_data: List[Any]) -> np.ndarray:
+    """Convert date strings to a matrix of digits, one row per string.
+
+    Args:
+        col_data: The column data to convert.
+
+    Returns:
+        The value of each character as a uint8 digit, the characters that are not digits give
+        values above 9. The matrix has a last column for the characters beyond the date.
+    """
+    chars_dtype = "S{0}".format(len(_TEMPLATE_COLUMNS))
+    try:
+        chars = np.array(col_data, dtype=chars_dtype)
+    except UnicodeEncodeError:
+        chars = np.array(
+            [row_value if str(row_value).isascii() else "" for row_value in col_data],
+            dtype=chars_dtype,
+        )
+    return chars.view(np.uint8).reshape(-1, chars.itemsize) - _ZERO
+
+
+def _read_number(digits: np.ndarray, field: str) -> np.ndarray:
+    """Read the numbers of a field of the date template in a digit matrix.
+
+    Args:
+        digits: Matrix of digits.
+        field: Character of the field in `DATE_TEMPLATE`.
+
+    Returns:
+        The numbers of each row.
+    """
+    field_digits = digits.compress(_TEMPLATE_COLUMNS == field, axis=1)
+    weights = 10 ** np.arange(field_digits.shape[1])
+    return field_digits @ np.flip(weights)
+
+
+def _read_datetimes(digits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the dates and times of a digit matrix.
+
+    Args:
+        digits: Matrix of digits.
+
+    Returns:
+        A datetime64[ns] array, and whether each date and time is valid.
+    """
+    days, valid_days = _read_days(digits)
+    times, valid_times = _read_times(digits)
+    return days.astype("datetime64[ns]") + times, valid_days & valid_times
+
+
+def _read_days(digits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the dates of a digit matrix.
+
+    Args:
+        digits: Matrix of digits.
+
+    Returns:
+        A datetime64[D] array, and whether each date is valid: the month and the day do not
+        overflow and the date fits in a datetime64[ns].
+    """
+    years = (_read_number(digits, "Y") - EPOCH_YEAR).astype("datetime64[Y]")
+    months = years + (_read_number(digits, "m") - 1).astype("timedelta64[M]")
+    days = months + (_read_number(digits, "d") - 1).astype("timedelta64[D]")
+    valid = months.astype("datetime64[Y]") == years
+    valid &= days.astype("datetime64[M]") == months
+    return days, valid & (days >= MIN_DAY) & (days <= MAX_DAY)
+
+
+def _read_times(digits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Read the times of the day of a digit matrix.
+
+    Args:
+        digits: Matrix of digits.
+
+    Returns:
+        A timedelta64 array, and whether each time is valid.
+    """
+    hours, minutes, seconds = (_read_number(digits, field) for field in "HMS")
+    times = hours.astype("timedelta64[h]") + minutes.astype("timedelta64[m]")
+    valid = (hours < 24) & (minutes < 60) & (seconds < 60)
+    return times + seconds.astype("timedelta64[s]"), valid
+
+
+def _is_well_formed(digits: np.ndarray) -> np.ndarray:
+    """Check that the rows of a digit matrix follow the date template.
+
+    Args:
+        digits: Matrix of digits.
+
+    Returns:
+        True for the rows with digits in the fields, the separators of the template and
+        nothing beyond.
+    """
+    is_field = np.char.isalpha(_TEMPLATE_COLUMNS)
+    field_digits = digits.compress(is_field, axis=1)
+    well_formed = np.all(field_digits <= 9, axis=1)
+    separators = digits.compress(~is_field, axis=1)
+    return well_formed & np.all(separators == _SEPARATOR_DIGITS, axis=1)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""Split the braindata requests of long histories into windows of the order variable."""
+
+import functools
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple, Union
+
+from braincube_connector import custom_types, parallel, parameters
+from braincube_connector.data import chunks, conditions, data, datasets
+
+WINDOW_GROWTH_LIMIT = 2
+
+Bound = Union[datetime, float]
+Window = Tuple[float, float]
+
+
+def to_bound(bound: Union[datetime, timedelta, float]) -> float:
+    """Convert a window bound or a window size to the unit of the range filters.
+
+    Args:
+        bound: A datetime, in UTC when it is naive, a timedelta or a number.
+
+    Returns:
+        The bound in ms for datetimes and timedeltas, the bound itself otherwise.
+    """
+    if isinstance(bound, datetime):
+        if bound.tzinfo is None:
+            bound = bound.replace(tzinfo=timezone.utc)
+        return bound.timestamp() * 1000
+    if isinstance(bound, timedelta):
+        return bound.total_seconds() * 1000
+    return bound
+
+
+def collect_partitioned_data(  # noqa: WPS211
+    variable_ids: List[int],
+    memory_base: "MemoryBase",  # type: ignore  # noqa
+    start: Bound,
+    end: Bound,
+    window: Union[timedelta, float],
+    filters: Optional[List[custom_types.FILTER_TYPE]] = None,
+    partition_id: Optional[int] = None,
+    arrays: bool = False,
+) -> datasets.Dataset:
+    """Get data from a memory base by windows of a variable.
+
+    Args:
+        variable_ids: bcIds of variables for which the data are collected.
+        memory_base: A memory base on which to collect the data.
+        start: Start of the first window, a datetime or a timestamp in ms for a DATETIME
+               variable.
+        end: End of the last window.
+        window: Initial size of the windows, a timedelta or a duration in ms for a DATETIME
+                variable.
+        filters: List of filter to apply to the request.
+        partition_id: bcId of the variable on which the windows are defined. Default: the
+                      order variable of the memory base.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+
+    Returns:
+        A dictionary of data list.
+    """
+    window_datasets = iter_partitioned_data(
+        variable_ids, memory_base, start, end, window, filters, partition_id, arrays
+    )
+    return datasets.select_columns(datasets.concatenate(window_datasets), variable_ids)
+
+
+def iter_partitioned_data(  # noqa: WPS210, WPS211
+    variable_ids: List[int],
+    memory_base: "MemoryBase",  # type: ignore  # noqa
+    start: Bound,
+    end: Bound,
+    window: Union[timedelta, float],
+    filters: Optional[List[custom_types.FILTER_TYPE]] = None,
+    partition_id: Optional[int] = None,
+    arrays: bool = False,
+) -> Iterator[datasets.Dataset]:
+    """Get data from a memory base window after window.
+
+    Up to `data_workers` windows are requested at the same time, each one restricted to its
+    range with a BETWEEN filter. After each round of requests, the window size is scaled so
+    that a window holds about `partition_max_rows` rows.
+
+    Args:
+        variable_ids: bcIds of variables for which the data are collected.
+        memory_base: A memory base on which to collect the data.
+        start: Start of the first window, a datetime or a timestamp in ms for a DATETIME
+               variable.
+        end: End of the last window.
+        window: Initial size of the windows, a timedelta or a duration in ms for a DATETIME
+                variable.
+        filters: List of filter to apply to the request.
+        partition_id: bcId of the variable on which the windows are defined. Default: the
+                      order variable of the memory base.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+
+    Yields:
+        The dataset of each window, in order, without the rows of the previous windows.
+
+    Raises:
+        ValueError: The window size is not positive.
+    """
+    window_size = to_bound(window)
+    if window_size <= 0:
+        raise ValueError("The window size must be positive.")
+    if partition_id is None:
+        partition_id = chunks.get_order_bcid(memory_base.get_order_variable_long_id())
+    collect_window = functools.partial(
+        _collect_window,
+        _add_variable(variable_ids, int(partition_id)),
+        memory_base,
+        filters or [],
+        memory_base.get_variable_types().get_variable(partition_id),
+        arrays,
+    )
+    deduplicator = datasets.BoundaryDeduplicator(int(partition_id))
+    windows = get_windows(to_bound(start), to_bound(end), window_size)
+    while windows:
+        window_datasets = parallel.map_in_order(
+            collect_window, windows, parameters.get_parameter("data_workers")
+        )
+        window_size = adapt_window_size(window_size, window_datasets, int(partition_id))
+        for window_dataset in window_datasets:
+            yield datasets.select_columns(deduplicator.deduplicate(window_dataset), variable_ids)
+        windows = get_windows(windows[-1][1], to_bound(end), window_size)
+
+
+def get_windows(start: float, end: float, window_size: float) -> List[Window]:
+    """Get the next round of windows to request.
+
+    Args:
+        start: Start of the first window.
+        end: End of the range.
+        window_size: Size of the windows.
+
+    Returns:
+        Up to `data_workers` consecutive windows, the last one ending at most at `end`.
+    """
+    n_windows = max(parameters.get_parameter("data_workers"), 1)
+    windows: List[Window] = []
+    while start < end and len(windows) < n_windows:
+        windows.append((start, min(start + window_size, end)))
+        start = windows[-1][1]
+    return windows
+
+
+def adapt_window_size(
+    window_size: float, window_datasets: List[datasets.Dataset], partition_id: int
+) -> float:
+    """Scale the window size to the number of rows received.
+
+    Args:
+        window_size: Size of the last windows.
+        window_datasets: Datasets received for the last windows.
+        partition_id: bcId of the variable on which the windows are defined.
+
+    Returns:
+        The size for which the largest window would have held `partition_max_rows` rows, at
+        most `WINDOW_GROWTH_LIMIT` times the current size.
+    """
+    max_rows = max(len(window_dataset.get(partition_id, [])) for window_dataset in window_datasets)
+    if not max_rows:
+        return window_size * WINDOW_GROWTH_LIMIT
+    scale = parameters.get_parameter("partition_max_rows") / max_rows
+    return window_size * min(scale, WINDOW_GROWTH_LIMIT)
+
+
+def _collect_window(
+    variable_ids: List[int],
+    memory_base: "MemoryBase",  # type: ignore  # noqa
+    filters: List[custom_types.FILTER_TYPE],
+    partition_var: "VariableDescription",  # type: ignore  # noqa
+    arrays: bool,
+    window: Window,
+) -> datasets.Dataset:
+    """Get the data of a window.
+
+    Args:
+        variable_ids: bcIds of variables for which the data are collected.
+        memory_base: A memory base on which to collect the data.
+        filters: List of filter to apply to the request.
+        partition_var: Variable on which the windows are defined.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+        window: Start and end of the window.
+
+    Returns:
+        A dictionary of data list.
+    """
+    window_filter = conditions.build_range_filter(partition_var, *window)
+    if window_filter:
+        filters = [*filters, window_filter]
+    return data.collect_data(variable_ids, memory_base, filters, arrays)
+
+
+def _add_variable(variable_ids: List[int], added_id: int) -> List[int]:
+    """Add a variable to the requested ones if it is missing.
+
+    Args:
+        variable_ids: bcIds of the requested variables.
+        added_id: bcId of the variable to add.
+
+    Returns:
+        The bcIds of the variables to request.
+    """
+    requested_ids = [int(var_id) for var_id in variable_ids]
+    if added_id not in requested_ids:
+        requested_ids.append(added_id)
+    return requested_ids
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+"""Plan the data requests of several queries on a memory base."""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from braincube_connector import custom_types, parallel, parameters
+from braincube_connector.data import conditions, data, datasets
+
+Filters = Optional[List[custom_types.FILTER_TYPE]]
+VarIds = Sequence[Union[int, str]]
+Query = Tuple[VarIds, Filters]
+Request = Tuple[Filters, List[int]]
+
+
+def plan_requests(queries: Sequence[Query]) -> Dict[str, Request]:
+    """Merge the queries sharing a filter into a single request.
+
+    Args:
+        queries: Variable bcIds and filters of the queries.
+
+    Returns:
+        The filters and the union of the variables of each request, keyed by filter.
+    """
+    requests: Dict[str, Request] = {}
+    for query_ids, query_filters in queries:
+        filter_key = get_filter_key(query_filters)
+        request = requests.get(filter_key, (query_filters, []))
+        requests[filter_key] = (request[0], _merge_ids(request[1], query_ids))
+    return requests
+
+
+def get_filter_key(filters: Filters) -> str:
+    """Compute a key identifying a list of filters.
+
+    Args:
+        filters: List of filters of a query.
+
+    Returns:
+        The json of the combined filter, identical for the filter lists selecting the same rows
+        once combined, e.g. with duplicate filters.
+    """
+    return json.dumps(conditions.combine_filters(filters), sort_keys=True)
+
+
+def collect_many(
+    memory_base: "MemoryBase",  # type: ignore  # noqa
+    queries: Sequence[Query],
+    arrays: bool = False,
+) -> List[datasets.Dataset]:
+    """Get the data of several queries with one request per distinct filter.
+
+    The requests of the different filters are sent concurrently, up to `data_workers` at the
+    same time, then the columns of each query are taken from the dataset of its filter. A
+    column already given to a previous query is copied, so that the queries never share a
+    column.
+
+    Args:
+        memory_base: A memory base on which to collect the data.
+        queries: Variable bcIds and filters of the queries.
+        arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+
+    Returns:
+        The datasets of the queries, in the order of the queries.
+    """
+    requests = plan_requests(queries)
+    request_datasets = parallel.map_in_order(
+        lambda request: data.collect_data(request[1], memory_base, request[0], arrays),
+        requests.values(),
+        parameters.get_parameter("data_workers"),
+    )
+    filter_datasets: Dict[str, Any] = dict(zip(requests, request_datasets))
+    return _copy_shared_columns(
+        [
+            datasets.select_columns(filter_datasets[get_filter_key(filters)], var_ids)
+            for var_ids, filters in queries
+        ]
+    )
+
+
+def _merge_ids(request_ids: List[int], query_ids: VarIds) -> List[int]:
+    """Add the variables of a query to a request.
+
+    Args:
+        request_ids: bcIds of the variables of the request.
+        query_ids: bcIds of the variables of the query.
+
+    Returns:
+        The bcIds of the request, followed by the new ones of the query.
+    """
+    merged_ids = dict.fromkeys(request_ids)
+    merged_ids.update(dict.fromkeys(map(int, query_ids)))
+    return list(merged_ids)
+
+
+def _copy_shared_columns(query_datasets: List[datasets.Dataset]) -> List[datasets.Dataset]:
+    """Copy the columns selected by several queries, except for the first of them.
+
+    Args:
+        query_datasets: Datasets of the queries, selected from the datasets of the requests.
+
+    Returns:
+        The datasets of the queries, each one with its own columns.
+    """
+    given_columns: Set[int] = set()
+    own_datasets = []
+    for query_dataset in query_datasets:
+        own_datasets.append(
+            {
+                col_id: col_data.copy() if id(col_data) in given_columns else col_data
+                for col_id, col_data in query_dataset.items()
+            }
+        )
+        given_columns.update(map(id, query_dataset.values()))
+    return own_datasets
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk cache of the braindata responses, stored as memory-mapped columns."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from braincube_connector import cache, parameters
+
+MANIFEST_FILE = "manifest.json"
+DATADEFS = "datadefs"
+DATACOL = "data"
+
+Json = Dict[str, Any]
+
+_stats = cache.CacheStats()
+
+
+def get_or_request(
+    braincube_name: str, data_path: str, body_data: Json, request: Callable[[], Json]
+) -> Json:
+    """Answer a braindata request from the result cache, or send it and cache its response.
+
+    The cache is enabled by the `result_cache_dir` parameter. The responses are keyed by
+    braincube, memory base, variable set and filter, and the least recently used ones are
+    evicted beyond `result_cache_max_size` bytes. The responses have no age limit, so a request
+    without an upper bound on the order variable misses the rows recorded since it was cached.
+
+    Args:
+        braincube_name: Name of the braincube on which the request is made.
+        data_path: Path of the request.
+        body_data: Body of the request.
+        request: Function sending the request.
+
+    Returns:
+        The braindata response, with memory-mapped columns when it comes from the cache. The
+        columns are in the order of the definitions of the request.
+    """
+    cache_dir = parameters.get_parameter("result_cache_dir")
+    if not cache_dir:
+        return request()
+    entry_dir = os.path.join(cache_dir, get_key(braincube_name, data_path, body_data))
+    try:
+        raw_dataset = _read_entry(entry_dir, body_data.get("definitions", []))
+    except (OSError, ValueError):
+        _stats.record_miss()
+    else:
+        _stats.record_hit()
+        return raw_dataset
+    raw_dataset = request()
+    _write_entry(cache_dir, entry_dir, raw_dataset)
+    _evict(cache_dir, parameters.get_parameter("result_cache_max_size"))
+    return raw_dataset
+
+
+def get_key(braincube_name: str, data_path: str, body_data: Json) -> str:
+    """Compute the key of a braindata request.
+
+    The key does not depend on the order of the variables nor on the layout of the filter.
+
+    Args:
+        braincube_name: Name of the braincube on which the request is made.
+        data_path: Path of the request.
+        body_data: Body of the request.
+
+    Returns:
+        A hexadecimal digest of the request.
+    """
+    normalized_body = dict(body_data, definitions=sorted(body_data.get("definitions", [])))
+    request_json = json.dumps(
+        [braincube_name, data_path, normalized_body], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(request_json.encode("utf-8")).hexdigest()
+
+
+def get_result_cache_stats() -> Dict[str, int]:
+    """Get the counters of the result cache.
+
+    Returns:
+        The number of hits, i.e. the requests saved by the cache, and of misses.
+    """
+    return _stats.get_stats()
+
+
+def clear_result_cache():
+    """Delete all the responses of the result cache."""
+    cache_dir = parameters.get_parameter("result_cache_dir")
+    if cache_dir:
+        _evict(cache_dir, 0)
+
+
+def _read_entry(entry_dir: str, definitions: List[str]) -> Json:
+    """Read a cached response, memory-mapping its columns.
+
+    The response may have been cached for a request listing the same variables in another
+    order, so the columns are put back in the order of the definitions.
+
+    Args:
+        entry_dir: Directory of the cached response.
+        definitions: Long ids of the requested variables.
+
+    Returns:
+        The braindata response.
+    """
+    with open(os.path.join(entry_dir, MANIFEST_FILE), encoding="utf-8") as manifest_file:
+        columns = json.load(manifest_file)
+    datadefs = [columns.pop(var_id) for var_id in definitions if var_id in columns]
+    datadefs.extend(columns.values())
+    for datadef in datadefs:
+        if "file" in datadef:
+            column_path = os.path.join(entry_dir, datadef.pop("file"))
+            datadef[DATACOL] = np.load(column_path, mmap_mode="r")
+    os.utime(entry_dir)
+    return {DATADEFS: datadefs}
+
+
+def _write_entry(cache_dir: str, entry_dir: str, raw_dataset: Json):
+    """Write a response to the cache, one file per column.
+
+    The columns of strings or numbers are stored as numpy files, the others in the manifest,
+    where the columns are keyed by the long id of their variable. The entry is written in a
+    temporary directory, then renamed, so that a concurrent reader never sees a partial entry.
+
+    Args:
+        cache_dir: Directory of the cache.
+        entry_dir: Directory of the cached response.
+        raw_dataset: The braindata response.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=cache_dir, prefix=".tmp")
+    columns: Json = {}
+    for col_index, datadef in enumerate(raw_dataset[DATADEFS]):
+        columns[datadef["id"]] = _write_column(tmp_dir, "{0}.npy".format(col_index), datadef)
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), "w", encoding="utf-8") as manifest_file:
+        json.dump(columns, manifest_file)
+    try:
+        os.rename(tmp_dir, entry_dir)
+    except OSError:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _write_column(tmp_dir: str, column_file: str, datadef: Json) -> Json:
+    """Write the data of a column to a numpy file, when it is not empty and has a fixed size dtype.
+
+    Args:
+        tmp_dir: Directory of the entry being written.
+        column_file: Name of the numpy file.
+        datadef: Definition and data of the column.
+
+    Returns:
+        The definition of the column stored in the manifest.
+    """
+    manifest_def = {key: col_value for key, col_value in datadef.items() if key != DATACOL}
+    if DATACOL not in datadef:
+        return manifest_def
+    col_array = np.asarray(datadef[DATACOL])
+    if col_array.dtype.hasobject or not col_array.size:
+        manifest_def[DATACOL] = datadef[DATACOL]
+        return manifest_def
+    np.save(os.path.join(tmp_dir, column_file), col_array)
+    manifest_def["file"] = column_file
+    return manifest_def
+
+
+def _evict(cache_dir: str, max_size: Optional[int]):
+    """Delete the least recently used responses until the cache fits in a size.
+
+    Args:
+        cache_dir: Directory of the cache.
+        max_size: Maximum size of the cache in bytes, None for no limit.
+    """
+    if max_size is None or not os.path.isdir(cache_dir):
+        return
+    entries = [
+        (dir_entry.stat().st_mtime, _get_size(dir_entry.path), dir_entry.path)
+        for dir_entry in os.scandir(cache_dir)
+        if dir_entry.is_dir() and not dir_entry.name.startswith(".")
+    ]
+    total_size = sum(entry_info[1] for entry_info in entries)
+    for _, entry_size, entry_path in sorted(entries):
+        if total_size <= max_size:
+            return
+        shutil.rmtree(entry_path, ignore_errors=True)
+        total_size -= entry_size
+
+
+def _get_size(entry_dir: str) -> int:
+    """Compute the size of a cached response.
+
+    Args:
+        entry_dir: Directory of the cached response.
+
+    Returns:
+        The size of its files in bytes.
+    """
+    return sum(entry.stat().st_size for entry in os.scandir(entry_dir))
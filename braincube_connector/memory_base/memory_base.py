@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional, Union
+import functools
+from datetime import timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
 
-from braincube_connector import custom_types
+from braincube_connector import cache, custom_types, parameters, timeouts
 from braincube_connector.bases import base_entity, resource_getter
-from braincube_connector.data import data
+from braincube_connector.data import data, datasets, incremental, partition, planner
+from braincube_connector.memory_base import variable_index, variable_types
 from braincube_connector.memory_base.nested_resources import datagroup, event, job, rule, variable
 
 
@@ -17,6 +20,18 @@ class MemoryBase(base_entity.BaseEntity, resource_getter.ResourceGetter):
     request_one_path = "extended"
     request_many_path = "{webservice}/mb/all/summary"
 
+    def initialize(self, *args, **kwargs):
+        """Initialize MemoryBase.
+
+        Args:
+            *args: Positional arguments of `BaseEntity.initialize`.
+            **kwargs: Keyword arguments of `BaseEntity.initialize`.
+        """
+        super().initialize(*args, **kwargs)
+        self._braindata_info = cache.TimedValue(self._request_braindata_info)
+        self._variable_index = variable_index.VariableIndex(self)
+        self._variable_types = variable_types.VariableTypes(self)
+
     def get_variable(self, bcid: Union[str, int]) -> variable.VariableDescription:
         """Get a variable description from its bcId.
 
@@ -39,6 +54,22 @@ class MemoryBase(base_entity.BaseEntity, resource_getter.ResourceGetter):
         """
         return self._get_resource_list(variable.VariableDescription, **kwargs)
 
+    def get_variable_index(self) -> variable_index.VariableIndex:
+        """Get the index of the variable names of the memory base.
+
+        Returns:
+            The variable index, shared by the requests made on the memory base.
+        """
+        return self._variable_index
+
+    def get_variable_types(self) -> variable_types.VariableTypes:
+        """Get the cache of the variable descriptions of the memory base, with their types.
+
+        Returns:
+            The variable types, shared by the requests made on the memory base.
+        """
+        return self._variable_types
+
     def get_job(self, bcid: Union[str, int]) -> job.JobDescription:
         """Get a job description from its bcId.
 
@@ -133,8 +164,9 @@ class MemoryBase(base_entity.BaseEntity, resource_getter.ResourceGetter):
         self,
         var_ids: "List[Union[int,str]]",
         filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
-        label_type: "str" = "bcid",
+        label_type: "str" = "bcid",  # noqa: WPS226
         dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
     ) -> Union[pd.DataFrame, Dict[str, Any]]:
         """Get data from the memory bases.
 
@@ -143,38 +175,277 @@ class MemoryBase(base_entity.BaseEntity, resource_getter.ResourceGetter):
             filters: List of filters to apply to the request.
             label_type: "bcid" / "name"
             dataframe: True, return Dataframe; False, return Dict
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
 
         Returns:
             A dictionary of data list or a pandas DataFrame.
         """
         int_var_ids = [int(var_id) for var_id in var_ids]
-        datasource = data.collect_data(int_var_ids, self, filters)
+        with timeouts.deadline_scope(deadline):
+            datasource = self._label_data(
+                data.collect_data(int_var_ids, self, filters, arrays=dataframe),
+                self._get_labels(label_type, int_var_ids),
+            )
+
+        if dataframe:
+            return datasets.to_dataframe(datasource)
+
+        return datasource
+
+    def get_data_many(
+        self,
+        queries: "List[planner.Query]",
+        label_type: "str" = "bcid",
+        dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+    ) -> List[custom_types.DATA_TYPE]:
+        """Get the data of several queries with the fewest requests.
+
+        The queries sharing the same filters are merged into a single request of the union of
+        their variables, then the columns of each query are split back from its result.
+
+        Args:
+            queries: Variable bcIds and filters of each query, e.g.
+                     `[([2000001, 2000002], None), ([2000002, 2000003], None)]`.
+            label_type: "bcid" / "name"
+            dataframe: True, return Dataframes; False, return Dicts
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+
+        Returns:
+            A dictionary of data list or a pandas DataFrame for each query, in the order of the
+            queries.
+        """
+        with timeouts.deadline_scope(deadline):
+            query_datasets = planner.collect_many(self, queries, arrays=dataframe)
+            labels = self._get_labels(
+                label_type, {int(var_id) for var_ids, _ in queries for var_id in var_ids}
+            )
+        labelled_datasets = [
+            self._label_data(query_dataset, labels) for query_dataset in query_datasets
+        ]
+        if dataframe:
+            return [datasets.to_dataframe(query_dataset) for query_dataset in labelled_datasets]
+        return labelled_datasets
 
-        if label_type == "name":
-            mapping = {
-                int(collected_variable.get_bcid()): collected_variable.get_name()
-                for collected_variable in self.get_variable_list()
-            }
-            datasource = {
-                mapping[data_key]: data_value for data_key, data_value in datasource.items()
-            }
+    def get_partitioned_data(  # noqa: WPS211
+        self,
+        var_ids: "List[Union[int,str]]",
+        start: "partition.Bound",
+        end: "partition.Bound",
+        window: "Union[timedelta, float]",
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        label_type: "str" = "bcid",
+        dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+        partition_id: "Optional[Union[int, str]]" = None,
+    ) -> Union[pd.DataFrame, Dict[str, Any]]:
+        """Get data from the memory bases by windows of the order variable.
+
+        The windows are requested concurrently with BETWEEN filters, then merged in order
+        without the rows duplicated at their bounds. Their size adapts to the number of rows
+        received, see the `partition_max_rows` parameter.
+
+        Args:
+            var_ids: bcIds of variables for which the data are collected.
+            start: Start of the range, a datetime (in UTC when naive) or a timestamp in ms for a
+                   DATETIME variable.
+            end: End of the range.
+            window: Initial size of the windows, a timedelta or a duration in ms for a DATETIME
+                    variable.
+            filters: List of filters to apply to the request.
+            label_type: "bcid" / "name"
+            dataframe: True, return Dataframe; False, return Dict
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+            partition_id: bcId of the variable defining the windows. Default: the order
+                          variable.
+
+        Returns:
+            A dictionary of data list or a pandas DataFrame.
+        """
+        int_var_ids = [int(var_id) for var_id in var_ids]
+        with timeouts.deadline_scope(deadline):
+            datasource = self._label_data(
+                partition.collect_partitioned_data(
+                    int_var_ids,
+                    self,
+                    start,
+                    end,
+                    window,
+                    filters,
+                    None if partition_id is None else int(partition_id),
+                    arrays=dataframe,
+                ),
+                self._get_labels(label_type, int_var_ids),
+            )
 
         if dataframe:
-            return pd.DataFrame(datasource)
+            return datasets.to_dataframe(datasource)
 
         return datasource
 
+    def iter_data(
+        self,
+        var_ids: "List[Union[int,str]]",
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        chunk: "Optional[int]" = None,
+        label_type: "str" = "bcid",
+        dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+        **kwargs,
+    ) -> Iterator[custom_types.DATA_TYPE]:
+        """Iterate over the data of the memory bases by batches of rows.
+
+        By default the data are requested at once and yielded by batches. With the `start`,
+        `end` and `window` arguments of `get_partitioned_data`, each window is yielded as
+        soon as it arrives so that only one round of windows is held in memory.
+
+        Args:
+            var_ids: bcIds of variables for which the data are collected.
+            filters: List of filters to apply to the request.
+            chunk: Maximum number of rows of a batch. Default: the `iter_chunk_size` parameter.
+            label_type: "bcid" / "name"
+            dataframe: True, yield Dataframes; False, yield Dicts
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+            **kwargs: Optional start, end, window and partition_id of the windows.
+
+        Yields:
+            Dictionaries of data list or pandas DataFrames.
+        """
+        deadline = timeouts.to_deadline(deadline)
+        with timeouts.deadline_scope(deadline):
+            labels = self._get_labels(label_type, var_ids)
+        chunk = chunk or parameters.get_parameter("iter_chunk_size")
+        for window_dataset in timeouts.iter_within_deadline(
+            self._iter_datasets(var_ids, filters, dataframe, **kwargs), deadline
+        ):
+            for batch in datasets.iter_row_batches(self._label_data(window_dataset, labels), chunk):
+                yield datasets.to_dataframe(batch) if dataframe else batch
+
+    def get_incremental_query(
+        self,
+        var_ids: "List[Union[int,str]]",
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        last_value: "Optional[float]" = None,
+        keep_rows: "bool" = False,
+    ) -> incremental.IncrementalQuery:
+        """Create a query returning, at each call, only the rows recorded since the previous one.
+
+        Args:
+            var_ids: bcIds of variables for which the data are collected.
+            filters: List of filters to apply to the request.
+            last_value: Order value of the last row already received, a timestamp in ms for a
+                        DATETIME order variable. Default: all the rows are new.
+            keep_rows: Append the new rows of each call to a local store.
+
+        Returns:
+            The incremental query, see `IncrementalQuery.fetch`.
+        """
+        return incremental.IncrementalQuery(self, var_ids, filters, last_value, keep_rows)
+
     def get_order_variable_long_id(self) -> str:
         """Get the long id of the memory base order variable.
 
         Returns:
             A variable long id.
         """
-        infos = data.get_braindata_memory_base_info(
-            self.get_braincube_path(), self._bcid, self.get_braincube_name()
-        )
+        infos = self.get_braindata_info()
         for order_key in ("reference", "order"):
             order_id = infos.get(order_key)
             if order_id:
                 return order_id
         raise KeyError("The memory base contains neither a reference nor a order key.")
+
+    def get_braindata_info(self) -> Dict[str, Any]:
+        """Get the memory base information from the braindata.
+
+        The information is cached for `braindata_info_ttl` seconds, see
+        `invalidate_braindata_info` to drop it sooner.
+
+        Returns:
+            Json dictionary with the memory base information.
+        """
+        return dict(self._braindata_info.get(parameters.get_parameter("braindata_info_ttl")))
+
+    def invalidate_braindata_info(self):
+        """Drop the cached braindata information, e.g. after a change of the order variable."""
+        self._braindata_info.invalidate()
+
+    def get_braindata_info_stats(self) -> Dict[str, int]:
+        """Get the counters of the braindata information cache.
+
+        Returns:
+            The number of hits, i.e. the requests saved by the cache, and of misses.
+        """
+        return self._braindata_info.get_stats()
+
+    def _iter_datasets(
+        self,
+        var_ids: "List[Union[int,str]]",
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        arrays: bool = False,
+        **kwargs,
+    ) -> Iterator[Dict[int, Any]]:
+        """Request the data, at once or by windows.
+
+        Args:
+            var_ids: bcIds of variables for which the data are collected.
+            filters: List of filters to apply to the request.
+            arrays: Keep the NUMERIC columns as numpy arrays instead of lists.
+            **kwargs: Optional start, end, window and partition_id of the windows.
+
+        Returns:
+            An iterator requesting the datasets as they are consumed.
+        """
+        int_var_ids = [int(var_id) for var_id in var_ids]
+        if kwargs:
+            return partition.iter_partitioned_data(
+                int_var_ids, self, filters=filters, arrays=arrays, **kwargs
+            )
+        return map(
+            functools.partial(data.collect_data, memory_base=self, filters=filters, arrays=arrays),
+            [int_var_ids],
+        )
+
+    def _request_braindata_info(self) -> Dict[str, Any]:
+        """Request the memory base information to the braindata.
+
+        Returns:
+            Json dictionary with the memory base information.
+        """
+        return data.get_braindata_memory_base_info(
+            self.get_braincube_path(), self._bcid, self.get_braincube_name()
+        )
+
+    def _get_labels(
+        self, label_type: str, var_ids: "Iterable[Union[int,str]]"
+    ) -> Optional[Dict[int, str]]:
+        """Get the labels of the variables.
+
+        Args:
+            label_type: "bcid" / "name"
+            var_ids: bcIds of the labelled variables.
+
+        Returns:
+            The variable names by bcId, None to keep the bcIds.
+        """
+        if label_type != "name":
+            return None
+        return self._variable_index.get_names(var_ids)
+
+    def _label_data(
+        self,
+        datasource: Dict[int, Any],
+        labels: Optional[Dict[int, str]],
+    ) -> Dict[Any, Any]:
+        """Label the columns of a dataset.
+
+        Args:
+            datasource: Dataset labelled with the variable bcIds.
+            labels: Labels of the variables by bcId, None to keep the bcIds.
+
+        Returns:
+            The labelled dataset.
+        """
+        if labels is None:
+            return datasource
+        return {labels[data_key]: datasource[data_key] for data_key in datasource}
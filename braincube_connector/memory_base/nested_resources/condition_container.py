@@ -5,6 +5,9 @@ from typing import Any, Dict, List
 
 from braincube_connector.data import conditions
 
+BCID = "bcId"
+VARIABLE_KEY = "variable"
+
 
 class ConditionContainer(object):
     """A ConditionContainer is a type of MbChild that contains conditions."""
@@ -12,14 +15,48 @@ class ConditionContainer(object):
     def get_conditions(self) -> List[Dict[str, Any]]:
         """Build the entity's list of filters.
 
+        The variables of the conditions are requested concurrently, and kept by the variable
+        types of the memory base.
+
+        Returns:
+            a list of filters
+        """
+        variable_types = self._memory_base.get_variable_types()  # type: ignore
+        return self.build_conditions(
+            variable_types.get_variables(self.get_condition_variable_ids())
+        )
+
+    def get_condition_variable_ids(self) -> List[int]:
+        """Get the bcIds of the variables used by the entity's conditions.
+
+        Returns:
+            A list of variable bcIds.
+        """
+        return [int(cond[VARIABLE_KEY][BCID]) for cond in self._get_condition_list()]
+
+    def build_conditions(
+        self, variables: "Dict[int, VariableDescription]"  # type: ignore  # noqa
+    ) -> List[Dict[str, Any]]:
+        """Build the entity's list of filters from known variable descriptions.
+
+        Args:
+            variables: Descriptions of the condition variables by bcId.
+
         Returns:
             a list of filters
         """
         filters = []
-        condition_list = self._metadata.get("conditions", [])  # type: ignore
-        for cond in condition_list:
-            var_obj = self._memory_base.get_variable(cond["variable"]["bcId"])  # type: ignore
+        for cond in self._get_condition_list():
+            var_obj = variables[int(cond[VARIABLE_KEY][BCID])]
             new_filter = conditions.build_condition_filter(var_obj, cond)
             if new_filter:
                 filters.append(new_filter)
         return filters
+
+    def _get_condition_list(self) -> List[Dict[str, Any]]:
+        """Get the raw conditions of the entity.
+
+        Returns:
+            The conditions of the entity metadata.
+        """
+        return self._metadata.get("conditions", [])  # type: ignore
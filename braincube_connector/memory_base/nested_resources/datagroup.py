@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
-from braincube_connector import custom_types
+from braincube_connector import custom_types, timeouts
 from braincube_connector.memory_base.nested_resources import mb_child
 
 
@@ -27,17 +27,53 @@ class DataGroup(mb_child.MbChild):
         Returns:
             A list of Variables description.
         """
-        return [self._memory_base.get_variable(bcid) for bcid in self.get_variable_ids()]
+        variable_ids = self.get_variable_ids()
+        variables = self._memory_base.get_variable_types().get_variables(variable_ids)
+        return [variables[int(bcid)] for bcid in variable_ids]
 
     def get_data(
-        self, filters: "Optional[List[custom_types.FILTER_TYPE]]" = None
+        self,
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
     ) -> Dict[str, Any]:
         """Get data from the data group.
 
         Args:
             filters: List of filters to apply to the request.
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
 
         Returns:
             A dictionary of data list.
         """
-        return self._memory_base.get_data(self.get_variable_ids(), filters)
+        with timeouts.deadline_scope(deadline):
+            return self._memory_base.get_data(self.get_variable_ids(), filters)
+
+    def iter_data(
+        self,
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        chunk: "Optional[int]" = None,
+        dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+        **kwargs,
+    ) -> Iterator[custom_types.DATA_TYPE]:
+        """Iterate over the data of the data group by batches of rows.
+
+        Args:
+            filters: List of filters to apply to the request.
+            chunk: Maximum number of rows of a batch. Default: the `iter_chunk_size` parameter.
+            dataframe: True, yield Dataframes; False, yield Dicts
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+            **kwargs: Optional start, end, window and partition_id of the windows, see
+                      `MemoryBase.iter_data`.
+
+        Yields:
+            Dictionaries of data list or pandas DataFrames.
+        """
+        yield from self._memory_base.iter_data(
+            self.get_variable_ids(),
+            filters,
+            chunk,
+            dataframe=dataframe,
+            deadline=deadline,
+            **kwargs,
+        )
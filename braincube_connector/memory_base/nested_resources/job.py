@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from braincube_connector import custom_types
+from braincube_connector import custom_types, parallel, parameters, timeouts
 from braincube_connector.bases import resource_getter
 from braincube_connector.data import conditions
 from braincube_connector.memory_base.nested_resources import condition_container, mb_child, rule
@@ -11,6 +11,15 @@ BCID = "bcId"
 VARIABLE_KEY = "variable"
 POSITIVE_EVENTS = "positiveEvents"
 NEGATIVE_EVENTS = "negativeEvents"
+DATAGROUPS = "dataGroups"
+REFERENCE_GETTERS = (
+    (POSITIVE_EVENTS, "get_event"),
+    (NEGATIVE_EVENTS, "get_event"),
+    (DATAGROUPS, "get_datagroup"),
+)
+
+References = Dict[str, List[Any]]
+EntityRequest = Tuple[str, Callable[[str], Any], str]
 
 
 class JobDescription(
@@ -22,8 +31,43 @@ class JobDescription(
     request_one_path = "extended"
     request_many_path = "jobs/all/summary"
 
+    def initialize(self, *args, **kwargs):
+        """Initialize JobDescription.
+
+        Args:
+            *args: Positional arguments of `MbChild.initialize`.
+            **kwargs: Keyword arguments of `MbChild.initialize`.
+        """
+        super().initialize(*args, **kwargs)
+        self._references: Optional[References] = None
+
+    def materialize(self, refresh: bool = False) -> "JobDescription":
+        """Request at once the events, datagroups and condition variables used by the job.
+
+        The events and the datagroups are requested concurrently, with up to
+        `metadata_workers` requests at the same time, and kept on the job for `get_events`,
+        `get_conditions`, `get_variable_ids` and `get_data`. The condition variables are
+        requested concurrently too and kept by the variable types of the memory base, see
+        `MemoryBase.get_variable_types`.
+
+        Args:
+            refresh: Request the events and the datagroups again if they are already known.
+
+        Returns:
+            The job itself.
+        """
+        if refresh:
+            self._references = None
+        events = self.get_events()
+        _get_condition_variables(
+            self._memory_base, [self, *events[NEGATIVE_EVENTS], *events[POSITIVE_EVENTS]]
+        )
+        return self
+
     def get_data(
-        self, filters: "Optional[List[custom_types.FILTER_TYPE]]" = None
+        self,
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
     ) -> Dict[str, Any]:
         """Get the filtered data used in the job.
 
@@ -34,19 +78,55 @@ class JobDescription(
 
         Args:
             filters: List of filters to apply to the request.
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
 
         Returns:
             A dictionary of filtered data list.
         """
         if not filters:
             filters = []
-        filters = filters + self.get_conditions(combine=True, include_events=True)
-        variables = self.get_variable_ids()
-        return self._memory_base.get_data(variables, filters)
+        with timeouts.deadline_scope(deadline):
+            filters = filters + self.get_conditions(combine=True, include_events=True)
+            variables = self.get_variable_ids()
+            return self._memory_base.get_data(variables, filters)
+
+    def iter_data(
+        self,
+        filters: "Optional[List[custom_types.FILTER_TYPE]]" = None,
+        chunk: "Optional[int]" = None,
+        dataframe: "bool" = False,
+        deadline: "Optional[Union[float, timeouts.Deadline]]" = None,
+        **kwargs,
+    ) -> Iterator[custom_types.DATA_TYPE]:
+        """Iterate over the filtered data used in the job by batches of rows.
+
+        The same warning as for `get_data` applies.
+
+        Args:
+            filters: List of filters to apply to the request.
+            chunk: Maximum number of rows of a batch. Default: the `iter_chunk_size` parameter.
+            dataframe: True, yield Dataframes; False, yield Dicts
+            deadline: Time budget in seconds (or Deadline) shared by all the requests.
+            **kwargs: Optional start, end, window and partition_id of the windows, see
+                      `MemoryBase.iter_data`.
+
+        Yields:
+            Dictionaries of filtered data list or pandas DataFrames.
+        """
+        deadline = timeouts.to_deadline(deadline)
+        with timeouts.deadline_scope(deadline):
+            filters = (filters or []) + self.get_conditions(combine=True, include_events=True)
+            variables = self.get_variable_ids()
+        yield from self._memory_base.iter_data(
+            variables, filters, chunk, dataframe=dataframe, deadline=deadline, **kwargs
+        )
 
     def get_conditions(self, combine=False, include_events=False) -> "List[Dict[str, Any]]":
         """Get the job conditions.
 
+        The variables of the job and event conditions are requested at once, and kept by the
+        variable types of the memory base.
+
         Args:
             combine: Combine the conditions under a single condition.
             include_events: If True, it also includes the event conditions.
@@ -54,16 +134,13 @@ class JobDescription(
         Returns:
             A List of conditions.
         """
-        filters: List[Dict[str, Any]] = []
+        events: Dict[str, List[Any]] = {POSITIVE_EVENTS: [], NEGATIVE_EVENTS: []}
         if include_events:
             events = self.get_events()
-            for negative_event in events[NEGATIVE_EVENTS]:
-                filters = filters + [
-                    {"NOT": conditions.combine_filters(negative_event.get_conditions())}
-                ]
-            for positive_event in events[POSITIVE_EVENTS]:
-                filters = filters + positive_event.get_conditions()
-        filters = super().get_conditions() + filters
+        variables = _get_condition_variables(
+            self._memory_base, [self, *events[NEGATIVE_EVENTS], *events[POSITIVE_EVENTS]]
+        )
+        filters = self.build_conditions(variables) + _build_event_conditions(events, variables)
         return conditions.combine_filters(filters) if combine else filters
 
     def get_variable_ids(self) -> List[str]:
@@ -74,14 +151,15 @@ class JobDescription(
         Returns:
             A list of variables bcIds.
         """
-        variables: List[str] = []
-        for entry in self._metadata["modelEntries"]:
-            variables = variables + [
-                cond[VARIABLE_KEY][BCID] for cond in entry["conditions"] if VARIABLE_KEY in cond
-            ]
-        for group in self._metadata["dataGroups"]:
-            variables = variables + self._memory_base.get_datagroup(group[BCID]).get_variable_ids()
-        return list(set(variables))
+        variables = {
+            cond[VARIABLE_KEY][BCID]
+            for entry in self._metadata["modelEntries"]
+            for cond in entry["conditions"]
+            if VARIABLE_KEY in cond
+        }
+        for group in self._get_references()[DATAGROUPS]:
+            variables.update(group.get_variable_ids())
+        return list(variables)
 
     def get_events(self) -> "Dict[str, List[Event]]":  # type: ignore  # noqa
         """Get the events used in the job.
@@ -89,12 +167,11 @@ class JobDescription(
         Returns:
             A list of events.
         """
-        events: Dict[str, Any] = {POSITIVE_EVENTS: [], NEGATIVE_EVENTS: []}
-        for positive_event in self._metadata["events"][POSITIVE_EVENTS]:
-            events[POSITIVE_EVENTS].append(self._memory_base.get_event(positive_event["bcId"]))
-        for negative_event in self._metadata["events"][NEGATIVE_EVENTS]:
-            events[NEGATIVE_EVENTS].append(self._memory_base.get_event(negative_event["bcId"]))
-        return events
+        references = self._get_references()
+        return {
+            POSITIVE_EVENTS: list(references[POSITIVE_EVENTS]),
+            NEGATIVE_EVENTS: list(references[NEGATIVE_EVENTS]),
+        }
 
     def get_categories(self) -> List[Dict[str, Any]]:
         """Get categories defined for the job (e.g. good or bad).
@@ -127,3 +204,127 @@ class JobDescription(
         return self._get_resource_list(
             rule.RuleDescription, **kwargs, memory_base=self._memory_base
         )
+
+    def _get_references(self) -> References:
+        """Get the events and the datagroups used by the job, requesting them the first time.
+
+        Returns:
+            The positive events, the negative events and the datagroups.
+        """
+        if self._references is None:
+            self._references = _request_references(self._memory_base, self._metadata)
+        return self._references
+
+
+def _get_condition_variables(
+    memory_base: "MemoryBase",  # type: ignore  # noqa
+    containers: List[condition_container.ConditionContainer],
+) -> "Dict[int, VariableDescription]":  # type: ignore  # noqa
+    """Request at once the variables of the conditions of several entities.
+
+    The variables already known by the memory base are not requested again.
+
+    Args:
+        memory_base: Memory base of the entities.
+        containers: Entities containing conditions.
+
+    Returns:
+        The descriptions of the condition variables by bcId.
+    """
+    return memory_base.get_variable_types().get_variables(
+        var_id for container in containers for var_id in container.get_condition_variable_ids()
+    )
+
+
+def _build_event_conditions(
+    events: "Dict[str, List[Event]]",  # type: ignore  # noqa
+    variables: "Dict[int, VariableDescription]",  # type: ignore  # noqa
+) -> List[Dict[str, Any]]:
+    """Build the filters of the events of a job.
+
+    Args:
+        events: Positive and negative events of the job.
+        variables: Descriptions of the condition variables by bcId.
+
+    Returns:
+        The negated conditions of the negative events, then the conditions of the positive events.
+    """
+    negative_filters = [
+        {"NOT": conditions.combine_filters(negative_event.build_conditions(variables))}
+        for negative_event in events[NEGATIVE_EVENTS]
+    ]
+    return negative_filters + [
+        event_filter
+        for positive_event in events[POSITIVE_EVENTS]
+        for event_filter in positive_event.build_conditions(variables)
+    ]
+
+
+def _request_references(
+    memory_base: "MemoryBase", metadata: Dict[str, Any]  # type: ignore  # noqa
+) -> References:
+    """Request concurrently the events and the datagroups referenced by a job.
+
+    Args:
+        memory_base: Memory base of the job.
+        metadata: Metadata of the job.
+
+    Returns:
+        The positive events, the negative events and the datagroups.
+    """
+    entity_requests = _get_entity_requests(memory_base, metadata)
+    entities = parallel.map_in_order(
+        _request_entity, entity_requests, parameters.get_parameter("metadata_workers")
+    )
+    references: References = {POSITIVE_EVENTS: [], NEGATIVE_EVENTS: [], DATAGROUPS: []}
+    for entity_request, entity in zip(entity_requests, entities):
+        references[entity_request[0]].append(entity)
+    return references
+
+
+def _get_entity_requests(
+    memory_base: "MemoryBase", metadata: Dict[str, Any]  # type: ignore  # noqa
+) -> List[EntityRequest]:
+    """List the requests of the entities referenced by a job.
+
+    Args:
+        memory_base: Memory base of the job.
+        metadata: Metadata of the job.
+
+    Returns:
+        The kind of reference, the getter of the entity and the bcId of each entity.
+    """
+    return [
+        (reference_key, getattr(memory_base, getter_name), reference[BCID])
+        for reference_key, getter_name in REFERENCE_GETTERS
+        for reference in _get_reference_metadata(metadata, reference_key)
+    ]
+
+
+def _get_reference_metadata(metadata: Dict[str, Any], reference_key: str) -> "List[Dict[str, Any]]":
+    """Get the references of a job to its events or to its datagroups.
+
+    Args:
+        metadata: Metadata of the job.
+        reference_key: POSITIVE_EVENTS, NEGATIVE_EVENTS or DATAGROUPS.
+
+    Returns:
+        The references, with the bcIds of the entities.
+    """
+    if reference_key == DATAGROUPS:
+        return metadata.get(DATAGROUPS, [])
+    events = metadata.get("events", {})
+    return events.get(reference_key, [])
+
+
+def _request_entity(entity_request: EntityRequest) -> Any:
+    """Request an entity referenced by a job.
+
+    Args:
+        entity_request: Kind of reference, getter of the entity and bcId of the entity.
+
+    Returns:
+        The entity.
+    """
+    _, getter, bcid = entity_request
+    return getter(bcid)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""Index of the variable names of a memory base."""
+
+from typing import Dict, Iterable, Union
+
+from braincube_connector import cache, parameters
+from braincube_connector.memory_base.nested_resources import variable
+
+
+class VariableIndex(object):
+    """Variable descriptions of a memory base, indexed by bcId to find their names.
+
+    The index is built from the summary of the variable collection of the memory base, in as
+    many requests as there are pages, and kept for `variable_index_ttl` seconds. The summary does
+    not always give the variable types, see `VariableTypes` to get them.
+    """
+
+    def __init__(self, memory_base: "MemoryBase"):  # type: ignore  # noqa
+        """Initialize VariableIndex.
+
+        Args:
+            memory_base: Memory base containing the variables.
+        """
+        self._memory_base = memory_base
+        self._variables = cache.TimedValue(self._request_variables)
+
+    def get_names(self, bcids: Iterable[Union[str, int]]) -> Dict[int, str]:
+        """Get the names of some variables.
+
+        The variables missing from the summary, e.g. created since the index was built, are
+        requested alone.
+
+        Args:
+            bcids: Variable bcIds.
+
+        Returns:
+            The variable names by bcId.
+        """
+        variables = self._get_variables()
+        int_bcids = [int(bcid) for bcid in bcids]
+        missing_bcids = [bcid for bcid in int_bcids if bcid not in variables]
+        if missing_bcids:
+            variables = {
+                **variables,
+                **self._memory_base.get_variable_types().get_variables(missing_bcids),
+            }
+        return {bcid: variables[bcid].get_name() for bcid in int_bcids}
+
+    def invalidate(self):
+        """Drop the index so that it is built again on the next lookup."""
+        self._variables.invalidate()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters of the lookups made in the index.
+
+        Returns:
+            The number of hits, i.e. the lookups made without listing the variables, and of
+            misses.
+        """
+        return self._variables.get_stats()
+
+    def _get_variables(self) -> Dict[int, variable.VariableDescription]:
+        """Get the indexed variables, building the index if it is missing or too old.
+
+        Returns:
+            The variable descriptions by bcId.
+        """
+        return self._variables.get(parameters.get_parameter("variable_index_ttl"))
+
+    def _request_variables(self) -> Dict[int, variable.VariableDescription]:
+        """Request all the variables of the memory base.
+
+        Returns:
+            The variable descriptions by bcId.
+        """
+        return {
+            int(variable_description.get_bcid()): variable_description
+            for variable_description in self._memory_base.get_variable_list()
+        }
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""Descriptions of the variables of a memory base, requested with their types."""
+
+import threading
+from typing import Dict, Iterable, List, Union
+
+from braincube_connector import cache, parallel, parameters
+from braincube_connector.memory_base.nested_resources import variable
+
+
+class VariableTypes(object):
+    """Variable descriptions of a memory base with their types, cached by bcId.
+
+    The summary of the variable collection does not always give the types, so each variable is
+    requested alone, once, the first time its type is needed.
+    """
+
+    def __init__(self, memory_base: "MemoryBase"):  # type: ignore  # noqa
+        """Initialize VariableTypes.
+
+        Args:
+            memory_base: Memory base containing the variables.
+        """
+        self._memory_base = memory_base
+        self._variables: Dict[int, variable.VariableDescription] = {}
+        self._lock = threading.Lock()
+        self._stats = cache.CacheStats()
+
+    def get_variable(self, bcid: Union[str, int]) -> variable.VariableDescription:
+        """Get the description of a variable, including its type.
+
+        Args:
+            bcid: Variable bcId.
+
+        Returns:
+            A variable description.
+        """
+        return self.get_variables([bcid])[int(bcid)]
+
+    def get_variables(
+        self, bcids: Iterable[Union[str, int]]
+    ) -> Dict[int, variable.VariableDescription]:
+        """Get the descriptions of some variables, including their types.
+
+        The variables that are not cached yet are requested concurrently, with up to
+        `metadata_workers` requests at the same time.
+
+        Args:
+            bcids: Variable bcIds.
+
+        Returns:
+            The variable descriptions by bcId.
+        """
+        int_bcids = [int(bcid) for bcid in bcids]
+        missing_bcids = self._find_missing(int_bcids)
+        requested = parallel.map_in_order(
+            self._memory_base.get_variable,
+            missing_bcids,
+            parameters.get_parameter("metadata_workers"),
+        )
+        with self._lock:
+            self._variables.update(zip(missing_bcids, requested))
+            return {bcid: self._variables[bcid] for bcid in int_bcids}
+
+    def invalidate(self):
+        """Drop the cached descriptions so that they are requested again."""
+        with self._lock:
+            self._variables.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the counters of the lookups made in the cache.
+
+        Returns:
+            The number of hits, i.e. the variables found without a request, and of misses.
+        """
+        return self._stats.get_stats()
+
+    def _find_missing(self, bcids: List[int]) -> List[int]:
+        """Find the variables that are not cached, counting the lookups.
+
+        Args:
+            bcids: Variable bcIds.
+
+        Returns:
+            The distinct bcIds of the variables to request.
+        """
+        missing_bcids = []
+        with self._lock:
+            for bcid in dict.fromkeys(bcids):
+                if bcid in self._variables:
+                    self._stats.record_hit()
+                else:
+                    self._stats.record_miss()
+                    missing_bcids.append(bcid)
+        return missing_bcids
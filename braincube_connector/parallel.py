@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+"""Tools to run the requests of the connector concurrently."""
+
+import contextlib
+import contextvars
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from braincube_connector import timeouts
+
+_request_slots: "contextvars.ContextVar[Optional[threading.BoundedSemaphore]]" = (
+    contextvars.ContextVar("braincube_connector_request_slots", default=None)
+)
+
+
+def submit(executor: Executor, func: Callable[..., Any], *args, **kwargs) -> Future:
+    """Schedule a function in an executor, within the context of the caller.
+
+    The context carries the current deadline to the worker thread.
+
+    Args:
+        executor: Executor running the function.
+        func: Function to run.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        The future of the function output.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, func, *args, **kwargs)
+
+
+def map_in_order(
+    func: Callable[[Any], Any], elements: Iterable[Any], max_workers: int
+) -> List[Any]:
+    """Apply a function to elements using a pool of threads.
+
+    Args:
+        func: Function to apply.
+        elements: Elements on which the function is applied.
+        max_workers: Maximum number of threads, the elements are processed one after the other
+                     when it is lower than 2.
+
+    Returns:
+        The outputs of the function, in the order of the elements.
+    """
+    elements = list(elements)
+    if max_workers < 2 or len(elements) < 2:
+        return [func(element) for element in elements]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(elements))) as executor:
+        futures = [submit(executor, func, element) for element in elements]
+        return [future.result() for future in futures]
+
+
+@contextlib.contextmanager
+def concurrency_scope(max_requests: int) -> Iterator[threading.BoundedSemaphore]:
+    """Bound the number of data requests sent at the same time within the scope.
+
+    The bound is shared by the worker threads started within the scope, whatever their pool.
+
+    Args:
+        max_requests: Maximum number of requests in progress.
+
+    Yields:
+        The semaphore of the request slots.
+    """
+    slots = threading.BoundedSemaphore(max(max_requests, 1))
+    token = _request_slots.set(slots)
+    try:
+        yield slots
+    finally:
+        _request_slots.reset(token)
+
+
+def call_in_slot(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call a function once a request slot of the current concurrency scope is free.
+
+    Args:
+        func: Function sending a request.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        The output of the function.
+    """
+    slots = _request_slots.get()
+    if slots is None:
+        return func(*args, **kwargs)
+    with _holding_slot(slots):
+        return func(*args, **kwargs)
+
+
+@contextlib.contextmanager
+def _holding_slot(slots: threading.BoundedSemaphore) -> Iterator[None]:
+    """Hold a request slot within the scope, waiting for it until the current deadline.
+
+    Args:
+        slots: Semaphore of the request slots.
+
+    Yields:
+        None, once the slot is acquired.
+
+    Raises:
+        DeadlineExceededError: The deadline passed while waiting for a slot.
+    """
+    deadline = timeouts.get_current_deadline()
+    timeout = None if deadline is None else deadline.remaining()
+    if not slots.acquire(timeout=timeout):
+        raise timeouts.DeadlineExceededError(
+            "The deadline has been exceeded while waiting for a request slot."
+        )
+    try:
+        yield
+    finally:
+        slots.release()
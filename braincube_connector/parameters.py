@@ -8,11 +8,34 @@ from braincube_connector import constants, instances
 
 _default_parameters = {
     "page_size": constants.DEFAULT_PAGE_SIZE,
+    "page_workers": constants.DEFAULT_PAGE_WORKERS,
+    "data_chunk_size": constants.DEFAULT_DATA_CHUNK_SIZE,
+    "data_workers": constants.DEFAULT_DATA_WORKERS,
+    "partition_max_rows": constants.DEFAULT_PARTITION_MAX_ROWS,
+    "iter_chunk_size": constants.DEFAULT_ITER_CHUNK_SIZE,
+    "braindata_info_ttl": constants.DEFAULT_BRAINDATA_INFO_TTL,
+    "variable_index_ttl": constants.DEFAULT_VARIABLE_INDEX_TTL,
+    "metadata_workers": constants.DEFAULT_METADATA_WORKERS,
+    "fanout_max_requests": constants.DEFAULT_FANOUT_MAX_REQUESTS,
+    "async_max_concurrency": constants.DEFAULT_ASYNC_MAX_CONCURRENCY,
+    "entity_cache": constants.DEFAULT_ENTITY_CACHE,
+    "entity_cache_ttl": constants.DEFAULT_ENTITY_CACHE_TTL,
+    "entity_cache_size": constants.DEFAULT_ENTITY_CACHE_SIZE,
+    "coalesce_requests": constants.DEFAULT_COALESCE_REQUESTS,
+    "snapshot_max_age": constants.DEFAULT_SNAPSHOT_MAX_AGE,
+    "result_cache_dir": constants.DEFAULT_RESULT_CACHE_DIR,
+    "result_cache_max_size": constants.DEFAULT_RESULT_CACHE_MAX_SIZE,
+    "categorical_discrete": constants.DEFAULT_CATEGORICAL_DISCRETE,
     "parse_date": constants.DEFAULT_PARSE_DATE,
     "VariableDescription_name_key": constants.DEFAULT_VARIABLE_NAME_KEY,
     "VariableDescription_bcid_key": constants.DEFAULT_VARIABLE_BCID_KEY,
     "BaseEntity_name_key": constants.DEFAULT_BCID_KEY,
     "BaseEntity_bcid_key": constants.DEFAULT_NAME_KEY,
+    "retry_max_attempts": constants.DEFAULT_RETRY_MAX_ATTEMPTS,
+    "retry_backoff_base": constants.DEFAULT_RETRY_BACKOFF_BASE,
+    "retry_backoff_max": constants.DEFAULT_RETRY_BACKOFF_MAX,
+    "retry_jitter_cap": constants.DEFAULT_RETRY_JITTER_CAP,
+    "retry_statuses": constants.DEFAULT_RETRY_STATUSES,
 }
 
 
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+"""Retry policy applied to the idempotent requests of the client."""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+from braincube_connector import parameters, timeouts
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+class RetryStats(object):
+    """Thread-safe counters of the retries made by a client."""
+
+    def __init__(self):
+        """Initialize RetryStats."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Set all the counters to zero."""
+        with self._lock:
+            self._retries = 0
+            self._exhausted = 0
+            self._wait_time: float = 0
+
+    def record_retry(self, delay: float):
+        """Count a retry.
+
+        Args:
+            delay: Time waited before the retry, in seconds.
+        """
+        with self._lock:
+            self._retries += 1
+            self._wait_time += delay
+
+    def record_exhausted(self):
+        """Count a request that still failed after its last allowed attempt."""
+        with self._lock:
+            self._exhausted += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get the counters.
+
+        Returns:
+            The number of retries, of requests that ran out of attempts and the time waited.
+        """
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "exhausted": self._exhausted,
+                "wait_time": self._wait_time,
+            }
+
+
+def get_max_attempts(rtype: str, idempotent: Optional[bool] = None) -> int:
+    """Get the number of attempts allowed for a request.
+
+    Args:
+        rtype: Request type (GET, POST).
+        idempotent: Whether the request can be repeated safely. By default only the GET-like
+                    requests are.
+
+    Returns:
+        The maximum number of attempts.
+    """
+    if idempotent is None:
+        idempotent = rtype.upper() in IDEMPOTENT_METHODS
+    if not idempotent:
+        return 1
+    return max(int(parameters.get_parameter("retry_max_attempts")), 1)
+
+
+def parse_retry_after(header_value: Optional[str]) -> Optional[float]:
+    """Read the delay requested by a Retry-After header.
+
+    Args:
+        header_value: Value of the header, a number of seconds or a HTTP date.
+
+    Returns:
+        The delay in seconds, None if the header is missing or invalid.
+    """
+    if not header_value:
+        return None
+    if header_value.strip().isdigit():
+        return float(header_value)
+    try:
+        retry_date = parsedate_to_datetime(header_value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(retry_date.timestamp() - time.time(), 0)
+
+
+def get_backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Compute the time to wait before a new attempt.
+
+    The delay grows exponentially with the attempts, up to `retry_backoff_max`, and a random
+    jitter of at most `retry_jitter_cap` is added. A Retry-After delay sent by the server
+    takes precedence when it is longer.
+
+    Args:
+        attempt: Number of attempts already made.
+        retry_after: Delay requested by the server, in seconds.
+
+    Returns:
+        The delay in seconds.
+    """
+    backoff = parameters.get_parameter("retry_backoff_base") * 2 ** (attempt - 1)
+    backoff = min(backoff, parameters.get_parameter("retry_backoff_max"))
+    backoff += random.uniform(0, parameters.get_parameter("retry_jitter_cap"))  # noqa: S311
+    if retry_after is not None:
+        return max(backoff, retry_after)
+    return backoff
+
+
+def call_with_retry(
+    send: Callable[[], requests.Response], stats: RetryStats, max_attempts: int
+) -> requests.Response:
+    """Send a request until it succeeds, fails for good or runs out of attempts.
+
+    A request is attempted again after a connection error or a status listed in
+    `retry_statuses`, unless the wait would exceed the current deadline.
+
+    Args:
+        send: Function sending the request.
+        stats: Counters updated with the retries.
+        max_attempts: Maximum number of attempts.
+
+    Returns:
+        The last response received.
+    """
+    attempt = 1
+    response, connection_error = _attempt(send)
+    while (connection_error is not None or _is_retryable(response)) and _wait_before_retry(
+        attempt, max_attempts, _get_retry_after(response), stats
+    ):
+        attempt += 1
+        response, connection_error = _attempt(send)
+    if connection_error is not None:
+        raise connection_error
+    return response  # type: ignore
+
+
+def _attempt(
+    send: Callable[[], requests.Response],
+) -> "Tuple[Optional[requests.Response], Optional[requests.exceptions.ConnectionError]]":
+    """Send a request once.
+
+    Args:
+        send: Function sending the request.
+
+    Returns:
+        The response, or the connection error raised by the request.
+    """
+    try:
+        return send(), None
+    except requests.exceptions.ConnectionError as connection_error:
+        return None, connection_error
+
+
+def _is_retryable(response: Optional[requests.Response]) -> bool:
+    """Check whether the status of a response is worth a new attempt.
+
+    Args:
+        response: A response of the server.
+
+    Returns:
+        True if the status is listed in the `retry_statuses` parameter.
+    """
+    return response is not None and response.status_code in parameters.get_parameter(
+        "retry_statuses"
+    )
+
+
+def _get_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """Read the Retry-After header of a response.
+
+    Args:
+        response: A response of the server, None after a connection error.
+
+    Returns:
+        The delay requested by the server in seconds, if any.
+    """
+    if response is None:
+        return None
+    return parse_retry_after(response.headers.get("Retry-After"))
+
+
+def _wait_before_retry(
+    attempt: int, max_attempts: int, retry_after: Optional[float], stats: RetryStats
+) -> bool:
+    """Wait before a new attempt if one is allowed.
+
+    Args:
+        attempt: Number of attempts already made.
+        max_attempts: Maximum number of attempts.
+        retry_after: Delay requested by the server, in seconds.
+        stats: Counters updated with the retry.
+
+    Returns:
+        True if a new attempt must be made.
+    """
+    if max_attempts <= 1:
+        return False
+    if attempt >= max_attempts:
+        stats.record_exhausted()
+        return False
+    delay = get_backoff_delay(attempt, retry_after)
+    deadline = timeouts.get_current_deadline()
+    if deadline is not None and delay >= deadline.remaining():
+        stats.record_exhausted()
+        return False
+    stats.record_retry(delay)
+    time.sleep(delay)
+    return True
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""Connection pools of the client, shared by the keep-alive sessions of its threads."""
+
+import threading
+from typing import Any, Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from braincube_connector import constants
+
+_thread_settings = threading.local()
+
+
+class SessionPool(object):
+    """Connection pools to the SSO and the API servers, used by a session in each thread.
+
+    The SSO and the API servers each get their own pool. Every thread uses its own session, but
+    the sessions share the pools so that the connections are kept alive from one request to the
+    next. The pools block the requests above `pool_size` connections to a server until one of
+    them is released.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = constants.DEFAULT_POOL_SIZE,
+        pool_connections: int = constants.DEFAULT_POOL_CONNECTIONS,
+        keep_alive: bool = True,
+    ):
+        """Initialize SessionPool.
+
+        Args:
+            pool_size: Maximum number of connections kept open to each server.
+            pool_connections: Number of hosts whose connections are kept open.
+            keep_alive: Keep the connections open after each request.
+        """
+        self._pool_size = pool_size
+        self._pool_connections = pool_connections
+        self._keep_alive = keep_alive
+        self._lock = threading.Lock()
+        self._adapters: Dict[int, Dict[bool, HTTPAdapter]] = {}
+        self._local_sessions = threading.local()
+
+    def get_session(self, api: bool = True) -> requests.Session:
+        """Get the calling thread's session for the SSO or the API server.
+
+        The session uses pools of `pool_size` connections, or of the size set for the calling
+        thread by `use_pool_size`.
+
+        Args:
+            api: Get the session of the API server instead of the SSO server.
+
+        Returns:
+            A session bound to the connection pool of the server.
+        """
+        pool_size = getattr(_thread_settings, "pool_size", self._pool_size)
+        thread_sessions = self._get_thread_sessions()
+        session_key = (api, pool_size)
+        if session_key not in thread_sessions:
+            thread_sessions[session_key] = self._create_session(self._get_adapters(pool_size)[api])
+        return thread_sessions[session_key]
+
+    def close(self):
+        """Close the pooled connections."""
+        with self._lock:
+            for adapters in self._adapters.values():
+                for adapter in adapters.values():
+                    adapter.close()
+
+    def _get_thread_sessions(self) -> Dict[Tuple[bool, int], requests.Session]:
+        """Get the sessions of the calling thread.
+
+        Returns:
+            The sessions by server, True for the API server, and by pool size.
+        """
+        if not hasattr(self._local_sessions, "sessions"):
+            self._local_sessions.sessions = {}
+        return self._local_sessions.sessions
+
+    def _get_adapters(self, pool_size: int) -> Dict[bool, HTTPAdapter]:
+        """Get the connection pools of a size, creating them the first time.
+
+        Args:
+            pool_size: Maximum number of connections kept open to each server.
+
+        Returns:
+            The adapter of the API server (key True) and of the SSO server (key False).
+        """
+        with self._lock:
+            if pool_size not in self._adapters:
+                self._adapters[pool_size] = {
+                    api: HTTPAdapter(
+                        pool_connections=self._pool_connections,
+                        pool_maxsize=pool_size,
+                        pool_block=True,
+                    )
+                    for api in (False, True)
+                }
+            return self._adapters[pool_size]
+
+    def _create_session(self, adapter: HTTPAdapter) -> requests.Session:
+        """Create a session sending its requests through a connection pool.
+
+        Args:
+            adapter: Connection pool of the server.
+
+        Returns:
+            The new session.
+        """
+        session = requests.Session()
+        for prefix in ("https://", "http://"):
+            session.mount(prefix, adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+
+def from_config(config_dict: Dict[str, Any]) -> SessionPool:
+    """Create the connection pools configured by the `pool_*` and `keep_alive` keys.
+
+    Args:
+        config_dict: A configuration dictionary.
+
+    Returns:
+        The connection pools.
+    """
+    return SessionPool(
+        int(config_dict.get(constants.POOL_SIZE_KEY, constants.DEFAULT_POOL_SIZE)),
+        int(config_dict.get(constants.POOL_CONNECTIONS_KEY, constants.DEFAULT_POOL_CONNECTIONS)),
+        config_dict.get(constants.KEEP_ALIVE_KEY, True),  # noqa: WPS425
+    )
+
+
+def use_pool_size(pool_size: int):
+    """Send the requests of the calling thread through pools of another size.
+
+    The threads using the same size share their pools, separate from the pools of the other
+    threads, e.g. the threads of an AsyncClient do not wait for the connections of the client.
+
+    Args:
+        pool_size: Maximum number of connections kept open to each server.
+    """
+    _thread_settings.pool_size = pool_size
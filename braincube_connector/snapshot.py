@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""Local snapshots of the metadata of a braincube, to start without crawling the server."""
+
+import contextlib
+import contextvars
+import gzip
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from braincube_connector import client, instances, parallel, parameters
+
+INSTANCE_KEY = "metadata_snapshot"
+SNAPSHOT_VERSION = 1
+
+ResponseKey = Tuple[str, str]
+Responses = Dict[ResponseKey, Any]
+
+_recorded_responses: "contextvars.ContextVar[Optional[Responses]]" = contextvars.ContextVar(
+    "braincube_connector_snapshot_recorder", default=None
+)
+
+
+class MetadataSnapshot(object):
+    """The metadata responses of memory bases, recorded at a point in time."""
+
+    def __init__(self, roots: List[ResponseKey], responses: Responses, created_at: float):
+        """Initialize MetadataSnapshot.
+
+        Args:
+            roots: Keys of the memory base descriptions, used to check the freshness.
+            responses: All the recorded responses, keyed by braincube name and request path.
+            created_at: Time of the recording, in seconds since the epoch.
+        """
+        self._roots = roots
+        self._responses = responses
+        self._created_at = created_at
+
+    @classmethod
+    def record(
+        cls, braincube: "Braincube", mb_bcids: Optional[List[Any]] = None  # type: ignore  # noqa
+    ) -> "MetadataSnapshot":
+        """Request the metadata of memory bases.
+
+        Args:
+            braincube: Braincube containing the memory bases.
+            mb_bcids: bcIds of the memory bases. Default: all the memory bases.
+
+        Returns:
+            The snapshot of the memory bases.
+        """
+        roots: Responses = {}
+        responses: Responses = {}
+        with _recording(responses):
+            if mb_bcids is None:
+                mb_bcids = [mb.get_bcid() for mb in braincube.get_memory_base_list()]
+        for mb_bcid in mb_bcids:
+            with _recording(roots):
+                memory_base = braincube.get_memory_base(mb_bcid)
+            with _recording(responses):
+                _record_memory_base(memory_base)
+        responses.update(roots)
+        return cls(list(roots), responses, time.time())
+
+    @classmethod
+    def read(cls, file_path: str) -> "MetadataSnapshot":
+        """Read a snapshot file.
+
+        Args:
+            file_path: Path of the snapshot file, a gzipped json.
+
+        Returns:
+            The snapshot, empty if the file was written by another version of the connector.
+        """
+        with gzip.open(file_path, "rt", encoding="utf-8") as snapshot_file:
+            snapshot_json = json.load(snapshot_file)
+        if snapshot_json["version"] != SNAPSHOT_VERSION:
+            return cls([], {}, 0)
+        return cls(
+            [_to_key(root) for root in snapshot_json["roots"]],
+            {_to_key(row): row[2] for row in snapshot_json["responses"]},
+            snapshot_json["created_at"],
+        )
+
+    def write(self, file_path: str):
+        """Write the snapshot to a file.
+
+        Args:
+            file_path: Path of the snapshot file, a gzipped json.
+        """
+        snapshot_json = {
+            "version": SNAPSHOT_VERSION,
+            "created_at": self._created_at,
+            "roots": [list(key) for key in self._roots],
+            "responses": [[*key, response] for key, response in self._responses.items()],
+        }
+        with gzip.open(file_path, "wt", encoding="utf-8") as snapshot_file:
+            json.dump(snapshot_json, snapshot_file, separators=(",", ":"))
+
+    def get_responses(self) -> Responses:
+        """Get the recorded responses.
+
+        Returns:
+            The responses keyed by braincube name and request path.
+        """
+        return self._responses
+
+    def is_fresh(self, max_age: float, check: bool = True) -> bool:
+        """Check whether the snapshot can still be used.
+
+        Args:
+            max_age: Maximum age of the snapshot in seconds.
+            check: Compare the memory base descriptions with the server, with one request per
+                   memory base.
+
+        Returns:
+            True if the snapshot is younger than max_age and its memory bases are unchanged.
+        """
+        if not self._roots or time.time() - self._created_at > max_age:
+            return False
+        if not check:
+            return True
+        current_roots = parallel.map_in_order(
+            lambda key: client.request_ws(key[1], braincube_name=key[0]),
+            self._roots,
+            parameters.get_parameter("metadata_workers"),
+        )
+        return all(
+            self._responses.get(key) == current_root
+            for key, current_root in zip(self._roots, current_roots)
+        )
+
+
+def is_recording() -> bool:
+    """Check whether the metadata requests are recorded for a snapshot.
+
+    Returns:
+        True within `export_snapshot`.
+    """
+    return _recorded_responses.get() is not None
+
+
+def get_or_request(braincube_name: str, path: str, request: Callable[[], Any]) -> Any:
+    """Answer a metadata request from the loaded snapshot, or send it.
+
+    Args:
+        braincube_name: Name of the braincube on which the request is made.
+        path: Path of the request.
+        request: Function sending the request.
+
+    Returns:
+        The json response.
+    """
+    key = (braincube_name, path)
+    recorded = _recorded_responses.get()
+    if recorded is None:
+        loaded = instances.get_instance(INSTANCE_KEY)
+        if loaded is not None and key in loaded:
+            return loaded[key]
+    response = request()
+    if recorded is not None:
+        recorded[key] = response
+    return response
+
+
+def export_snapshot(
+    braincube: "Braincube",  # type: ignore  # noqa
+    file_path: str,
+    mb_bcids: Optional[List[Any]] = None,
+):
+    """Export the metadata of memory bases to a snapshot file.
+
+    The snapshot holds the memory bases with their variables, jobs, datagroups and events, as
+    requested by their `get_<entity>` and `get_<entity>_list` methods. The descriptions of the
+    entities are requested concurrently, up to `metadata_workers` at the same time.
+
+    Args:
+        braincube: Braincube containing the memory bases.
+        file_path: Path of the snapshot file, a gzipped json.
+        mb_bcids: bcIds of the memory bases to export. Default: all the memory bases.
+    """
+    MetadataSnapshot.record(braincube, mb_bcids).write(file_path)
+
+
+def load_snapshot(file_path: str, max_age: Optional[float] = None, check: bool = True) -> bool:
+    """Answer the metadata requests from a snapshot file, if it is still fresh.
+
+    Args:
+        file_path: Path of a file written by `export_snapshot`.
+        max_age: Maximum age of the snapshot in seconds. Default: the `snapshot_max_age`
+                 parameter.
+        check: Compare the memory base descriptions with the server, with one request per
+               memory base.
+
+    Returns:
+        True if the snapshot is loaded, False if it is outdated.
+    """
+    if max_age is None:
+        max_age = parameters.get_parameter("snapshot_max_age")
+    metadata_snapshot = MetadataSnapshot.read(file_path)
+    if not metadata_snapshot.is_fresh(max_age, check):  # type: ignore
+        return False
+    instances.add_instance(INSTANCE_KEY, metadata_snapshot.get_responses())
+    return True
+
+
+def clear_snapshot():
+    """Send the metadata requests to the server again."""
+    instances.add_instance(INSTANCE_KEY, None)
+
+
+@contextlib.contextmanager
+def _recording(responses: Responses) -> Iterator[Responses]:
+    """Record the metadata responses received within the scope.
+
+    Args:
+        responses: Dictionary in which the responses are recorded.
+
+    Yields:
+        The dictionary of the responses.
+    """
+    token = _recorded_responses.set(responses)
+    try:
+        yield responses
+    finally:
+        _recorded_responses.reset(token)
+
+
+def _record_memory_base(memory_base: "MemoryBase"):  # type: ignore  # noqa
+    """Request the collections of a memory base and the descriptions of their entities.
+
+    Args:
+        memory_base: Memory base to record.
+    """
+    getters = (
+        (memory_base.get_variable_list, memory_base.get_variable),
+        (memory_base.get_job_list, memory_base.get_job),
+        (memory_base.get_datagroup_list, memory_base.get_datagroup),
+        (memory_base.get_event_list, memory_base.get_event),
+    )
+    for get_list, get_entity in getters:
+        parallel.map_in_order(
+            get_entity,
+            [entity.get_bcid() for entity in get_list()],
+            parameters.get_parameter("metadata_workers"),
+        )
+
+
+def _to_key(row: List[Any]) -> ResponseKey:
+    """Read the key of a response from a snapshot file.
+
+    Args:
+        row: Braincube name and request path, optionally followed by the response.
+
+    Returns:
+        The braincube name and the request path.
+    """
+    return (row[0], row[1])
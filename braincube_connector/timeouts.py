@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""Deadlines shared by all the requests made to fulfil a single call."""
+
+import contextlib
+import contextvars
+import time
+from typing import Any, Iterator, Optional, Tuple, Union
+
+import requests
+
+_current_deadline: "contextvars.ContextVar[Optional[Deadline]]" = contextvars.ContextVar(
+    "braincube_connector_deadline", default=None
+)
+
+_END_OF_ITERATION = object()
+
+
+class DeadlineExceededError(requests.exceptions.Timeout):
+    """Raised when the time budget of a call is exhausted."""
+
+
+class Deadline(object):
+    """A point in time after which no more request must be sent."""
+
+    def __init__(self, budget: float):
+        """Initialize Deadline.
+
+        Args:
+            budget: Time allowed from now, in seconds.
+        """
+        self._budget = budget
+        self._end = time.monotonic() + budget
+
+    def __repr__(self) -> str:
+        """Produce the a detailed description of the Deadline object.
+
+        Returns:
+            A detailed description of the Deadline object.
+        """
+        return "<Deadline(budget={0}, remaining={1:.3f})>".format(self._budget, self.remaining())
+
+    def remaining(self) -> float:
+        """Get the time left before the deadline.
+
+        Returns:
+            The remaining time in seconds, 0 when the deadline has passed.
+        """
+        return max(self._end - time.monotonic(), 0)
+
+    def check(self):
+        """Raise a DeadlineExceededError if the deadline has passed."""
+        if self.remaining() <= 0:
+            raise DeadlineExceededError(
+                "The deadline of {0} seconds has been exceeded.".format(self._budget)
+            )
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the call in progress.
+
+    Returns:
+        The current deadline, None if the call has no deadline.
+    """
+    return _current_deadline.get()
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: Union[None, float, Deadline] = None) -> Iterator[Optional[Deadline]]:
+    """Share a deadline with all the requests made within the scope.
+
+    A nested scope never extends the deadline of its parent scope.
+
+    Args:
+        deadline: A Deadline or a time budget in seconds. None keeps the current deadline.
+
+    Yields:
+        The deadline applied within the scope.
+    """
+    current = get_current_deadline()
+    if deadline is None:
+        yield current
+        return
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline)
+    if current is not None and current.remaining() < deadline.remaining():
+        deadline = current
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def to_deadline(deadline: Union[None, float, Deadline]) -> Optional[Deadline]:
+    """Start the countdown of a time budget.
+
+    Args:
+        deadline: A Deadline, a time budget in seconds or None.
+
+    Returns:
+        The Deadline, None if there is no budget.
+    """
+    if deadline is None or isinstance(deadline, Deadline):
+        return deadline
+    return Deadline(deadline)
+
+
+def iter_within_deadline(
+    iterator: Iterator[Any], deadline: Union[None, float, Deadline] = None
+) -> Iterator[Any]:
+    """Produce the items of an iterator within a deadline scope.
+
+    The scope only covers the production of each item, it is left while the consumer
+    processes the item.
+
+    Args:
+        iterator: Iterator producing the items, e.g. by sending requests.
+        deadline: A Deadline or a time budget in seconds shared by all the items.
+
+    Yields:
+        The items of the iterator.
+    """
+    deadline = to_deadline(deadline)
+    while True:
+        with deadline_scope(deadline):
+            next_item = next(iterator, _END_OF_ITERATION)
+        if next_item is _END_OF_ITERATION:
+            return
+        yield next_item
+
+
+def get_request_timeouts(timeouts: Tuple[float, float]) -> Tuple[float, float]:
+    """Shorten the connect and read timeouts of a request to fit in the current deadline.
+
+    Args:
+        timeouts: Connect and read timeouts, in seconds.
+
+    Returns:
+        The timeouts to use for the request.
+    """
+    deadline = get_current_deadline()
+    if deadline is None:
+        return timeouts
+    deadline.check()
+    remaining = deadline.remaining()
+    return (min(timeouts[0], remaining), min(timeouts[1], remaining))
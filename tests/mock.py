@@ -4,7 +4,7 @@
 
 import pytest
 
-from braincube_connector import braincube, client, constants, parameters
+from braincube_connector import braincube, client, constants, parameters, retry, sessions
 from braincube_connector.bases import base, base_entity
 from braincube_connector.memory_base import memory_base
 from braincube_connector.memory_base.nested_resources import (
@@ -25,7 +25,10 @@ def mock_client(mocker):
     instance._braincube_base_url = "https://api.a.b"
     instance._pa_token = "abcd"
     instance._timeout = 60
+    instance._timeouts = (60, 60)
     instance._verify = True
+    instance._session_pool = sessions.SessionPool()
+    instance._retry_stats = retry.RetryStats()
     instance._headers = {
         "Content-Type": "application/json",
         "Accept": "application/json",
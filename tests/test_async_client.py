@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the async_client module."""
+
+import asyncio
+import threading
+
+import pytest
+import responses
+
+from braincube_connector import async_client, parameters, timeouts
+from tests.mock import mock_client, mb_obj, bc_obj, create_mock_job
+from tests.test_bases.test_base import LOAD_URL
+
+
+@pytest.fixture
+def async_cli(mock_client):
+    cli = async_client.AsyncClient(max_concurrency=4)
+    yield cli
+    cli.close()
+
+
+def test_create_async_client(mock_client):
+    cli = async_client.AsyncClient()
+    assert cli._client is mock_client
+    assert cli._max_concurrency == 32
+    assert str(cli) == "AsyncClient(client=Client(domain=https://a.b), max_concurrency=32)"
+    cli.close()
+
+
+def test_async_pools(mock_client, async_cli):
+    """Test that the threads of the AsyncClient use its own connection pools."""
+    session_pool = mock_client._session_pool
+    adapter = asyncio.run(async_cli.run(session_pool.get_session)).get_adapter("https://api.a.b")
+    assert adapter._pool_maxsize == 4
+    assert session_pool.get_session().get_adapter("https://api.a.b")._pool_maxsize == 10
+
+
+@responses.activate
+def test_request_ws(async_cli):
+    responses.add(responses.GET, LOAD_URL, json={"val": 1}, status=200)
+    assert asyncio.run(async_cli.request_ws("path")) == {"val": 1}
+
+
+def test_run_concurrency(async_cli):
+    """Test that max_concurrency calls run at the same time."""
+    barrier = threading.Barrier(4, timeout=5)
+
+    async def run_all():
+        return await asyncio.gather(*[async_cli.run(barrier.wait) for _ in range(4)])
+
+    assert sorted(asyncio.run(run_all())) == [0, 1, 2, 3]
+
+
+def test_run_deadline(async_cli):
+    async def run_with_deadline():
+        with timeouts.deadline_scope(10) as deadline:
+            return deadline, await async_cli.run(timeouts.get_current_deadline)
+
+    deadline, seen_deadline = asyncio.run(run_with_deadline())
+    assert seen_deadline is deadline
+
+
+@pytest.mark.parametrize("n_items, expected_pages", [(0, [0]), (3, [0, 1, 2]), (9, list(range(7)))])
+def test_get_variable_list(mocker, async_cli, mb_obj, n_items, expected_pages):
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    items = list(range(n_items))
+    requested_pages = []
+
+    def get_variable_list(page, page_size):
+        requested_pages.append(page)
+        return items[page * page_size : (page + 1) * page_size]
+
+    mocker.patch.object(mb_obj, "get_variable_list", side_effect=get_variable_list)
+    parameters.set_parameter({"page_size": 2})
+    assert asyncio.run(async_cli.get_variable_list(mb_obj)) == items
+    assert sorted(requested_pages) == expected_pages
+
+
+def test_get_memory_base_list_page(mocker, async_cli, bc_obj):
+    getter = mocker.patch.object(bc_obj, "get_memory_base_list", return_value=["mb"])
+    assert asyncio.run(async_cli.get_memory_base_list(bc_obj, page=2, page_size=5)) == ["mb"]
+    getter.assert_called_once_with(page=2, page_size=5)
+
+
+def test_get_data(mocker, async_cli, mb_obj):
+    get_data = mocker.patch.object(mb_obj, "get_data", return_value={1: [1]})
+    assert asyncio.run(async_cli.get_data(mb_obj, [1], dataframe=True)) == {1: [1]}
+    get_data.assert_called_once_with([1], None, "bcid", True, None)
+
+
+def test_get_job_data(mocker, async_cli, create_mock_job):
+    job = create_mock_job()
+    get_data = mocker.patch.object(job, "get_data", return_value={1: [1]})
+    assert asyncio.run(async_cli.get_job_data(job, ["filter"], deadline=5)) == {1: [1]}
+    get_data.assert_called_once_with(["filter"], 5)
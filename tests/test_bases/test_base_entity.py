@@ -3,9 +3,10 @@
 """Tests for the bases module."""
 
 import re
+import time
 import responses
 
-from braincube_connector import parameters
+from braincube_connector import parameters, timeouts
 from braincube_connector.bases import base_entity
 from tests.mock import entity_obj, mock_client, base_obj
 import pytest
@@ -109,3 +110,44 @@ def test_get_uuid(mocker):
     json_dict = {"bcId": "1", "name": "abcd", "uuid": "{0}_{1}".format("base64", uuid)}
     obj = base_entity.BaseEntity.create_from_json(json_dict, "path/{bcid}", None)
     assert obj.get_uuid() == uuid
+
+
+def test_create_collection_from_path_deadline(mock_client, mocker):
+    """Test that all the pages of a collection share the same deadline."""
+    deadlines = []
+
+    def mock_request_ws(path, **kwargs):
+        deadlines.append(timeouts.get_current_deadline())
+        return {"items": [{"name": "abcd", "bcId": "1"}] if len(deadlines) < 3 else []}
+
+    mocker.patch("braincube_connector.client.request_ws", side_effect=mock_request_ws)
+    base_entity.BaseEntity.create_collection_from_path(
+        "{webservice}/path/all/summary", "{webservice}/path/{bcid}", None, deadline=10
+    )
+    assert len(deadlines) == 3
+    assert deadlines[0] is not None
+    assert all(deadline is deadlines[0] for deadline in deadlines)
+
+
+@pytest.mark.parametrize("n_items, page_workers", [(0, 3), (7, 3), (20, 4), (9, 8)])
+def test_create_collection_from_path_concurrently(mock_client, mocker, n_items, page_workers):
+    """Test that the concurrent pages keep the server order and stop at the empty page."""
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    items = [{"name": "name{}".format(i), "bcId": str(i)} for i in range(n_items)]
+    requested_offsets = []
+
+    def mock_request_ws(path, **kwargs):
+        offset = int(path.split("offset=")[1].split("&")[0])
+        requested_offsets.append(offset)
+        time.sleep(0.01 * ((offset // 2) % 3))  # Pages complete out of order.
+        return {"items": items[offset : offset + 2]}
+
+    mocker.patch("braincube_connector.client.request_ws", side_effect=mock_request_ws)
+    parameters.set_parameter({"page_size": 2, "page_workers": page_workers})
+    entities = base_entity.BaseEntity.create_collection_from_path(
+        "{webservice}/path/all/summary", "{webservice}/path/{bcid}", None
+    )
+    assert [entity.get_bcid() for entity in entities] == [item["bcId"] for item in items]
+    n_pages = (n_items + 1) // 2 + 1  # Including the trailing empty page.
+    assert set(range(0, n_pages * 2, 2)) <= set(requested_offsets)
+    assert len(requested_offsets) <= n_pages + page_workers - 1
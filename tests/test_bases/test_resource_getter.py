@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the resource_getter module."""
 
+from braincube_connector import cache, parameters
 from braincube_connector.bases import resource_getter, base_entity
 
 import pytest
@@ -49,6 +50,16 @@ def test_get_resource(mock_entity_class, resource_parent, bcid):
     )
 
 
+def test_get_resource_entity_cache(mocker, mock_entity_class, resource_parent):
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    parameters.set_parameter({"entity_cache": True})
+    first = resource_parent._get_resource(mock_entity_class, bcid=1)
+    assert resource_parent._get_resource(mock_entity_class, bcid="1") is first
+    resource_parent._get_resource(mock_entity_class, bcid=2)
+    assert mock_entity_class.create_singleton_from_path.call_count == 2
+    assert cache.get_entity_cache().get_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
 def test_get_resource_list(mock_entity_class, resource_parent):
     resource_parent._get_resource_list(mock_entity_class)
     mock_entity_class.create_collection_from_path.assert_called_once_with(
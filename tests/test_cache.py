@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the cache module."""
+
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from braincube_connector import cache, timeouts
+
+
+def test_cache_stats():
+    stats = cache.CacheStats()
+    stats.record_hit()
+    stats.record_hit()
+    stats.record_miss()
+    assert stats.get_stats() == {"hits": 2, "misses": 1}
+    stats.reset()
+    assert stats.get_stats() == {"hits": 0, "misses": 0}
+
+
+def test_timed_value(mocker):
+    loader = mocker.Mock(side_effect=[1, 2, 3])
+    timed_value = cache.TimedValue(loader)
+    assert timed_value.get(60) == 1
+    assert timed_value.get(60) == 1
+    assert loader.call_count == 1
+    timed_value.invalidate()
+    assert timed_value.get(60) == 2
+    assert timed_value.get(0) == 3
+    assert timed_value.get_stats() == {"hits": 1, "misses": 3}
+
+
+def test_timed_value_expiration(mocker):
+    monotonic = mocker.patch("braincube_connector.cache.time.monotonic", return_value=100)
+    loader = mocker.Mock(side_effect=[1, 2])
+    timed_value = cache.TimedValue(loader)
+    assert timed_value.get(10) == 1
+    monotonic.return_value = 109
+    assert timed_value.get(10) == 1
+    monotonic.return_value = 110
+    assert timed_value.get(10) == 2
+
+
+def test_lru_cache(mocker):
+    loader = mocker.Mock(side_effect=["a", "b", "c", "d"])
+    lru_cache = cache.LRUCache()
+    assert lru_cache.get(1, loader, 60, 2) == "a"
+    assert lru_cache.get(2, loader, 60, 2) == "b"
+    assert lru_cache.get(1, loader, 60, 2) == "a"
+    assert lru_cache.get(3, loader, 60, 2) == "c"
+    assert len(lru_cache) == 2
+    assert lru_cache.get(1, loader, 60, 2) == "a"
+    assert lru_cache.get(2, loader, 60, 2) == "d"
+    assert lru_cache.get_stats() == {"hits": 2, "misses": 4, "size": 2}
+
+
+def test_lru_cache_expiration(mocker):
+    monotonic = mocker.patch("braincube_connector.cache.time.monotonic", return_value=100)
+    loader = mocker.Mock(side_effect=[1, 2, 3])
+    lru_cache = cache.LRUCache()
+    assert lru_cache.get("key", loader, 10, 5) == 1
+    monotonic.return_value = 110
+    assert lru_cache.get("key", loader, 10, 5) == 2
+    lru_cache.invalidate("key")
+    assert lru_cache.get("key", loader, 10, 5) == 3
+    lru_cache.invalidate()
+    assert len(lru_cache) == 0
+
+
+def test_get_entity_cache(mocker):
+    mocker.patch.dict("braincube_connector.instances.instances", {})
+    entity_cache = cache.get_entity_cache()
+    assert isinstance(entity_cache, cache.LRUCache)
+    assert cache.get_entity_cache() is entity_cache
+
+
+def test_single_flight():
+    single_flight = cache.SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["row"]
+
+    with futures.ThreadPoolExecutor(5) as executor:
+        leader = executor.submit(single_flight.run, "key", slow_call)
+        started.wait(5)
+        followers = [executor.submit(single_flight.run, "key", slow_call) for _ in range(3)]
+        other = executor.submit(single_flight.run, "other", lambda: ["other"])
+        assert other.result(5) == ["other"]
+        while single_flight.get_stats()["hits"] < 3:
+            release.wait(0.01)
+        release.set()
+        results = [leader.result(5)] + [follower.result(5) for follower in followers]
+    assert len(calls) == 1
+    assert all(call_result is results[0] for call_result in results)
+    assert single_flight.get_stats() == {"hits": 3, "misses": 2}
+    assert single_flight.run("key", lambda: ["new"]) == ["new"]
+
+
+class Interrupted(BaseException):
+    """An error that is not an Exception, e.g. as KeyboardInterrupt."""
+
+
+@pytest.mark.parametrize("error", [ValueError("failed"), Interrupted()])
+def test_single_flight_error(error):
+    """Test that the waiting calls get the error of the leader instead of running again."""
+    single_flight = cache.SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def failing_call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise error
+
+    with futures.ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(single_flight.run, "key", failing_call)
+        started.wait(5)
+        follower = executor.submit(single_flight.run, "key", failing_call)
+        while single_flight.get_stats()["hits"] < 1:
+            release.wait(0.01)
+        release.set()
+        for call in (leader, follower):
+            with pytest.raises(type(error)):
+                call.result(5)
+    assert len(calls) == 1
+    assert single_flight.get_stats() == {"hits": 1, "misses": 1}
+
+
+def test_single_flight_persistent_error():
+    """Test that a persistent failure is a single call, with the same latency for all callers."""
+    single_flight = cache.SingleFlight()
+    calls, ended_at = [], []
+
+    def failing_call():
+        calls.append(1)
+        while single_flight.get_stats()["hits"] < 4:
+            time.sleep(0.01)
+        time.sleep(0.2)
+        raise ValueError("failed")
+
+    def timed_call():
+        try:
+            single_flight.run("key", failing_call)
+        finally:
+            ended_at.append(time.monotonic())
+
+    with futures.ThreadPoolExecutor(5) as executor:
+        callers = [executor.submit(timed_call) for _ in range(5)]
+        for caller in callers:
+            with pytest.raises(ValueError):
+                caller.result(5)
+    assert len(calls) == 1
+    assert max(ended_at) - min(ended_at) < 0.1
+
+
+def test_single_flight_leader_deadline():
+    """Test that the waiting calls run again when the leader exceeded its own deadline."""
+    single_flight = cache.SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def late_call():
+        calls.append(1)
+        if len(calls) > 1:
+            return ["row"]
+        started.set()
+        release.wait(5)
+        raise timeouts.DeadlineExceededError("late")
+
+    with futures.ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(single_flight.run, "key", late_call)
+        started.wait(5)
+        follower = executor.submit(single_flight.run, "key", late_call)
+        while single_flight.get_stats()["hits"] < 1:
+            release.wait(0.01)
+        release.set()
+        with pytest.raises(timeouts.DeadlineExceededError):
+            leader.result(5)
+        assert follower.result(5) == ["row"]
+    assert len(calls) == 2
+    assert single_flight.get_stats() == {"hits": 1, "misses": 2}
+
+
+def test_single_flight_deadline():
+    single_flight = cache.SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_call():
+        started.set()
+        release.wait(5)
+
+    with futures.ThreadPoolExecutor(1) as executor:
+        leader = executor.submit(single_flight.run, "key", slow_call)
+        started.wait(5)
+        with timeouts.deadline_scope(0.05):
+            with pytest.raises(timeouts.DeadlineExceededError):
+                single_flight.run("key", slow_call)
+        release.set()
+        leader.result(5)
+
+
+def test_get_request_coalescer(mocker):
+    mocker.patch.dict("braincube_connector.instances.instances", {})
+    coalescer = cache.get_request_coalescer()
+    assert isinstance(coalescer, cache.SingleFlight)
+    assert cache.get_request_coalescer() is coalescer
@@ -10,7 +10,7 @@ import responses
 import requests
 from requests.exceptions import HTTPError
 
-from braincube_connector import client, constants, instances
+from braincube_connector import client, constants, instances, timeouts
 from braincube_connector.bases import base
 from tests.mock import mock_client
 from tests.test_bases.test_base import LOAD_URL
@@ -183,3 +183,81 @@ def test_client_verify(mocker, verify_cert_config, expected_verify, clean_client
         config_dict=config_dict,
     )
     assert test_client._verify == expected_verify
+
+
+@responses.activate
+def test_request_ws_uses_session(mock_client, mocker):
+    """Test that request_ws sends the requests through the pooled session."""
+    responses.add(responses.GET, LOAD_URL, json={"val": 1}, status=200)
+    session = mock_client._session_pool.get_session(api=True)
+    spy = mocker.spy(session, "request")
+    mock_client.request_ws("path")
+    spy.assert_called_once_with(
+        "GET", LOAD_URL, headers=mock_client._headers, data=None, verify=True, timeout=(60, 60)
+    )
+
+
+def test_client_timeouts(mocker, clean_client_instances):
+    """Test the connect and read timeouts read from the configuration."""
+    mocker.patch.object(client.Client, "_request_braincubes", lambda x: [base.Base("test")])
+    config_dict = {
+        constants.API_KEY: "abcd",
+        constants.DOMAIN_KEY: "mock.com",
+        constants.CONNECT_TIMEOUT_KEY: 3,
+    }
+    test_client = client.get_instance(config_dict=config_dict)
+    assert test_client._timeouts == (3, 60)
+
+
+@responses.activate
+def test_request_ws_deadline(mock_client, mocker):
+    """Test that request_ws fits the request timeouts in the current deadline."""
+    responses.add(responses.GET, LOAD_URL, json={"val": 1}, status=200)
+    spy = mocker.spy(mock_client._session_pool.get_session(api=True), "request")
+    with timeouts.deadline_scope(5):
+        mock_client.request_ws("path")
+    connect_timeout, read_timeout = spy.call_args[1]["timeout"]
+    assert 0 < connect_timeout <= 5
+    assert 0 < read_timeout <= 5
+    with timeouts.deadline_scope(timeouts.Deadline(0)):
+        with pytest.raises(timeouts.DeadlineExceededError):
+            mock_client.request_ws("path")
+    assert spy.call_count == 1
+
+
+def test_request_ws_timeout_past_deadline(mock_client, mocker):
+    """Test that a timeout caused by the deadline raises a DeadlineExceededError."""
+    session = mock_client._session_pool.get_session(api=True)
+    mocker.patch.object(session, "request", side_effect=requests.exceptions.ReadTimeout("slow"))
+    with pytest.raises(requests.exceptions.ReadTimeout) as excinfo:
+        mock_client.request_ws("path")
+    assert not isinstance(excinfo.value, timeouts.DeadlineExceededError)
+    clock = mocker.patch("braincube_connector.timeouts.time.monotonic", return_value=0)
+
+    def slow_request(*args, **kwargs):
+        clock.return_value = 6
+        raise requests.exceptions.ReadTimeout("slow")
+
+    session.request.side_effect = slow_request
+    with timeouts.deadline_scope(5):
+        with pytest.raises(timeouts.DeadlineExceededError):
+            mock_client.request_ws("path")
+
+
+@responses.activate
+def test_request_ws_retry(mock_client, mocker):
+    """Test that the idempotent requests are retried on transient statuses."""
+    mocker.patch("braincube_connector.retry.time.sleep")
+    responses.add(responses.GET, LOAD_URL, status=503)
+    responses.add(responses.GET, LOAD_URL, json={"val": 1}, status=200)
+    assert mock_client.request_ws("path") == {"val": 1}
+    assert mock_client.get_retry_stats()["retries"] == 1
+
+    responses.add(responses.POST, LOAD_URL, status=503)
+    responses.add(responses.POST, LOAD_URL, status=503)
+    responses.add(responses.POST, LOAD_URL, json={"val": 2}, status=200)
+    with pytest.raises(HTTPError):
+        mock_client.request_ws("path", rtype="POST")
+    assert mock_client.get_retry_stats()["retries"] == 1
+    assert mock_client.request_ws("path", rtype="POST", idempotent=True) == {"val": 2}
+    assert mock_client.get_retry_stats()["retries"] == 2
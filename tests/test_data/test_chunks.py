@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the chunks module."""
+
+import pytest
+
+from braincube_connector import parameters
+from braincube_connector.data import chunks
+
+
+@pytest.fixture
+def chunk_size():
+    parameters.set_parameter({"data_chunk_size": 2})
+    yield 2
+    parameters.reset_parameter()
+
+
+def test_get_order_bcid():
+    assert chunks.get_order_bcid("mb1/d101") == 101
+
+
+def test_split_columns_single_chunk():
+    assert chunks.split_columns([1, 2, 3], "mb1/d9") == [[1, 2, 3]]
+
+
+@pytest.mark.parametrize(
+    "variable_ids, expected",
+    [
+        ([1, 2, 3], [[9, 1, 2], [9, 3]]),
+        ([1, 9, 3, 4], [[1, 9], [9, 3, 4]]),
+        (["1", "9", "3"], [["1", "9"], [9, "3"]]),
+    ],
+)
+def test_split_columns(chunk_size, variable_ids, expected):
+    assert chunks.split_columns(variable_ids, "mb1/d9") == expected
+
+
+def test_stitch_chunks_single():
+    dataset = {1: [1, 2]}
+    assert chunks.stitch_chunks([dataset], [1], "mb1/d9") is dataset
+
+
+def test_stitch_chunks():
+    datasets = [{9: [10, 20], 1: [1, 2]}, {9: [10, 20], 3: [3, 4]}]
+    assert chunks.stitch_chunks(datasets, [3, 1], "mb1/d9") == {3: [3, 4], 1: [1, 2]}
+
+
+def test_stitch_chunks_misaligned():
+    datasets = [
+        {9: [10, 20, 20, 30], 1: [1, 2, 3, 4]},
+        {9: [5, 10, 20, 20, 40], 2: ["a", "b", "c", "d", "e"]},
+    ]
+    assert chunks.stitch_chunks(datasets, [9, 1, 2], "mb1/d9") == {
+        9: [10, 20, 20, 30],
+        1: [1, 2, 3, 4],
+        2: ["b", "c", "d", None],
+    }
+
+
+def test_stitch_chunks_missing_order():
+    datasets = [{9: [10, 20], 1: [1, 2]}, {2: [3, 4]}]
+    assert chunks.stitch_chunks(datasets, [1, 2], "mb1/d9") == {1: [1, 2], 2: [3, 4]}
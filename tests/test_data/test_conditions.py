@@ -26,9 +26,21 @@ def create_mock_var(mocker):
         (None, []),
         (["condA"], ["condA"]),
         (["condA", "condB"], [{"AND": ["condA", "condB"]}]),
+        (["condA", "condB", "condC"], [{"AND": [{"AND": ["condA", "condB"]}, "condC"]}]),
         (
             ["condA", "condB", "condC", "condD"],
-            [{"AND": [{"AND": [{"AND": ["condA", "condB"]}, "condC"]}, "condD"]}],
+            [{"AND": [{"AND": ["condA", "condB"]}, {"AND": ["condC", "condD"]}]}],
+        ),
+        (
+            [{"AND": [{"AND": ["condA", "condB"]}, "condC"]}, "condA", {"OR": ["condD", "condE"]}],
+            [
+                {
+                    "AND": [
+                        {"AND": ["condA", "condB"]},
+                        {"AND": ["condC", {"OR": ["condD", "condE"]}]},
+                    ]
+                }
+            ],
         ),
     ],
 )
@@ -36,15 +48,71 @@ def test_combine_filters(filter_list, combined_filters):
     assert conditions.combine_filters(filter_list) == combined_filters
 
 
+def test_combine_filters_depth():
+    filter_list = ["cond{0}".format(index) for index in range(5000)]
+    combined_filter = conditions.combine_filters(filter_list)[0]
+    depth = 0
+    while isinstance(combined_filter, dict):
+        combined_filter = combined_filter["AND"][0]
+        depth += 1
+    assert depth == 13
+    assert conditions.combine_filters(filter_list * 2) == conditions.combine_filters(filter_list)
+
+
+@pytest.mark.parametrize(
+    "filter_list, combined_filters",
+    [
+        (
+            [{"GREAT": ["mb1/d1", 0]}, {"GREAT": ["mb1/d1", 5]}, {"LESS": ["mb1/d1", 10]}],
+            [{"AND": [{"GREAT": ["mb1/d1", 5]}, {"LESS": ["mb1/d1", 10]}]}],
+        ),
+        (
+            [
+                {"BETWEEN": ["mb1/d1", 0, 10]},
+                {"BETWEEN": ["mb1/d2", 0, 1]},
+                {"BETWEEN": ["mb1/d1", 5, 20]},
+            ],
+            [{"AND": [{"BETWEEN": ["mb1/d1", 5, 10]}, {"BETWEEN": ["mb1/d2", 0, 1]}]}],
+        ),
+        (
+            [{"BETWEEN": ["mb1/d1", 0, 1]}, {"BETWEEN": ["mb1/d1", 5, 10]}],
+            [{"BETWEEN": ["mb1/d1", 5, 1]}],
+        ),
+        (
+            [{"LESS": ["mb1/d1", "20200101_000000"]}, {"LESS": ["mb1/d1", 10]}],
+            [{"AND": [{"LESS": ["mb1/d1", "20200101_000000"]}, {"LESS": ["mb1/d1", 10]}]}],
+        ),
+        (
+            [{"EQUALS": ["mb1/d1", ["A"]]}, {"EQUALS": ["mb1/d1", ["B"]]}],
+            [{"AND": [{"EQUALS": ["mb1/d1", ["A"]]}, {"EQUALS": ["mb1/d1", ["B"]]}]}],
+        ),
+    ],
+)
+def test_combine_filters_ranges(filter_list, combined_filters):
+    assert conditions.combine_filters(filter_list) == combined_filters
+
+
+def test_combine_filters_modalities():
+    filter_list = [
+        {"EQUALS": ["mb1/d1", ["A"]]},
+        {"GREAT": ["mb1/d2", 0]},
+        {"OR": [{"EQUALS": ["mb1/d1", ["B", "A"]]}, {"EQUALS": ["mb1/d1", 2.0]}]},
+        {"GREAT": ["mb1/d2", 1]},
+    ]
+    assert conditions.combine_filters(filter_list, operator="OR") == [
+        {
+            "OR": [
+                {"OR": [{"EQUALS": ["mb1/d1", ["A", "B"]]}, {"GREAT": ["mb1/d2", 0]}]},
+                {"OR": [{"EQUALS": ["mb1/d1", 2.0]}, {"GREAT": ["mb1/d2", 1]}]},
+            ]
+        }
+    ]
+
+
 def test_discrete_filter(mocker, create_mock_var):
     var_mock = create_mock_var("mb1/d1")
     cond = {"modalities": ["A", "B", "C"]}
-    assert conditions._discrete_filter(var_mock, cond) == {
-        "OR": [
-            {"OR": [{"EQUALS": ["mb1/d1", ["A"]]}, {"EQUALS": ["mb1/d1", ["B"]]}]},
-            {"EQUALS": ["mb1/d1", ["C"]]},
-        ]
-    }
+    assert conditions._discrete_filter(var_mock, cond) == {"EQUALS": ["mb1/d1", ["A", "B", "C"]]}
     assert conditions._discrete_filter(var_mock, {}) is None
 
 
@@ -70,6 +138,19 @@ def test_mini_maxi_filter(mocker, create_mock_var, var_cond, var_type, filter):
     assert conditions._mini_maxi_filter(var_mock, var_cond) == filter
 
 
+@pytest.mark.parametrize(
+    "minimum, maximum, output",
+    [
+        (0.5, 2, {"BETWEEN": ["mb1/d1", 0.5, 2]}),
+        (0.5, None, {"GREAT": ["mb1/d1", 0.5]}),
+        (None, None, None),
+    ],
+)
+def test_build_range_filter(create_mock_var, minimum, maximum, output):
+    var_mock = create_mock_var("mb1/d1", "NUMERIC")
+    assert conditions.build_range_filter(var_mock, minimum, maximum) == output
+
+
 @pytest.mark.parametrize(
     "type, to_patch, patch, positive, output",
     [
@@ -5,8 +5,12 @@
 from braincube_connector import parameters
 from braincube_connector.data import data
 from datetime import datetime
+import numpy as np
+import pandas as pd
 import pytest
 import json
+import threading
+from concurrent import futures
 
 DATASET = {
     "datadefs": [
@@ -56,6 +60,29 @@ def test_extract_format_data():
     assert type(formated_dataset[5][0]) is str
 
 
+@pytest.mark.parametrize("arrays", [False, True])
+def test_extract_format_data_datetime64(arrays):
+    parameters.set_parameter({"parse_date": "fast"})
+    formated_dataset = data._extract_format_data(DATASET, arrays=arrays)
+    assert str(formated_dataset[4].dtype) == "datetime64[ns, UTC]"
+    parameters.set_parameter({"parse_date": False})
+
+
+def test_extract_format_data_arrays():
+    formated_dataset = data._extract_format_data(DATASET, arrays=True)
+    assert formated_dataset[1].dtype == np.int64
+    assert formated_dataset[2].dtype == np.float64
+    assert isinstance(formated_dataset[5], pd.Categorical)
+    assert list(formated_dataset[5]) == ["A", "B", "C", "D"]
+
+
+def test_extract_format_data_no_categorical(mocker):
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    parameters.set_parameter({"categorical_discrete": False})
+    formated_dataset = data._extract_format_data(DATASET, arrays=True)
+    assert type(formated_dataset[5]) is list
+
+
 def test_extract_format_data_no_parse():
     parameters.set_parameter({"parse_date": False})
     formated_dataset = data._extract_format_data(DATASET)
@@ -79,9 +106,43 @@ def test_collect_data(mocker, filters, body_data):
         body_data=json.dumps(body_data),
         rtype="POST",
         braincube_name="bcname",
+        idempotent=True,
     )
 
 
+@pytest.mark.parametrize("coalesce_requests, n_requests", [(True, 1), (False, 4)])
+def test_collect_data_coalescing(mocker, coalesce_requests, n_requests):
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    parameters.set_parameter({"coalesce_requests": coalesce_requests})
+    mb_obj = mocker.Mock()
+    mb_obj.get_bcid.return_value = "1"
+    mb_obj.get_order_variable_long_id.return_value = "mb1/d4"
+    mb_obj.get_braincube_path.return_value = "braincube/bcname"
+    mb_obj.get_braincube_name.return_value = "bcname"
+    barrier = threading.Barrier(4, timeout=5)
+    released = threading.Event()
+
+    def braindata(*args, **kwargs):
+        released.wait(0.5)
+        return DATASET
+
+    rpatch = mocker.patch("braincube_connector.client.request_ws", side_effect=braindata)
+
+    def collect():
+        barrier.wait()
+        return data.collect_data([1, 2, 3], mb_obj, arrays=True)
+
+    with futures.ThreadPoolExecutor(4) as executor:
+        calls = [executor.submit(collect) for _ in range(4)]
+        received = [call.result(5) for call in calls]
+    assert rpatch.call_count == n_requests
+    assert all(list(dataset) == list(received[0]) for dataset in received)
+    assert received[0] is not received[1]
+    for col_id in (1, 3):
+        assert not np.shares_memory(received[0][col_id], received[1][col_id])
+    assert received[0][5] is not received[1][5]
+
+
 def test_get_braindata_memory_base_info(mocker):
     mb_id = 1
     bc_path = "braincube/name"
@@ -89,3 +150,28 @@ def test_get_braindata_memory_base_info(mocker):
     request_patch = mocker.patch("braincube_connector.client.request_ws")
     data.get_braindata_memory_base_info(bc_path, mb_id)
     request_patch.assert_called_once_with(expected_endpoint, braincube_name="")
+
+
+@pytest.mark.parametrize("data_workers", [1, 3])
+def test_collect_data_chunks(mocker, data_workers):
+    mb_obj = mocker.Mock()
+    mb_obj.get_bcid.return_value = "1"
+    mb_obj.get_order_variable_long_id.return_value = "mb1/d4"
+    mb_obj.get_braincube_path.return_value = "braincube/bcname"
+    mb_obj.get_braincube_name.return_value = "bcname"
+    datadefs = {datadef["id"]: datadef for datadef in DATASET["datadefs"]}
+
+    def braindata(path, body_data, **kwargs):
+        definitions = json.loads(body_data)["definitions"]
+        return {"datadefs": [datadefs[var_id] for var_id in definitions]}
+
+    rpatch = mocker.patch("braincube_connector.client.request_ws", side_effect=braindata)
+    parameters.set_parameter({"data_chunk_size": 2, "data_workers": data_workers})
+    received_data = data.collect_data([1, 2, 3, 5], mb_obj)
+    parameters.reset_parameter()
+    requested = sorted(
+        json.loads(call[1]["body_data"])["definitions"] for call in rpatch.call_args_list
+    )
+    assert requested == [["mb1/d4", "mb1/d1", "mb1/d2"], ["mb1/d4", "mb1/d3", "mb1/d5"]]
+    assert list(received_data.keys()) == [1, 2, 3, 5]
+    assert received_data[5] == ["A", "B", "C", "D"]
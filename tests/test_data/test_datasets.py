@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the datasets module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from braincube_connector.data import datasets, parsing
+
+
+def test_boundary_deduplicator():
+    deduplicator = datasets.BoundaryDeduplicator(9)
+    assert deduplicator.deduplicate({9: [1, 2, 2], 1: ["a", "b", "c"]}) == {
+        9: [1, 2, 2],
+        1: ["a", "b", "c"],
+    }
+    assert deduplicator.deduplicate({}) == {}
+    assert deduplicator.deduplicate({9: [2, 2, 3], 1: ["b", "c", "d"]}) == {9: [3], 1: ["d"]}
+    assert deduplicator.deduplicate({9: [None, 4], 1: ["e", "f"]}) == {9: [None, 4], 1: ["e", "f"]}
+    assert deduplicator.deduplicate({9: [4, pd.NaT], 1: ["f", "g"]}) == {9: [pd.NaT], 1: ["g"]}
+
+
+def test_count_rows():
+    assert datasets.count_rows({}) == 0
+    assert datasets.count_rows({1: [1, 2]}) == 2
+
+
+def test_select():
+    dataset = {1: ["a", "b", "c"], 2: [1, 2, 3]}
+    assert datasets.select_rows(dataset, [0, 2]) == {1: ["a", "c"], 2: [1, 3]}
+    assert list(datasets.select_columns(dataset, ["2", 1, 3]).keys()) == [2, 1]
+
+
+def test_select_rows_arrays():
+    dataset = {1: np.arange(3), 2: pd.Categorical(["a", "b", "a"])}
+    selected = datasets.select_rows(dataset, [0, 2])
+    assert selected[1].dtype == np.int64
+    assert selected[1].tolist() == [0, 2]
+    assert isinstance(selected[2], pd.Categorical)
+    assert selected[2].tolist() == ["a", "a"]
+    assert datasets.select_rows(dataset, [])[1].dtype == np.int64
+
+
+def test_concatenate():
+    assert datasets.concatenate(iter([{9: [1, 2], 1: ["a", "b"]}, {}, {9: [3], 2: ["c"]}])) == {
+        9: [1, 2, 3],
+        1: ["a", "b", None],
+        2: [None, None, "c"],
+    }
+    assert datasets.concatenate([{1: []}, {}]) == {1: []}
+
+
+def test_concatenate_arrays():
+    dates = parsing.parse_datetime_array(["20200101_000000", "20200102_000000"])
+    concatenated = datasets.concatenate(
+        [
+            {1: np.arange(2), 2: pd.Categorical(["a", "b"]), 3: dates, 4: np.arange(2)},
+            {1: np.array([], dtype=np.float64), 2: pd.Categorical([]), 3: dates[:0]},
+            {1: np.arange(1), 2: pd.Categorical(["c"]), 3: dates[:1]},
+        ]
+    )
+    assert concatenated[1].dtype == np.int64
+    assert concatenated[1].tolist() == [0, 1, 0]
+    assert concatenated[2].tolist() == ["a", "b", "c"]
+    assert isinstance(concatenated[2], pd.Categorical)
+    assert str(concatenated[3].dtype) == "datetime64[ns, UTC]"
+    assert len(concatenated[3]) == 3
+    np.testing.assert_array_equal(concatenated[4], [0, 1, np.nan])
+
+
+@pytest.mark.parametrize(
+    "batch_size, expected",
+    [(2, [{1: [0, 1]}, {1: [2, 3]}, {1: [4]}]), (10, [{1: [0, 1, 2, 3, 4]}])],
+)
+def test_iter_row_batches(batch_size, expected):
+    assert list(datasets.iter_row_batches({1: list(range(5))}, batch_size)) == expected
+    assert list(datasets.iter_row_batches({}, batch_size)) == []
+
+
+def test_to_dataframe():
+    numeric = np.arange(3, dtype=np.float64)
+    dataframe = datasets.to_dataframe({1: numeric, 2: np.arange(3), 3: ["a", "b", "c"]})
+    assert np.shares_memory(dataframe[1].to_numpy(), numeric)
+    assert list(dataframe.dtypes[:2]) == [np.float64, np.int64]
+    assert dataframe[3].tolist() == ["a", "b", "c"]
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the evaluation module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from braincube_connector.data import conditions, evaluation, parsing
+
+DATES = ["20200101_000000", "20200102_000000", "20200103_000000", None]
+
+
+@pytest.fixture
+def dataframe():
+    return pd.DataFrame(
+        {
+            1: np.array([0.5, 2.0, np.nan, 10.0]),
+            2: pd.Categorical(["A", "B", None, "A"]),
+            3: parsing.parse_datetime_array(DATES),
+            4: DATES,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "data_filter, mask",
+    [
+        ({"EQUALS": ["mb1/d1", 2.0]}, [False, True, False, False]),
+        ({"EQUALS": ["mb1/d2", ["A"]]}, [True, False, False, True]),
+        ({"EQUALS": ["mb1/d2", ["A", "B", "C"]]}, [True, True, False, True]),
+        ({"BETWEEN": ["mb1/d1", 0.5, 2]}, [True, True, False, False]),
+        ({"GREAT": ["mb1/d1", 2]}, [False, False, False, True]),
+        ({"GREAT_EQUALS": ["mb1/d1", 2]}, [False, True, False, True]),
+        ({"LESS": ["mb1/d1", 2]}, [True, False, False, False]),
+        ({"NOT": [{"LESS": ["mb1/d1", 2]}]}, [False, True, True, True]),
+        ({"Not": [{"LESS": ["mb1/d1", 2]}]}, [False, True, True, True]),
+        ({"GREAT": ["mb1/d3", "20200101_120000"]}, [False, True, True, False]),
+        ({"GREAT": ["mb1/d4", "20200101_120000"]}, [False, True, True, False]),
+        ({"BETWEEN": ["mb1/d3", "20200102_000000", "20200103_000000"]}, [False, True, True, False]),
+        (
+            {"OR": [{"EQUALS": ["mb1/d2", ["B"]]}, {"GREAT": ["mb1/d1", 5]}]},
+            [False, True, False, True],
+        ),
+        (
+            {"AND": [{"AND": [{"GREAT": ["mb1/d1", 0]}, {"EQUALS": ["mb1/d2", ["A"]]}]}]},
+            [True, False, False, True],
+        ),
+    ],
+)
+def test_get_mask(dataframe, data_filter, mask):
+    np.testing.assert_array_equal(evaluation.get_mask(dataframe, data_filter), mask)
+
+
+def test_get_mask_naive_dates(dataframe):
+    dataframe[3] = dataframe[3].dt.tz_localize(None)
+    np.testing.assert_array_equal(
+        evaluation.get_mask(dataframe, {"LESS": ["mb1/d3", "20200102_000000"]}),
+        [True, False, False, False],
+    )
+
+
+def test_get_mask_errors(dataframe):
+    with pytest.raises(ValueError):
+        evaluation.get_mask(dataframe, {"CONTAINS": ["mb1/d2", "A"]})
+    with pytest.raises(KeyError):
+        evaluation.get_mask(dataframe, {"EQUALS": ["mb1/d5", 1]})
+
+
+def test_filter_dataframe(dataframe):
+    filters = [{"GREAT": ["mb1/d1", 0]}, {"EQUALS": ["mb1/d2", ["A"]]}]
+    pd.testing.assert_frame_equal(
+        evaluation.filter_dataframe(dataframe, filters), dataframe.iloc[[0, 3]]
+    )
+    pd.testing.assert_frame_equal(
+        evaluation.filter_dataframe(dataframe, conditions.combine_filters(filters)),
+        dataframe.iloc[[0, 3]],
+    )
+    assert evaluation.filter_dataframe(dataframe, []) is dataframe
+
+
+def test_filter_dataframe_labels(dataframe):
+    named_dataframe = dataframe.rename(columns={1: "pressure", 2: "grade"})
+    filtered = evaluation.filter_dataframe(
+        named_dataframe, [{"LESS": ["mb1/d1", 5]}], labels={1: "pressure"}
+    )
+    assert filtered["grade"].tolist() == ["A", "B"]
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the fanout module."""
+
+import threading
+
+import pytest
+
+from braincube_connector import parallel, timeouts
+from braincube_connector.data import fanout
+
+
+def test_get_data_across(mocker):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_data(*args, **kwargs):
+        barrier.wait()
+        return {1: [1], 2: [2]}
+
+    memory_bases = [mocker.Mock(), mocker.Mock(), mocker.Mock()]
+    for memory_base in memory_bases:
+        memory_base.get_data.side_effect = get_data
+    filters = [{"GREAT": ["mb1/d1", 0]}]
+    mb_data = fanout.get_data_across(
+        [(memory_base, [1, 2], filters) for memory_base in memory_bases],
+        dataframe=True,
+        deadline=10,
+    )
+    assert list(mb_data) == memory_bases
+    assert list(mb_data.values()) == [{1: [1], 2: [2]}] * 3
+    for memory_base in memory_bases:
+        memory_base.get_data.assert_called_once_with(
+            [1, 2], filters, label_type="bcid", dataframe=True, deadline=mocker.ANY
+        )
+        assert isinstance(memory_base.get_data.call_args[1]["deadline"], timeouts.Deadline)
+
+
+def test_get_data_across_slots(mocker):
+    slots = []
+    memory_base = mocker.Mock()
+    memory_base.get_data.side_effect = lambda *args, **kwargs: slots.append(
+        parallel._request_slots.get()  # noqa: WPS437
+    )
+    fanout.get_data_across([(memory_base, [1], None)], max_requests=3)
+    assert isinstance(slots[0], threading.BoundedSemaphore)
+
+
+def test_get_data_across_duplicates(mocker):
+    memory_base = mocker.Mock()
+    with pytest.raises(ValueError):
+        fanout.get_data_across([(memory_base, [1], None), (memory_base, [2], None)])
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the incremental module."""
+
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from braincube_connector import parameters
+from braincube_connector.data import incremental, parsing
+
+DATES = ["20200101_000000", "20200101_000010", "20200101_000020"]
+T0 = datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp() * 1000
+
+
+@pytest.fixture
+def mock_mb(mocker):
+    order_var = mocker.Mock()
+    order_var.get_bcid.return_value = "1"
+    order_var.get_type.return_value = "DATETIME"
+    order_var.get_long_id.return_value = "mb1/d1"
+    memory_base = mocker.Mock()
+    memory_base.get_order_variable_long_id.return_value = "mb1/d1"
+    memory_base.get_variable_types.return_value.get_variable.return_value = order_var
+    return memory_base
+
+
+def test_fetch(mock_mb, mocker):
+    collect_data = mocker.patch(
+        "braincube_connector.data.data.collect_data",
+        side_effect=[
+            {1: DATES[:2], 2: [1, 2]},
+            {1: DATES[1:], 2: [2, 3]},
+            {1: [], 2: []},
+        ],
+    )
+    query = incremental.IncrementalQuery(mock_mb, [2], filters=["filter"], keep_rows=True)
+    assert query.fetch() == {2: [1, 2]}
+    collect_data.assert_called_with([2, 1], mock_mb, ["filter"], use_cache=False)
+    assert query.get_last_value() == T0 + 10000
+    assert query.fetch() == {2: [3]}
+    collect_data.assert_called_with(
+        [2, 1], mock_mb, ["filter", {"GREAT": ["mb1/d1", "20200101_000010"]}], use_cache=False
+    )
+    assert query.fetch() == {2: []}
+    assert query.get_last_value() == T0 + 20000
+    assert query.get_rows() == {2: [1, 2, 3]}
+
+
+def test_fetch_numeric(mock_mb, mocker):
+    order_var = mock_mb.get_variable_types().get_variable()
+    order_var.get_type.return_value = "NUMERIC"
+    collect_data = mocker.patch(
+        "braincube_connector.data.data.collect_data", return_value={1: [5, 6]}
+    )
+    query = incremental.IncrementalQuery(mock_mb, [1], last_value=5)
+    assert query.fetch() == {1: [6]}
+    collect_data.assert_called_with([1], mock_mb, [{"GREAT": ["mb1/d1", 5]}], use_cache=False)
+    assert query.get_last_value() == 6
+    with pytest.raises(ValueError):
+        query.get_rows()
+
+
+def test_fetch_result_cache(mock_mb, mocker, tmp_path):
+    """Test that the polls are not answered from the result cache."""
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    parameters.set_parameter({"result_cache_dir": str(tmp_path)})
+    mock_mb.get_bcid.return_value = "1"
+    mock_mb.get_braincube_name.return_value = "bc"
+    mock_mb.get_braincube_path.return_value = "braincube/bc"
+    mock_mb.get_variable_types().get_variable().get_type.return_value = "NUMERIC"
+    request_ws = mocker.patch(
+        "braincube_connector.client.request_ws",
+        side_effect=[
+            {"datadefs": [{"id": "mb1/d1", "type": "NUMERIC", "data": data}]}
+            for data in (["1", "2"], [], ["3"])
+        ],
+    )
+    query = incremental.IncrementalQuery(mock_mb, [1])
+    assert query.fetch() == {1: [1, 2]}
+    assert query.fetch() == {1: []}
+    assert query.fetch() == {1: [3]}
+    assert request_ws.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "col_data",
+    [
+        DATES + [""],
+        parsing.parse_datetime_array(DATES + [""]),
+        [datetime(2020, 1, 1, 0, 0, 10 * idx) for idx in range(3)] + [None],
+    ],
+)
+def test_to_order_values(col_data):
+    np.testing.assert_array_equal(
+        incremental.to_order_values(col_data, "DATETIME"),
+        [T0, T0 + 10000, T0 + 20000, np.nan],
+    )
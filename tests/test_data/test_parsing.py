@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the parsing module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from braincube_connector.data import parsing
+
+
+@pytest.mark.parametrize(
+    "col_data, dtype, expected",
+    [
+        (["1", "-2", "3"], np.int64, [1, -2, 3]),
+        (["1", "NaN", "3"], np.float64, [1, np.nan, 3]),
+        (["1.5", "2", "inf"], np.float64, [1.5, 2, np.inf]),
+        (["2.0", "3.0"], np.float64, [2, 3]),
+        (["1e3", "1"], np.float64, [1000, 1]),
+        (["9007199254740993", "1"], np.int64, [9007199254740993, 1]),
+        (["99999999999999999999", "1"], np.float64, [1e20, 1]),
+        ([], np.int64, []),
+    ],
+)
+def test_parse_numeric_array(col_data, dtype, expected):
+    parsed = parsing.parse_numeric_array(col_data)
+    assert parsed.dtype == dtype
+    np.testing.assert_array_equal(parsed, np.array(expected, dtype=dtype))
+
+
+def test_parse_numeric_array_error():
+    with pytest.raises(ValueError):
+        parsing.parse_numeric_array(["1", "A"])
+
+
+def test_parse_datetime_array():
+    parsed = parsing.parse_datetime_array(
+        ["20200331_170110", "null", "20200229_235959", "20241231_000000"]
+    )
+    assert str(parsed.dtype) == "datetime64[ns, UTC]"
+    expected = pd.to_datetime(
+        ["2020-03-31 17:01:10", None, "2020-02-29 23:59:59", "2024-12-31 00:00:00"], utc=True
+    )
+    pd.testing.assert_extension_array_equal(parsed, expected.as_unit("ns").array)
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "20201301_000000",
+        "20200001_000000",
+        "20200230_000000",
+        "20200100_000000",
+        "20200101_240000",
+        "20200101_006000",
+        "20200101_000060",
+        "2020010_000000",
+        "20200101_0000000",
+        "20200101-000000",
+        "2020a101_000000",
+        "99990101_000000",
+        "202001é1_000000",
+        None,
+    ],
+)
+def test_parse_datetime_array_invalid(date_str):
+    parsed = parsing.parse_datetime_array([date_str, "20200101_000000"])
+    assert parsed[0] is pd.NaT
+    assert parsed[1] == pd.Timestamp("2020-01-01", tz="UTC")
+
+
+def test_parse_datetime_array_empty():
+    parsed = parsing.parse_datetime_array([])
+    assert str(parsed.dtype) == "datetime64[ns, UTC]"
+    assert not len(parsed)
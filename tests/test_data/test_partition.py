@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the partition module."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from braincube_connector import parameters
+from braincube_connector.data import datasets, partition
+
+
+@pytest.fixture
+def memory_base(mocker):
+    mb_obj = mocker.Mock()
+    mb_obj.get_order_variable_long_id.return_value = "mb1/d9"
+    partition_var = mocker.Mock()
+    partition_var.get_long_id.return_value = "mb1/d9"
+    partition_var.get_type.return_value = "NUMERIC"
+    mb_obj.get_variable_types.return_value.get_variable.return_value = partition_var
+    return mb_obj
+
+
+def braindata(rows):
+    """Answer the window requests with the rows within the BETWEEN filter of the window."""
+
+    def collect_data(variable_ids, memory_base, filters, arrays=False):
+        mini, maxi = filters[-1]["BETWEEN"][1:]
+        window_rows = [row for row in rows if mini <= row <= maxi]
+        window_dataset = {
+            var_id: [row * var_id if var_id != 9 else row for row in window_rows]
+            for var_id in variable_ids
+        }
+        if arrays:
+            window_dataset = {
+                var_id: np.array(col_data) for var_id, col_data in window_dataset.items()
+            }
+            window_dataset[3] = pd.Categorical(["A" if row % 2 else "B" for row in window_rows])
+        return window_dataset
+
+    return collect_data
+
+
+@pytest.mark.parametrize(
+    "bound, expected",
+    [
+        (datetime(2020, 1, 1, tzinfo=timezone.utc), 1577836800000),
+        (timedelta(minutes=1), 60000),
+        (12.5, 12.5),
+    ],
+)
+def test_to_bound(bound, expected):
+    assert partition.to_bound(bound) == expected
+
+
+@pytest.fixture
+def local_timezone(monkeypatch):
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_to_bound_naive(local_timezone):
+    """Test that a naive datetime is read as UTC whatever the local time zone."""
+    assert partition.to_bound(datetime(2020, 1, 1)) == 1577836800000
+
+
+def test_get_windows():
+    parameters.set_parameter({"data_workers": 3})
+    assert partition.get_windows(0, 25, 10) == [(0, 10), (10, 20), (20, 25)]
+    assert partition.get_windows(0, 100, 10) == [(0, 10), (10, 20), (20, 30)]
+    assert partition.get_windows(10, 10, 10) == []
+    parameters.reset_parameter()
+
+
+@pytest.mark.parametrize("max_rows, rows, expected", [(10, 20, 5), (10, 2, 20), (10, 0, 20)])
+def test_adapt_window_size(max_rows, rows, expected):
+    parameters.set_parameter({"partition_max_rows": max_rows})
+    window_datasets = [{9: list(range(rows))}, {9: []}]
+    assert partition.adapt_window_size(10, window_datasets, 9) == expected
+    parameters.reset_parameter()
+
+
+@pytest.mark.parametrize("data_workers", [1, 4])
+def test_collect_partitioned_data(mocker, memory_base, data_workers):
+    rows = [0, 1, 5, 10, 10, 12, 20, 29, 30]
+    collect_patch = mocker.patch(
+        "braincube_connector.data.data.collect_data", side_effect=braindata(rows)
+    )
+    parameters.set_parameter({"data_workers": data_workers})
+    received = partition.collect_partitioned_data([1, 2], memory_base, 0, 30, 10, filters=["A"])
+    parameters.reset_parameter()
+    assert received == {1: rows, 2: [row * 2 for row in rows]}
+    first_call = collect_patch.call_args_list[0][0]
+    assert first_call[0] == [1, 2, 9]
+    assert first_call[2] == ["A", {"BETWEEN": ["mb1/d9", 0, 10]}]
+    memory_base.get_variable_types().get_variable.assert_called_once_with(9)
+
+
+def test_collect_partitioned_data_adaptive(mocker, memory_base):
+    rows = list(range(100))
+    collect_patch = mocker.patch(
+        "braincube_connector.data.data.collect_data", side_effect=braindata(rows)
+    )
+    parameters.set_parameter({"data_workers": 1, "partition_max_rows": 20})
+    received = partition.collect_partitioned_data([9], memory_base, 0, 99, 5, partition_id=9)
+    parameters.reset_parameter()
+    assert received == {9: rows}
+    windows = [call[0][2][0]["BETWEEN"][1:] for call in collect_patch.call_args_list]
+    assert windows[:2] == [[0, 5], [5, 15]]
+    assert all(maxi - mini <= 40 for mini, maxi in windows)
+
+
+def test_collect_partitioned_data_dtypes(mocker, memory_base):
+    rows = [0, 1, 5, 10, 10, 12, 20, 29, 30]
+    collect_patch = mocker.patch(
+        "braincube_connector.data.data.collect_data", side_effect=braindata(rows)
+    )
+    received = partition.collect_partitioned_data([1, 3], memory_base, 0, 30, 10, arrays=True)
+    assert collect_patch.call_args[0][3] is True
+    dataframe = datasets.to_dataframe(received)
+    assert list(dataframe.dtypes) == [np.int64, "category"]
+    assert dataframe[1].tolist() == rows
+    assert dataframe[3].tolist() == ["A" if row % 2 else "B" for row in rows]
+
+
+def test_iter_partitioned_data(mocker, memory_base):
+    mocker.patch(
+        "braincube_connector.data.data.collect_data", side_effect=braindata([0, 10, 15, 20])
+    )
+    window_datasets = partition.iter_partitioned_data([1], memory_base, 0, 20, 10)
+    assert list(window_datasets) == [{1: [0, 10]}, {1: [15, 20]}]
+
+
+def test_iter_partitioned_data_dtypes(mocker, memory_base):
+    mocker.patch(
+        "braincube_connector.data.data.collect_data", side_effect=braindata([0, 10, 10, 15, 20])
+    )
+    window_datasets = list(
+        partition.iter_partitioned_data([1, 3], memory_base, 0, 20, 10, arrays=True)
+    )
+    assert [window_dataset[1].tolist() for window_dataset in window_datasets] == [
+        [0, 10, 10],
+        [15, 20],
+    ]
+    for window_dataset in window_datasets:
+        assert list(datasets.to_dataframe(window_dataset).dtypes) == [np.int64, "category"]
+
+
+def test_collect_partitioned_data_window_error(memory_base):
+    with pytest.raises(ValueError):
+        partition.collect_partitioned_data([1], memory_base, 0, 10, timedelta(0))
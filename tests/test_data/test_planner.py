@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the planner module."""
+
+from braincube_connector.data import planner
+
+FILTER_A = [{"GREAT": ["mb1/d1", 0]}]
+FILTER_B = [{"LESS": ["mb1/d1", 0]}]
+
+
+def test_plan_requests():
+    requests = planner.plan_requests(
+        [
+            ([1, 2], None),
+            (["2", "3"], []),
+            ([3, 4], FILTER_A),
+            ([4, 5], FILTER_A * 2),
+            ([1], FILTER_B),
+        ]
+    )
+    assert list(requests.values()) == [
+        (None, [1, 2, 3]),
+        (FILTER_A, [3, 4, 5]),
+        (FILTER_B, [1]),
+    ]
+    assert list(requests) == [
+        planner.get_filter_key(None),
+        planner.get_filter_key(FILTER_A),
+        planner.get_filter_key(FILTER_B),
+    ]
+
+
+def test_collect_many(mocker):
+    def collect_data(var_ids, memory_base, filters, arrays):
+        return {var_id: [var_id, filters is None] for var_id in var_ids}
+
+    collect_patch = mocker.patch(
+        "braincube_connector.data.data.collect_data", side_effect=collect_data
+    )
+    mb_obj = mocker.Mock()
+    query_datasets = planner.collect_many(
+        mb_obj, [([2, 1], None), ([1, 3], FILTER_A), ([3, 2], None)], arrays=True
+    )
+    assert query_datasets == [
+        {2: [2, True], 1: [1, True]},
+        {1: [1, False], 3: [3, False]},
+        {3: [3, True], 2: [2, True]},
+    ]
+    assert query_datasets[0][2] is not query_datasets[2][2]
+    assert collect_patch.call_count == 2
+    collect_patch.assert_any_call([2, 1, 3], mb_obj, None, True)
+    collect_patch.assert_any_call([1, 3], mb_obj, FILTER_A, True)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the result_cache module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from braincube_connector import parameters
+from braincube_connector.data import data, result_cache
+
+DATASET = {
+    "datadefs": [
+        {"id": "mb1/d1", "type": "NUMERIC", "data": ["1", "NaN", "3.5"]},
+        {"id": "mb1/d2", "type": "DATETIME", "data": ["20200331_170100", "", "20200331_170102"]},
+        {"id": "mb1/d3", "type": "DISCRETE", "data": ["A", None, "C"]},
+    ]
+}
+BODY = {"definitions": ["mb1/d1", "mb1/d2", "mb1/d3"], "context": {"dataSource": "mb1"}}
+
+
+@pytest.fixture
+def cache_dir(mocker, tmp_path):
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    parameters.set_parameter({"result_cache_dir": str(tmp_path)})
+    return tmp_path
+
+
+def test_get_or_request(cache_dir, mocker):
+    request = mocker.Mock(return_value=DATASET)
+    stats = result_cache.get_result_cache_stats()
+    assert result_cache.get_or_request("bc", "path", BODY, request) is DATASET
+    cached = result_cache.get_or_request("bc", "path", BODY, request)
+    request.assert_called_once()
+    assert isinstance(cached["datadefs"][0]["data"], np.memmap)
+    new_stats = result_cache.get_result_cache_stats()
+    assert new_stats["hits"] == stats["hits"] + 1
+    assert new_stats["misses"] == stats["misses"] + 1
+    for arrays in (False, True):
+        expected = data._extract_format_data(DATASET, arrays)
+        formatted = data._extract_format_data(cached, arrays)
+        pd.testing.assert_frame_equal(pd.DataFrame(formatted), pd.DataFrame(expected))
+        assert [formatted[3][0], formatted[3][2]] == ["A", "C"]
+        assert pd.isna(formatted[3][1])
+
+
+def test_get_or_request_order(cache_dir, mocker):
+    """Test that the cached columns follow the order of the definitions of each request."""
+
+    body = dict(BODY, definitions=["mb1/d2", "mb1/d1"])
+    permuted_body = dict(BODY, definitions=["mb1/d1", "mb1/d2"])
+    dataset = {"datadefs": [DATASET["datadefs"][1], DATASET["datadefs"][0]]}
+    result_cache.get_or_request("bc", "path", body, mocker.Mock(return_value=dataset))
+    request = mocker.Mock()
+    cached = result_cache.get_or_request("bc", "path", permuted_body, request)
+    request.assert_not_called()
+    assert [datadef["id"] for datadef in cached["datadefs"]] == ["mb1/d1", "mb1/d2"]
+    assert list(data._extract_format_data(cached)) == [1, 2]
+    cached = result_cache.get_or_request("bc", "path", body, request)
+    assert [datadef["id"] for datadef in cached["datadefs"]] == ["mb1/d2", "mb1/d1"]
+
+
+def test_get_or_request_empty(cache_dir, mocker):
+    dataset = {"datadefs": [{"id": "mb1/d1", "type": "NUMERIC", "data": []}, {"id": "mb1/d2"}]}
+    request = mocker.Mock(return_value=dataset)
+    result_cache.get_or_request("bc", "path", BODY, request)
+    assert result_cache.get_or_request("bc", "path", BODY, request) == dataset
+    request.assert_called_once()
+
+
+def test_get_or_request_disabled(mocker):
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+    request = mocker.Mock(return_value=DATASET)
+    result_cache.get_or_request("bc", "path", BODY, request)
+    result_cache.get_or_request("bc", "path", BODY, request)
+    assert request.call_count == 2
+
+
+def test_get_key():
+    key = result_cache.get_key("bc", "path", BODY)
+    reordered = {"context": {"dataSource": "mb1"}, "definitions": ["mb1/d3", "mb1/d1", "mb1/d2"]}
+    assert result_cache.get_key("bc", "path", reordered) == key
+    assert result_cache.get_key("bc2", "path", BODY) != key
+    assert result_cache.get_key("bc", "path", dict(BODY, context={"dataSource": "mb2"})) != key
+
+
+def test_eviction(cache_dir, mocker):
+    request = mocker.Mock(return_value=DATASET)
+    result_cache.get_or_request("bc", "path", BODY, request)
+    entry_size = sum(entry.stat().st_size for entry in next(cache_dir.iterdir()).iterdir())
+    parameters.set_parameter({"result_cache_max_size": entry_size})
+    result_cache.get_or_request("bc", "path2", BODY, request)
+    assert len(list(cache_dir.iterdir())) == 1
+    result_cache.get_or_request("bc", "path2", BODY, request)
+    assert request.call_count == 2
+    result_cache.clear_result_cache()
+    assert not list(cache_dir.iterdir())
@@ -3,7 +3,7 @@
 
 import responses
 import pandas as pd
-from braincube_connector import parameters
+from braincube_connector import parameters, timeouts
 from braincube_connector.memory_base import memory_base
 
 from tests.mock import mb_obj, mock_client, mock_request_entity, create_mock_var
@@ -185,6 +185,44 @@ def test_get_data(mocker, mb_obj, create_mock_var, label_type, dataframe, expect
         assert obtained_data_str == obtained_data
 
 
+@pytest.mark.parametrize("dataframe", [False, True])
+def test_get_data_many(mocker, mb_obj, create_mock_var, dataframe):
+    mocker.patch(
+        "braincube_connector.memory_base.memory_base.MemoryBase.get_variable_list",
+        return_value=[
+            create_mock_var(bcid=1, metadata={"standard": "name1"}),
+            create_mock_var(bcid=2, metadata={"standard": "name2"}),
+        ],
+    )
+    collect_patch = mocker.patch(
+        "braincube_connector.data.data.collect_data",
+        return_value={1: ["val1", "val2"], 2: ["val3", "val4"]},
+    )
+    query_data = mb_obj.get_data_many(
+        [([1], None), (["1", "2"], None)], label_type="name", dataframe=dataframe
+    )
+    collect_patch.assert_called_once_with([1, 2], mb_obj, None, dataframe)
+    if dataframe:
+        assert query_data[0].equals(pd.DataFrame({"name1": ["val1", "val2"]}))
+        assert list(query_data[1].columns) == ["name1", "name2"]
+    else:
+        assert query_data == [
+            {"name1": ["val1", "val2"]},
+            {"name1": ["val1", "val2"], "name2": ["val3", "val4"]},
+        ]
+
+
+def test_get_data_labels_index(mocker, mb_obj, create_mock_var):
+    list_patch = mocker.patch(
+        "braincube_connector.memory_base.memory_base.MemoryBase.get_variable_list",
+        return_value=[create_mock_var(bcid=1, metadata={"standard": "name1"})],
+    )
+    mocker.patch("braincube_connector.data.data.collect_data", return_value={1: ["val1"]})
+    for _ in range(3):
+        assert mb_obj.get_data([1], label_type="name") == {"name1": ["val1"]}
+    list_patch.assert_called_once_with()
+
+
 @pytest.mark.parametrize(
     "mb_infos,order_id",
     [({"reference": "id1"}, "id1"), ({"order": "id2"}, "id2"), ({"DataDefs": {}}, "ERROR")],
@@ -202,6 +240,24 @@ def test_get_order_variable_long_id(mocker, mb_obj, mb_infos, order_id):
         assert mb_obj.get_order_variable_long_id() == order_id
 
 
+def test_get_braindata_info_cache(mocker, mb_obj):
+    request_info = mocker.patch(
+        "braincube_connector.data.data.get_braindata_memory_base_info",
+        return_value={"order": "mb1/d2"},
+    )
+    assert mb_obj.get_order_variable_long_id() == "mb1/d2"
+    assert mb_obj.get_braindata_info() == {"order": "mb1/d2"}
+    request_info.assert_called_once_with("braincube/bcname/", "1", "")
+    mb_obj.invalidate_braindata_info()
+    mb_obj.get_order_variable_long_id()
+    assert request_info.call_count == 2
+    assert mb_obj.get_braindata_info_stats() == {"hits": 1, "misses": 2}
+    parameters.set_parameter({"braindata_info_ttl": 0})
+    mb_obj.get_order_variable_long_id()
+    assert request_info.call_count == 3
+    parameters.set_parameter({"braindata_info_ttl": 300})
+
+
 def test_get_name(mocker):
     mocker.patch(
         "braincube_connector.instances.instances", {"parameter_set": {}}
@@ -209,3 +265,89 @@ def test_get_name(mocker):
     # import pdb
     # pdb.set_trace()
     assert memory_base.MemoryBase.get_parameter_key("bcid") == "bcId"
+
+
+def test_get_data_deadline(mocker, mb_obj):
+    """Test that the deadline is shared by the requests made by get_data."""
+    deadlines = []
+
+    def collect_data(*args, **kwargs):
+        deadlines.append(timeouts.get_current_deadline())
+        return {1: []}
+
+    mocker.patch("braincube_connector.data.data.collect_data", side_effect=collect_data)
+    mb_obj.get_data([1], deadline=10)
+    assert deadlines[0].remaining() <= 10
+    assert timeouts.get_current_deadline() is None
+
+
+def test_get_partitioned_data(mocker, mb_obj, create_mock_var):
+    mocker.patch(
+        "braincube_connector.memory_base.memory_base.MemoryBase.get_variable_list",
+        return_value=[create_mock_var(bcid=1, metadata={"standard": "name_standard_1"})],
+    )
+    collect_patch = mocker.patch(
+        "braincube_connector.data.partition.collect_partitioned_data",
+        return_value={1: ["val1", "val2"]},
+    )
+    obtained_data = mb_obj.get_partitioned_data(
+        ["1"], 0, 100, 10, label_type="name", dataframe=True, partition_id="2"
+    )
+    assert obtained_data.equals(pd.DataFrame({"name_standard_1": ["val1", "val2"]}))
+    collect_patch.assert_called_once_with([1], mb_obj, 0, 100, 10, None, 2, arrays=True)
+
+
+@pytest.mark.parametrize(
+    "label_type, dataframe, expected_batches",
+    [
+        ("bcid", False, [{1: ["val1", "val2"]}, {1: ["val3"]}]),
+        (
+            "name",
+            True,
+            [pd.DataFrame({"name_1": ["val1", "val2"]}), pd.DataFrame({"name_1": ["val3"]})],
+        ),
+    ],
+)
+def test_iter_data(mocker, mb_obj, create_mock_var, label_type, dataframe, expected_batches):
+    variable_list = mocker.patch(
+        "braincube_connector.memory_base.memory_base.MemoryBase.get_variable_list",
+        return_value=[create_mock_var(bcid=1, metadata={"standard": "name_1"})],
+    )
+    collect_patch = mocker.patch(
+        "braincube_connector.data.data.collect_data", return_value={1: ["val1", "val2", "val3"]}
+    )
+    batches = mb_obj.iter_data(["1"], ["A"], chunk=2, label_type=label_type, dataframe=dataframe)
+    collect_patch.assert_not_called()
+    batches = list(batches)
+    collect_patch.assert_called_once_with([1], memory_base=mb_obj, filters=["A"], arrays=dataframe)
+    assert variable_list.call_count == int(label_type == "name")
+    assert len(batches) == len(expected_batches)
+    for batch, expected_batch in zip(batches, expected_batches):
+        if dataframe:
+            assert batch.reset_index(drop=True).equals(expected_batch)
+        else:
+            assert batch == expected_batch
+
+
+def test_iter_data_windows(mocker, mb_obj):
+    iter_patch = mocker.patch(
+        "braincube_connector.data.partition.iter_partitioned_data",
+        return_value=iter([{1: [1, 2, 3]}, {1: [4]}]),
+    )
+    parameters.set_parameter({"iter_chunk_size": 2})
+    batches = list(mb_obj.iter_data([1], start=0, end=10, window=5))
+    parameters.reset_parameter()
+    assert batches == [{1: [1, 2]}, {1: [3]}, {1: [4]}]
+    iter_patch.assert_called_once_with(
+        [1], mb_obj, filters=None, arrays=False, start=0, end=10, window=5
+    )
+
+
+def test_get_incremental_query(mocker, mb_obj):
+    query = mb_obj.get_incremental_query(["1"], filters=["filter"], last_value=5)
+    assert query.get_last_value() == 5
+    collect_data = mocker.patch("braincube_connector.data.data.collect_data", return_value={})
+    mocker.patch.object(mb_obj, "get_order_variable_long_id", return_value="mb1/d1")
+    mocker.patch.object(mb_obj, "get_variable_types")
+    query.fetch()
+    assert collect_data.call_args[0][:2] == ([1], mb_obj)
@@ -2,6 +2,7 @@
 
 """Tests for the mb_child module."""
 
+from braincube_connector.memory_base import variable_types
 from braincube_connector.memory_base.nested_resources import condition_container
 from tests.mock import create_mock_var
 
@@ -18,6 +19,7 @@ def test_get_conditions(mocker, create_mock_var):
         ]
     ]
     mock_mb.get_variable.side_effect = lambda bcid: var_mocks[int(bcid)]
+    mock_mb.get_variable_types.return_value = variable_types.VariableTypes(mock_mb)
     metadata = {
         "conditions": [
             {"minimum": 0, "maximum": 10, "variable": {"bcId": "0"}, "positive": True},
@@ -31,5 +33,34 @@ def test_get_conditions(mocker, create_mock_var):
     # condition_container.ConditionContainer("53", "entity", metadata, "path/mb/1/entity/53", mock_mb)
     filters = entity.get_conditions()
     assert filters == [{"BETWEEN": ["mb1/d0", 0, 10]}, {"NOT": [{"EQUALS": ["mb1/d2", ["A"]]}]}]
+    mock_mb.get_variable_list.assert_not_called()
     entity._metadata = {}
     assert entity.get_conditions() == []
+
+
+def test_get_conditions_shared_variables(mocker, create_mock_var):
+    """Test that the condition variables are kept by the memory base between the entities."""
+    mock_mb = mocker.Mock()
+    mock_mb.get_bcid.return_value = "1"
+    mock_mb.get_variable.side_effect = lambda bcid: create_mock_var(bcid=str(bcid), mb=mock_mb)
+    mock_mb.get_variable_types.return_value = variable_types.VariableTypes(mock_mb)
+    entities = [condition_container.ConditionContainer() for _ in range(2)]
+    for entity, var_ids in zip(entities, (["3", "1", "3"], ["1"])):
+        entity._metadata = {
+            "conditions": [
+                {"minimum": 0, "maximum": 1, "variable": {"bcId": var_id}, "positive": True}
+                for var_id in var_ids
+            ]
+        }
+        entity._memory_base = mock_mb
+    assert len(entities[0].get_conditions()) == 3
+    assert entities[1].get_conditions() == [{"BETWEEN": ["mb1/d1", 0, 1]}]
+    entities[0].get_conditions()
+    assert sorted(call.args[0] for call in mock_mb.get_variable.call_args_list) == [1, 3]
+    mock_mb.get_variable_list.assert_not_called()
+
+
+def test_get_condition_variable_ids():
+    entity = condition_container.ConditionContainer()
+    entity._metadata = {"conditions": [{"variable": {"bcId": "3"}}, {"variable": {"bcId": 1}}]}
+    assert entity.get_condition_variable_ids() == [3, 1]
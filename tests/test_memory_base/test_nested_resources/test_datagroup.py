@@ -14,7 +14,9 @@ def test_get_variable_list(mocker, create_mock_datagroup):
     variables = [str(i) for i in range(3)]
     expected_variables = ["Variable{}".format(var) for var in variables]
     mock_mb = mocker.Mock()
-    mock_mb.get_variable.side_effect = lambda var_id: "Variable{}".format(var_id)
+    mock_mb.get_variable_types.return_value.get_variables.side_effect = lambda var_ids: {
+        int(var_id): "Variable{}".format(var_id) for var_id in var_ids
+    }
     dgroup = create_mock_datagroup(variables=variables, mb=mock_mb)
     assert dgroup.get_variable_list() == expected_variables
 
@@ -26,3 +28,14 @@ def test_get_data(mocker, create_mock_datagroup):
     filters = ["A", "B"]
     dgroup.get_data(filters)
     mock_mb.get_data.assert_called_once_with(variables, filters)
+
+
+def test_iter_data(mocker, create_mock_datagroup):
+    variables = [str(i) for i in range(3)]
+    mock_mb = mocker.Mock()
+    mock_mb.iter_data.return_value = iter([{0: [1]}, {0: [2]}])
+    dgroup = create_mock_datagroup(variables=variables, mb=mock_mb)
+    assert list(dgroup.iter_data(["A"], chunk=1, window=10)) == [{0: [1]}, {0: [2]}]
+    mock_mb.iter_data.assert_called_once_with(
+        variables, ["A"], 1, dataframe=False, deadline=None, window=10
+    )
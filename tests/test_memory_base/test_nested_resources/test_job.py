@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 """Tests for the job module."""
+
+from braincube_connector.memory_base import variable_types
+from braincube_connector.memory_base.nested_resources import job
+
 from tests.mock import create_mock_job, create_mock_var, create_mock_event, create_mock_datagroup
 
 
@@ -16,8 +20,8 @@ def test_get_events(mocker, create_mock_job):
 
 def test_get_conditions(mocker, create_mock_job, create_mock_var, create_mock_event):
     mock_mb = mocker.Mock()
-
     mock_mb.get_variable.side_effect = lambda var_id: create_mock_var(bcid=str(var_id))
+    mock_mb.get_variable_types.return_value = variable_types.VariableTypes(mock_mb)
 
     events = {
         "1": create_mock_event(variables=["3"], mb=mock_mb),
@@ -43,6 +47,9 @@ def test_get_conditions(mocker, create_mock_job, create_mock_var, create_mock_ev
         {"NOT": ["cond4"]},
         "cond5",
     ]
+    requested_ids = [call.args[0] for call in mock_mb.get_variable.call_args_list]
+    assert sorted(requested_ids) == [1, 2, 3, 4, 5]  # Each variable once, for all the calls.
+    mock_mb.get_variable_list.assert_not_called()
 
 
 def test_get_variable_ids(mocker, create_mock_datagroup, create_mock_job):
@@ -74,6 +81,18 @@ def test_get_data(mocker, create_mock_job):
     mock_mb.get_data.assert_has_calls(calls)
 
 
+def test_iter_data(mocker, create_mock_job):
+    mock_mb = mocker.Mock()
+    mock_mb.iter_data.return_value = iter([{"var1": [1]}])
+    job = create_mock_job(mb=mock_mb)
+    mocker.patch.object(job, "get_conditions", return_value=["cond1"])
+    mocker.patch.object(job, "get_variable_ids", return_value=["var1"])
+    assert list(job.iter_data(["cond2"], dataframe=True, deadline=10)) == [{"var1": [1]}]
+    call_args = mock_mb.iter_data.call_args
+    assert call_args[0] == (["var1"], ["cond2", "cond1"], None)
+    assert call_args[1]["deadline"].remaining() <= 10
+
+
 def test_get_categories(create_mock_job):
     cond_variable_id = "1"
     job = create_mock_job(modelEntries=[cond_variable_id])
@@ -99,3 +118,34 @@ def test_get_rule_list(mocker, create_mock_job):
     gen_path.assert_called_once_with(
         "job_path", "rules/{bcid}", "rules/all/summary", request_list=True
     )
+
+
+def test_materialize(
+    mocker, create_mock_job, create_mock_var, create_mock_event, create_mock_datagroup
+):
+    mock_mb = mocker.Mock()
+    mock_mb.get_bcid.return_value = "1"
+    mock_mb.get_variable.side_effect = lambda var_id: create_mock_var(bcid=str(var_id), mb=mock_mb)
+    mock_mb.get_variable_types.return_value = variable_types.VariableTypes(mock_mb)
+    mock_mb.get_event.side_effect = lambda e_id: create_mock_event(variables=[e_id], mb=mock_mb)
+    mock_mb.get_datagroup.return_value = create_mock_datagroup(variables=["7"])
+    mocker.patch("braincube_connector.data.conditions.build_condition_filter")
+    map_patch = mocker.spy(job.parallel, "map_in_order")
+    job_obj = create_mock_job(
+        conditions=[1],
+        modelEntries=["2"],
+        events={"negative": ["3"], "positive": ["4"]},
+        datagroups=["5"],
+        mb=mock_mb,
+    )
+    assert job_obj.materialize() is job_obj
+    assert sorted(call.args[0] for call in mock_mb.get_variable.call_args_list) == [1, 3, 4]
+    assert map_patch.call_count == 2  # The references, then the condition variables.
+    job_obj.get_conditions(include_events=True)
+    assert mock_mb.get_variable.call_count == 3
+    assert sorted(job_obj.get_variable_ids()) == ["2", "7"]
+    assert mock_mb.get_event.call_count == 2
+    assert mock_mb.get_datagroup.call_count == 1
+    job_obj.materialize(refresh=True)
+    assert mock_mb.get_event.call_count == 4
+    assert mock_mb.get_variable.call_count == 3
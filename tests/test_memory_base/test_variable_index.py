@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the variable_index module."""
+
+from braincube_connector import parameters
+from braincube_connector.memory_base import variable_index
+
+from tests.mock import create_mock_var
+
+
+def test_get_names(mocker, create_mock_var):
+    memory_base = mocker.Mock()
+    memory_base.get_variable_list.return_value = [
+        create_mock_var(bcid="1", metadata={"standard": "name1"}),
+    ]
+    memory_base.get_variable_types.return_value.get_variables.return_value = {
+        2: create_mock_var(bcid="2", metadata={"standard": "name2"})
+    }
+    index = variable_index.VariableIndex(memory_base)
+    assert index.get_names(["1", 2]) == {1: "name1", 2: "name2"}
+    memory_base.get_variable_types().get_variables.assert_called_once_with([2])
+    assert index.get_names([1]) == {1: "name1"}
+    memory_base.get_variable_list.assert_called_once_with()
+    index.invalidate()
+    index.get_names([1])
+    assert memory_base.get_variable_list.call_count == 2
+
+
+def test_index_ttl(mocker, create_mock_var):
+    memory_base = mocker.Mock()
+    memory_base.get_variable_list.return_value = [
+        create_mock_var(bcid="1", metadata={"standard": "name1"})
+    ]
+    index = variable_index.VariableIndex(memory_base)
+    parameters.set_parameter({"variable_index_ttl": 0})
+    index.get_names([1])
+    index.get_names([1])
+    assert memory_base.get_variable_list.call_count == 2
+    assert index.get_stats() == {"hits": 0, "misses": 2}
+    parameters.set_parameter({"variable_index_ttl": 300})
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the variable_types module."""
+
+import json
+import re
+
+import responses
+
+from braincube_connector.memory_base import variable_types
+
+from tests.mock import create_mock_var, mb_obj, mock_client
+
+VARIABLES_URL = "https://api.a.b/braincube/bcname/braincube/mb/1/variables/"
+
+
+def test_get_variable(mocker, create_mock_var):
+    memory_base = mocker.Mock()
+    memory_base.get_variable.side_effect = lambda bcid: create_mock_var(
+        bcid=str(bcid), metadata={"type": "DISCRETE"}
+    )
+    types = variable_types.VariableTypes(memory_base)
+    assert types.get_variable("2").get_type() == "DISCRETE"
+    assert types.get_variable(2).get_type() == "DISCRETE"
+    memory_base.get_variable.assert_called_once_with(2)
+    memory_base.get_variable_list.assert_not_called()
+    assert types.get_stats() == {"hits": 1, "misses": 1}
+    types.invalidate()
+    types.get_variable(2)
+    assert memory_base.get_variable.call_count == 2
+
+
+def test_get_variables(mocker, create_mock_var):
+    memory_base = mocker.Mock()
+    memory_base.get_variable.side_effect = lambda bcid: create_mock_var(bcid=str(bcid))
+    map_patch = mocker.spy(variable_types.parallel, "map_in_order")
+    types = variable_types.VariableTypes(memory_base)
+    types.get_variable(1)
+    variables = types.get_variables(["3", 1, 2, 3])
+    assert list(variables) == [3, 1, 2]
+    map_patch.assert_called_with(memory_base.get_variable, [3, 2], 4)
+    types.get_variables([1, 2, 3])
+    assert memory_base.get_variable.call_count == 3
+
+
+def _mock_variable_requests():
+    """Answer the variable requests, with a summary that does not give the types."""
+
+    def summary(request):
+        offset = int(re.search("offset=([0-9]+)", request.url).group(1))
+        items = [{"bcId": str(bcid), "standard": "var{0}".format(bcid)} for bcid in (1, 2)]
+        return 200, {}, json.dumps({"items": items[offset:]})
+
+    def extended(request):
+        bcid = re.search("variables/([0-9]+)/extended", request.url).group(1)
+        return 200, {}, json.dumps({"bcId": bcid, "standard": "var" + bcid, "type": "NUMERIC"})
+
+    responses.add_callback(responses.GET, re.compile(VARIABLES_URL + "summary.*"), summary)
+    responses.add_callback(responses.GET, re.compile(VARIABLES_URL + "[0-9]+/extended"), extended)
+
+
+@responses.activate
+def test_http_calls(mb_obj, mock_client):
+    """Test that the types are requested variable by variable, without listing the summary."""
+    _mock_variable_requests()
+    variables = mb_obj.get_variable_types().get_variables([1, 2, 1])
+    assert [variables[bcid].get_type() for bcid in (1, 2)] == ["NUMERIC", "NUMERIC"]
+    assert len(responses.calls) == 2
+    assert all("extended" in call.request.url for call in responses.calls)
+    mb_obj.get_variable_types().get_variable(2)
+    assert len(responses.calls) == 2
+    assert mb_obj.get_variable_index().get_names([1, 2]) == {1: "var1", 2: "var2"}
+    assert len(responses.calls) > 2
+    assert all("summary" in call.request.url for call in responses.calls[2:])
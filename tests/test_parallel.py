@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the parallel module."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from braincube_connector import parallel, timeouts
+
+
+def test_submit():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with timeouts.deadline_scope(10) as deadline:
+            future = parallel.submit(executor, timeouts.get_current_deadline)
+        assert future.result() is deadline
+
+
+def test_map_in_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_and_square(number):
+        barrier.wait()
+        return number**2
+
+    assert parallel.map_in_order(wait_and_square, [1, 2, 3], max_workers=3) == [1, 4, 9]
+
+
+def test_map_in_order_serial():
+    threads = set()
+
+    def record_thread(number):
+        threads.add(threading.get_ident())
+        return number
+
+    assert parallel.map_in_order(record_thread, range(4), max_workers=1) == [0, 1, 2, 3]
+    assert threads == {threading.get_ident()}
+    assert parallel.map_in_order(record_thread, [], max_workers=4) == []
+
+
+def test_call_in_slot():
+    in_progress = []
+    peak = []
+    lock = threading.Lock()
+
+    def request(number):
+        with lock:
+            in_progress.append(number)
+            peak.append(len(in_progress))
+        threading.Event().wait(0.01)
+        with lock:
+            in_progress.remove(number)
+        return number
+
+    assert parallel.call_in_slot(request, 1) == 1
+    with parallel.concurrency_scope(2):
+        outputs = parallel.map_in_order(
+            lambda number: parallel.call_in_slot(request, number), range(8), max_workers=8
+        )
+    assert outputs == list(range(8))
+    assert max(peak) == 2
+
+
+def test_call_in_slot_deadline():
+    with parallel.concurrency_scope(1) as slots:
+        slots.acquire()
+        with timeouts.deadline_scope(0.01):
+            with pytest.raises(timeouts.DeadlineExceededError):
+                parallel.call_in_slot(lambda: None)
+        slots.release()
+        assert parallel.call_in_slot(lambda: 1) == 1
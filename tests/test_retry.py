@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the retry module."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from braincube_connector import parameters, retry, timeouts
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(mocker):
+    mocker.patch.dict(
+        "braincube_connector.instances.instances",
+        {"parameter_set": {"retry_jitter_cap": 0, "retry_backoff_base": 1}},
+    )
+    return mocker.patch("braincube_connector.retry.time.sleep")
+
+
+def make_response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.parametrize(
+    "rtype, idempotent, expected",
+    [("GET", None, 3), ("get", None, 3), ("POST", None, 1), ("POST", True, 3), ("GET", False, 1)],
+)
+def test_get_max_attempts(rtype, idempotent, expected):
+    assert retry.get_max_attempts(rtype, idempotent) == expected
+
+
+def test_parse_retry_after():
+    assert retry.parse_retry_after(None) is None
+    assert retry.parse_retry_after("12") == 12
+    assert retry.parse_retry_after("soon") is None
+    retry_date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 20 < retry.parse_retry_after(format_datetime(retry_date, usegmt=True)) <= 30
+    past_date = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert retry.parse_retry_after(format_datetime(past_date, usegmt=True)) == 0
+
+
+def test_get_backoff_delay():
+    assert [retry.get_backoff_delay(attempt) for attempt in range(1, 5)] == [1, 2, 4, 8]
+    parameters.set_parameter({"retry_backoff_max": 3})
+    assert retry.get_backoff_delay(4) == 3
+    assert retry.get_backoff_delay(1, retry_after=10) == 10
+    assert retry.get_backoff_delay(2, retry_after=0) == 2
+    parameters.set_parameter({"retry_jitter_cap": 0.5})
+    assert 1 <= retry.get_backoff_delay(1) <= 1.5
+
+
+def test_call_with_retry(no_jitter):
+    responses = [make_response(503), make_response(429, {"Retry-After": "5"}), make_response(200)]
+    stats = retry.RetryStats()
+    response = retry.call_with_retry(lambda: responses.pop(0), stats, 3)
+    assert response.status_code == 200
+    assert no_jitter.call_args_list == [((1,),), ((5,),)]
+    assert stats.get_stats() == {"retries": 2, "exhausted": 0, "wait_time": 6}
+
+
+def test_call_with_retry_exhausted(no_jitter):
+    stats = retry.RetryStats()
+    response = retry.call_with_retry(lambda: make_response(502), stats, 2)
+    assert response.status_code == 502
+    assert stats.get_stats() == {"retries": 1, "exhausted": 1, "wait_time": 1}
+
+
+def test_call_with_retry_not_retryable(no_jitter):
+    stats = retry.RetryStats()
+    assert retry.call_with_retry(lambda: make_response(404), stats, 3).status_code == 404
+    assert retry.call_with_retry(lambda: make_response(503), stats, 1).status_code == 503
+    no_jitter.assert_not_called()
+    assert stats.get_stats() == {"retries": 0, "exhausted": 0, "wait_time": 0}
+
+
+def test_call_with_retry_connection_error(mocker, no_jitter):
+    send = mocker.Mock(side_effect=[requests.exceptions.ConnectionError(), make_response(200)])
+    assert retry.call_with_retry(send, retry.RetryStats(), 3).status_code == 200
+    send = mocker.Mock(side_effect=requests.exceptions.ConnectionError())
+    with pytest.raises(requests.exceptions.ConnectionError):
+        retry.call_with_retry(send, retry.RetryStats(), 3)
+    assert send.call_count == 3
+
+
+def test_call_with_retry_deadline(no_jitter):
+    stats = retry.RetryStats()
+    with timeouts.deadline_scope(3):
+        response = retry.call_with_retry(
+            lambda: make_response(503, {"Retry-After": "10"}), stats, 3
+        )
+    assert response.status_code == 503
+    no_jitter.assert_not_called()
+    assert stats.get_stats()["exhausted"] == 1
+
+
+def test_retry_stats_reset():
+    stats = retry.RetryStats()
+    stats.record_retry(2)
+    stats.record_exhausted()
+    assert stats.get_stats() == {"retries": 1, "exhausted": 1, "wait_time": 2}
+    stats.reset()
+    assert stats.get_stats() == {"retries": 0, "exhausted": 0, "wait_time": 0}
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the sessions module."""
+
+import threading
+
+from braincube_connector import constants, sessions
+
+API_URL = "https://api.a.b"
+
+
+def run_in_thread(function):
+    """Call a function in a new thread and return its result."""
+    thread_result = []
+    thread = threading.Thread(target=lambda: thread_result.append(function()))
+    thread.start()
+    thread.join()
+    return thread_result[0]
+
+
+def test_from_config():
+    """Test that the SSO and API servers get separate pools configured from the config."""
+    session_pool = sessions.from_config(
+        {
+            constants.POOL_SIZE_KEY: 3,
+            constants.POOL_CONNECTIONS_KEY: 2,
+            constants.KEEP_ALIVE_KEY: False,
+        }
+    )
+    api_session = session_pool.get_session(api=True)
+    api_adapter = api_session.get_adapter(API_URL)
+    assert api_adapter is not session_pool.get_session(api=False).get_adapter(API_URL)
+    assert api_adapter._pool_maxsize == 3
+    assert api_adapter._pool_connections == 2
+    assert api_session.headers["Connection"] == "close"
+
+
+def test_get_session():
+    """Test that a thread reuses its session and that threads do not share sessions."""
+    session_pool = sessions.SessionPool()
+    session = session_pool.get_session(api=True)
+    assert session_pool.get_session(api=True) is session
+    assert session_pool.get_session(api=False) is not session
+    assert session.get_adapter(API_URL)._pool_maxsize == constants.DEFAULT_POOL_SIZE
+
+    other_session = run_in_thread(session_pool.get_session)
+    assert other_session is not session
+    assert other_session.get_adapter(API_URL) is session.get_adapter(API_URL)
+
+
+def test_use_pool_size():
+    """Test that the threads using another pool size share pools separate from the others."""
+    session_pool = sessions.SessionPool(pool_size=3)
+
+    def get_resized_session():
+        sessions.use_pool_size(8)
+        return session_pool.get_session()
+
+    resized_sessions = [run_in_thread(get_resized_session) for _ in range(2)]
+    resized_adapter = resized_sessions[0].get_adapter(API_URL)
+    assert resized_adapter._pool_maxsize == 8
+    assert resized_sessions[1].get_adapter(API_URL) is resized_adapter
+    assert session_pool.get_session().get_adapter(API_URL)._pool_maxsize == 3
+    session_pool.close()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the snapshot module."""
+
+import pytest
+
+from braincube_connector import snapshot
+from tests.mock import bc_obj, mock_client
+
+MB_PATH = "braincube/bcname/braincube/mb/1/extended"
+
+
+@pytest.fixture
+def mock_server(mocker):
+    """Mock the metadata requests of a memory base with one entity of each type."""
+    mocker.patch.dict("braincube_connector.instances.instances", {"parameter_set": {}})
+
+    def mock_request_ws(path, **kwargs):
+        if "?" in path:
+            first_page = "offset=0&" in path
+            return {
+                "items": (
+                    [{"bcId": "10", "name": "entity", "standard": "entity"}] if first_page else []
+                )
+            }
+        return {"bcId": path.split("/")[-2], "name": path, "standard": path}
+
+    return mocker.patch("braincube_connector.client.request_ws", side_effect=mock_request_ws)
+
+
+def test_export_load_snapshot(bc_obj, mock_server, tmp_path):
+    file_path = str(tmp_path / "snapshot.json.gz")
+    snapshot.export_snapshot(bc_obj, file_path, mb_bcids=[1])
+    mock_server.reset_mock()
+    assert snapshot.load_snapshot(file_path)
+    mock_server.assert_called_once_with(MB_PATH, braincube_name="bcname")
+    mock_server.reset_mock()
+    mb = bc_obj.get_memory_base(1)
+    assert [var.get_bcid() for var in mb.get_variable_list()] == ["10"]
+    assert mb.get_variable(10).get_name() == "braincube/bcname/braincube/mb/1/variables/10/extended"
+    mb.get_job(10)
+    mb.get_datagroup_list()
+    mb.get_event(10)
+    mock_server.assert_not_called()
+    snapshot.clear_snapshot()
+    bc_obj.get_memory_base(1)
+    mock_server.assert_called_once()
+
+
+def test_load_outdated_snapshot(bc_obj, mock_server, mocker, tmp_path):
+    file_path = str(tmp_path / "snapshot.json.gz")
+    snapshot.export_snapshot(bc_obj, file_path, mb_bcids=[1])
+    assert not snapshot.load_snapshot(file_path, max_age=-1)
+    mocker.patch("braincube_connector.client.request_ws", return_value={"bcId": "1"})
+    assert not snapshot.load_snapshot(file_path)
+    assert snapshot.load_snapshot(file_path, check=False)
+
+
+def test_get_or_request(mocker):
+    mocker.patch.dict(
+        "braincube_connector.instances.instances",
+        {snapshot.INSTANCE_KEY: {("bc", "path"): "snapshot"}},
+    )
+    request = mocker.Mock(return_value="server")
+    assert snapshot.get_or_request("bc", "path", request) == "snapshot"
+    assert snapshot.get_or_request("bc", "other", request) == "server"
+    assert not snapshot.is_recording()
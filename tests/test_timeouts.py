@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the timeouts module."""
+
+import pytest
+import requests
+
+from braincube_connector import timeouts
+
+
+def test_deadline(mocker):
+    clock = mocker.patch("braincube_connector.timeouts.time.monotonic", return_value=100)
+    deadline = timeouts.Deadline(5)
+    clock.return_value = 103
+    assert deadline.remaining() == 2
+    deadline.check()
+    clock.return_value = 106
+    assert deadline.remaining() == 0
+    with pytest.raises(timeouts.DeadlineExceededError):
+        deadline.check()
+
+
+def test_deadline_error_is_a_timeout():
+    assert issubclass(timeouts.DeadlineExceededError, requests.exceptions.Timeout)
+
+
+def test_deadline_scope():
+    assert timeouts.get_current_deadline() is None
+    with timeouts.deadline_scope() as no_deadline:
+        assert no_deadline is None
+    with timeouts.deadline_scope(10) as outer:
+        assert timeouts.get_current_deadline() is outer
+        with timeouts.deadline_scope() as same:
+            assert same is outer
+        with timeouts.deadline_scope(1000) as longer:
+            assert longer is outer
+        with timeouts.deadline_scope(1) as shorter:
+            assert shorter is not outer
+            assert timeouts.get_current_deadline() is shorter
+        assert timeouts.get_current_deadline() is outer
+    assert timeouts.get_current_deadline() is None
+
+
+def test_deadline_scope_with_deadline():
+    deadline = timeouts.Deadline(10)
+    with timeouts.deadline_scope(deadline) as current:
+        assert current is deadline
+
+
+def test_get_request_timeouts(mocker):
+    assert timeouts.get_request_timeouts((5, 60)) == (5, 60)
+    clock = mocker.patch("braincube_connector.timeouts.time.monotonic", return_value=0)
+    with timeouts.deadline_scope(10):
+        assert timeouts.get_request_timeouts((5, 60)) == (5, 10)
+        clock.return_value = 8
+        assert timeouts.get_request_timeouts((5, 60)) == (2, 2)
+        clock.return_value = 11
+        with pytest.raises(timeouts.DeadlineExceededError):
+            timeouts.get_request_timeouts((5, 60))
+
+
+def test_to_deadline():
+    assert timeouts.to_deadline(None) is None
+    deadline = timeouts.Deadline(5)
+    assert timeouts.to_deadline(deadline) is deadline
+    assert timeouts.to_deadline(5).remaining() <= 5
+
+
+def test_iter_within_deadline():
+    def produce():
+        for index in range(2):
+            yield index, timeouts.get_current_deadline()
+
+    deadline = timeouts.Deadline(5)
+    for index, (produced, produced_deadline) in enumerate(
+        timeouts.iter_within_deadline(produce(), deadline)
+    ):
+        assert produced == index
+        assert produced_deadline is deadline
+        assert timeouts.get_current_deadline() is None